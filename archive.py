@@ -0,0 +1,159 @@
+import sqlite3
+import threading
+import hashlib
+import json
+import time
+import re
+import os
+
+from settings import SCRATCH_PATH
+
+ARCHIVE_PATH = os.path.join(SCRATCH_PATH, 'archive.sqlite')
+HASH_BLOCK = 1024 * 1024
+
+AUDIO_EXTS = {'.mp3', '.m4a', '.opus', '.ogg', '.aac', '.flac', '.wav'}
+VIDEO_EXTS = {'.mp4', '.mkv', '.webm', '.mov', '.avi', '.flv'}
+
+# "Title [dQw4w9WgXcQ].mp4", yt-dlp's default naming
+ID_IN_NAME_RE = re.compile(r'[\[(]([A-Za-z0-9_-]{11})[\])]$')
+
+def mediaKind(is_audio, audio_format=None):
+    # A converted copy (e.g. MP3) is a different download than the original stream
+    if not is_audio:
+        return 'video'
+    return f'audio:{audio_format}' if audio_format else 'audio'
+
+def fileHash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class DownloadArchive:
+    # Finished downloads by (video id, audio/video). All rows are kept in a
+    # dict as well, so the check before a download is a lookup plus one stat()
+    # even with tens of thousands of entries; SQLite only persists them.
+    def __init__(self, path=ARCHIVE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS downloads (
+                video_id TEXT NOT NULL,
+                media TEXT NOT NULL,
+                format_id TEXT,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                sha256 TEXT,
+                finished_at REAL NOT NULL,
+                PRIMARY KEY (video_id, media)
+            )
+        """)
+        self._db.execute("CREATE TABLE IF NOT EXISTS scanned (folder TEXT PRIMARY KEY, scanned_at REAL NOT NULL)")
+        self._db.commit()
+        self.entries = {}
+        for row in self._db.execute("SELECT video_id, media, format_id, path, size, mtime, sha256 FROM downloads"):
+            self.entries[(row[0], row[1])] = {'format_id': row[2], 'path': row[3], 'size': row[4], 'mtime': row[5], 'sha256': row[6]}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find(self, video_id, is_audio=False, format_id=None, audio_format=None):
+        # The entry if its file is still there; format_id None accepts any format
+        if not video_id:
+            return None
+        key = (video_id, mediaKind(is_audio, audio_format))
+        entry = self.entries.get(key)
+        if entry is None or (format_id and entry['format_id'] and entry['format_id'] != format_id):
+            return None
+        try:
+            present = os.path.getsize(entry['path']) == entry['size']
+        except OSError:
+            present = False
+        if not present:
+            # Moved, deleted or replaced since: download it again
+            self.remove(video_id, is_audio, audio_format)
+            return None
+        self.hits += 1
+        return entry
+
+    def record(self, video_id, is_audio, format_id, path, audio_format=None):
+        # Hashes the file, so call it off the GUI thread
+        if not video_id or not path or not os.path.isfile(path):
+            return None
+        media = mediaKind(is_audio, audio_format)
+        stat = os.stat(path)
+        previous = self.entries.get((video_id, media))
+        if previous and previous['path'] == path and previous['size'] == stat.st_size and previous['mtime'] == stat.st_mtime:
+            # Skipped as a duplicate, nothing changed
+            return previous
+        entry = {'format_id': format_id, 'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': fileHash(path)}
+        with self._lock:
+            self.entries[(video_id, media)] = entry
+            self._db.execute(
+                "INSERT OR REPLACE INTO downloads VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (video_id, media, format_id, path, entry['size'], entry['mtime'], entry['sha256'], time.time())
+            )
+            self._db.commit()
+        return entry
+
+    def remove(self, video_id, is_audio=False, audio_format=None):
+        media = mediaKind(is_audio, audio_format)
+        with self._lock:
+            self.entries.pop((video_id, media), None)
+            self._db.execute("DELETE FROM downloads WHERE video_id = ? AND media = ?", (video_id, media))
+            self._db.commit()
+
+    def isScanned(self, folder):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM scanned WHERE folder = ?", (os.path.abspath(folder),)).fetchone() is not None
+
+    def scan(self, folder, titles=None, cancelled=None):
+        # Indexes media files already in folder (recursively). The video id
+        # comes from "[id]" in the name, a .info.json next to the file, or
+        # titles: {filename without extension: video id}, e.g. from the info cache.
+        # Returns the number of files added.
+        titles = titles or {}
+        added = 0
+        for root, _, files in os.walk(folder):
+            for name in files:
+                if cancelled and cancelled():
+                    return added
+                stem, ext = os.path.splitext(name)
+                ext = ext.lower()
+                if ext not in AUDIO_EXTS and ext not in VIDEO_EXTS:
+                    continue
+                path = os.path.join(root, name)
+                video_id = self._identify(root, stem, titles)
+                is_audio = ext in AUDIO_EXTS
+                # MP3s are conversions, everything else is kept as the original stream
+                audio_format = 'mp3' if ext == '.mp3' else None
+                if video_id and not self.find(video_id, is_audio, None, audio_format):
+                    try:
+                        if self.record(video_id, is_audio, None, path, audio_format):
+                            added += 1
+                    except OSError:
+                        pass
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO scanned VALUES (?, ?)", (os.path.abspath(folder), time.time()))
+            self._db.commit()
+        return added
+
+    def _identify(self, root, stem, titles):
+        match = ID_IN_NAME_RE.search(stem)
+        if match:
+            return match.group(1)
+        try:
+            with open(os.path.join(root, stem + '.info.json'), 'r', encoding='utf-8') as f:
+                return json.load(f).get('id')
+        except (OSError, ValueError):
+            pass
+        return titles.get(stem)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,198 @@
+import threading
+import time
+import re
+
+REDISTRIBUTE_INTERVAL = 1.0 # seconds between share recalculations while jobs run
+BURST_SECONDS = 0.5         # how far ahead of its rate a job may get
+MAX_SLEEP = 0.25            # re-check the allotment at least this often while waiting
+RATE_SMOOTHING = 0.3        # weight of the newest sample in the measured rate
+IDLE_FACTOR = 0.8           # a job using less than this share of its allotment is limited elsewhere
+
+SCHEDULE_RE = re.compile(r'^\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*=\s*(\d+)\s*$')
+
+def parseSchedule(text):
+    # "09:00-18:00=500, 22:00-07:00=0" -> [(540, 1080, 500), (1320, 420, 0)], limits in KB/s
+    windows = []
+    for part in (text or '').replace(';', ',').split(','):
+        if not part.strip():
+            continue
+        match = SCHEDULE_RE.match(part)
+        if match is None:
+            raise ValueError(f"Invalid schedule entry: {part.strip()}")
+        h1, m1, h2, m2, limit = (int(g) for g in match.groups())
+        if h1 > 23 or h2 > 23 or m1 > 59 or m2 > 59:
+            raise ValueError(f"Invalid time in schedule entry: {part.strip()}")
+        windows.append((h1 * 60 + m1, h2 * 60 + m2, limit))
+    return windows
+
+def formatSchedule(windows):
+    return ", ".join(f"{s // 60:02d}:{s % 60:02d}-{e // 60:02d}:{e % 60:02d}={limit}" for s, e, limit in windows)
+
+class JobThrottle:
+    # Token bucket for one download, driven from its progress hook so it
+    # works the same for plain HTTP and fragmented (DASH/HLS) downloads
+    def __init__(self, manager, key, weight=1):
+        self.manager = manager
+        self.key = key
+        self.weight = max(1, weight)
+        self.allotted = None # bytes/s, None = unlimited
+        self.rate = 0.0      # measured bytes/s
+        self.throttled = False # had to wait since the last redistribution
+        self.released = False # the job is stopping, never wait again
+        self._tokens = 0.0
+        self._lastRefill = time.monotonic()
+        self._lastSample = None
+        self._sampleBytes = 0
+        self._lastBytes = {}
+
+    def hook(self, d):
+        if d.get('status') != 'downloading':
+            return
+        name = d.get('tmpfilename') or d.get('filename')
+        downloaded = d.get('downloaded_bytes') or 0
+        previous = self._lastBytes.get(name, 0)
+        self._lastBytes[name] = downloaded
+        # Separate counters per file (video, audio); a count going backwards is a retry
+        self.consume(max(downloaded - previous, 0))
+
+    def consume(self, count):
+        now = time.monotonic()
+        self.manager.tick(now)
+        self._wait(count, now)
+        # Sampled after the wait so bursts are averaged over the time they cost
+        self._sample(count, time.monotonic())
+
+    def release(self):
+        # From another thread: ends a wait in progress, so a stop isn't held up
+        # while the job sleeps off its chunk under a low cap
+        self.released = True
+
+    def _wait(self, count, now):
+        while True:
+            rate = self.allotted
+            if rate is None or self.released:
+                self._tokens = 0.0
+                self._lastRefill = now
+                return
+            self._tokens = min(self._tokens + (now - self._lastRefill) * rate, rate * BURST_SECONDS)
+            self._lastRefill = now
+            if count:
+                self._tokens -= count
+                count = 0
+            if self._tokens >= 0:
+                return
+            # Sleep in short steps so a new allotment (another job finished,
+            # the schedule changed) takes effect mid-wait
+            self.throttled = True
+            time.sleep(min(-self._tokens / max(rate, 1), MAX_SLEEP))
+            now = time.monotonic()
+
+    def _sample(self, count, now):
+        if self._lastSample is None:
+            # Measure from the first chunk, not from when the job was queued
+            self._lastSample = now
+            return
+        self._sampleBytes += count
+        elapsed = now - self._lastSample
+        if elapsed >= REDISTRIBUTE_INTERVAL / 2:
+            sample = self._sampleBytes / elapsed
+            self.rate = sample if not self.rate else self.rate + (sample - self.rate) * RATE_SMOOTHING
+            self._sampleBytes = 0
+            self._lastSample = now
+
+class BandwidthManager:
+    # Splits one process-wide rate cap between running downloads in
+    # proportion to their weights. Jobs that can't use their share (slow
+    # server, finishing up) hand the rest to the others.
+    def __init__(self, total_rate=0, schedule=None):
+        self.totalRate = total_rate # bytes/s, 0 = unlimited
+        self.schedule = list(schedule or [])
+        self._jobs = {}
+        self._lastRedistribute = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, total_rate=None, schedule=None):
+        with self._lock:
+            if total_rate is not None:
+                self.totalRate = max(0, int(total_rate))
+            if schedule is not None:
+                self.schedule = list(schedule)
+            self._redistribute()
+
+    def currentLimit(self, now=None):
+        # The first schedule window containing the current time wins over the global cap
+        now = now or time.localtime()
+        minute = now.tm_hour * 60 + now.tm_min
+        for start, end, limit in self.schedule:
+            inside = start <= minute < end if start <= end else minute >= start or minute < end
+            if inside:
+                return limit * 1024
+        return self.totalRate
+
+    def limited(self):
+        # Without a cap or a schedule no throttle ever waits
+        return bool(self.totalRate or self.schedule)
+
+    def register(self, key, weight=1):
+        throttle = JobThrottle(self, key, weight)
+        with self._lock:
+            self._jobs[key] = throttle
+            self._redistribute()
+        return throttle
+
+    def unregister(self, key):
+        with self._lock:
+            if self._jobs.pop(key, None) is not None:
+                self._redistribute()
+
+    def setWeight(self, key, weight):
+        with self._lock:
+            throttle = self._jobs.get(key)
+            if throttle is not None:
+                throttle.weight = max(1, weight)
+                self._redistribute()
+
+    def tick(self, now):
+        if now - self._lastRedistribute < REDISTRIBUTE_INTERVAL:
+            return
+        with self._lock:
+            self._redistribute(now)
+
+    def _redistribute(self, now=None):
+        self._lastRedistribute = now or time.monotonic()
+        limit = self.currentLimit()
+        jobs = list(self._jobs.values())
+        if not limit:
+            for throttle in jobs:
+                throttle.allotted = None
+            return
+
+        # Weighted water-filling: a job that isn't using its share keeps a
+        # little headroom above its actual rate, the rest goes to the others.
+        # A job we had to hold back is using its share by definition.
+        remaining = float(limit)
+        pending = jobs
+        idle = {t for t in jobs if not t.throttled and t.allotted and t.rate and t.rate < t.allotted * IDLE_FACTOR}
+        for throttle in jobs:
+            throttle.throttled = False
+        while pending:
+            weights = sum(t.weight for t in pending)
+            limited = [t for t in pending if t in idle and t.rate * 1.25 < remaining * t.weight / weights]
+            if not limited:
+                for throttle in pending:
+                    throttle.allotted = remaining * throttle.weight / weights
+                return
+            for throttle in limited:
+                throttle.allotted = throttle.rate * 1.25
+                remaining -= throttle.allotted
+            pending = [t for t in pending if t not in limited]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "limit": self.currentLimit(),
+                "jobs": {
+                    key: {"weight": t.weight, "allotted": t.allotted, "actual": t.rate}
+                    for key, t in self._jobs.items()
+                }
+            }
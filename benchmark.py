@@ -0,0 +1,445 @@
+# Offline benchmarks: recorded extractor fixtures and a local HTTP server
+# standing in for YouTube's CDN, no network or display needed.
+#   python benchmark.py                          all scenarios
+#   python benchmark.py formats hooks -o run.json
+#   python benchmark.py --compare run.json       same scenarios, diffed against a saved run
+#   python benchmark.py range --size 32 --rate 2048 --connections 1 2 4 8
+#   python benchmark.py --record-video URL       refresh fixtures/video.json (needs network)
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import argparse
+import platform
+import tempfile
+import threading
+import copy
+import json
+import time
+import sys
+import os
+import re
+
+RANGE_RE = re.compile(r'bytes=(\d+)-(\d*)')
+SEND_BLOCK = 64 * 1024
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SCENARIOS = ('formats', 'search', 'hooks', 'range', 'concurrent', 'thumbnails')
+
+# Fields --compare diffs, lower is better for all but throughput
+METRICS = {'per_call_us': False, 'seconds': False, 'per_item_ms': False, 'throughput': True}
+
+class ThrottledRangeHandler(BaseHTTPRequestHandler):
+    # Serves server.payloads (path -> bytes, or one payload for every path)
+    # with Range support. Each response waits server.latency seconds first
+    # and each connection is capped at server.rate bytes/s, like a CDN
+    # throttling single connections.
+    protocol_version = 'HTTP/1.1'
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionError:
+            # Clients drop connections when a download is cancelled
+            pass
+
+    def do_GET(self):
+        payloads = self.server.payloads
+        payload = payloads.get(self.path.split('?')[0]) if isinstance(payloads, dict) else payloads
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if payload is None:
+            self.send_error(404)
+            return
+
+        start, end = 0, len(payload) - 1
+        match = RANGE_RE.match(self.headers.get('Range') or '')
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or end), end)
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(payload)}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+        began = time.monotonic()
+        sent = 0
+        try:
+            for offset in range(start, end + 1, SEND_BLOCK):
+                block = payload[offset:min(offset + SEND_BLOCK, end + 1)]
+                self.wfile.write(block)
+                sent += len(block)
+                if self.server.rate:
+                    delay = sent / self.server.rate - (time.monotonic() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+        except ConnectionError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def startServer(payloads, rate=0, latency=0.0):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottledRangeHandler)
+    server.daemon_threads = True
+    server.payloads = payloads
+    server.rate = rate
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def serverURL(server, path):
+    return f'http://127.0.0.1:{server.server_address[1]}{path}'
+
+class QuietLogger:
+    def debug(self, msg):
+        pass
+
+    info = warning = error = debug
+
+def loadFixture(name):
+    with open(os.path.join(FIXTURE_DIR, f'{name}.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+class FixtureYDL:
+    # Stands in for a pooled YoutubeDL: extract_info answers from a
+    # recorded info JSON, so only our own processing is timed
+    def __init__(self, info):
+        self.info = info
+
+    def extract_info(self, url, download=False, process=True):
+        info = copy.deepcopy(self.info)
+        if not process and 'entries' in info:
+            # Unprocessed results hand out entries lazily, like a search does
+            info['entries'] = iter(info['entries'])
+        return info
+
+    def close(self):
+        pass
+
+@contextmanager
+def fixtureExtractors(**profiles):
+    # profile name -> fixture, e.g. info='video'
+    import utils
+    utils.ydlPool.close()
+    for profile, name in profiles.items():
+        utils.ydlPool.release(profile, FixtureYDL(loadFixture(name)))
+    try:
+        yield
+    finally:
+        utils.ydlPool.close()
+
+@contextmanager
+def scratchThumbnails():
+    # Keep the app's thumbnail cache out of it
+    import utils
+    saved = utils.THUMB_PATH
+    with tempfile.TemporaryDirectory() as folder:
+        utils.THUMB_PATH = folder
+        try:
+            yield folder
+        finally:
+            utils.THUMB_PATH = saved
+
+def perCall(fn, iterations, rounds=3):
+    # Best of a few rounds, in microseconds per call
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best / iterations * 1e6, 2)
+
+def benchFormats(iterations=200):
+    import utils
+    info = loadFixture('video')
+    table, qualities, best_audio = utils.buildFormatTable(info['formats'], info['duration'])
+    results = [{
+        'benchmark': 'build_format_table',
+        'case': f"formats={len(info['formats'])}",
+        'per_call_us': perCall(lambda: utils.buildFormatTable(info['formats'], info['duration']), iterations),
+        'rows': len(table),
+        'qualities': [q['format_id'] for q in qualities],
+        'best_audio': (best_audio or {}).get('format_id'),
+    }]
+    with fixtureExtractors(info='video'):
+        # Includes sanitize_info, which keeps raw_info for the download
+        results.append({
+            'benchmark': 'get_video_info',
+            'case': 'uncached',
+            'per_call_us': perCall(lambda: utils.getVideoInfo(info['webpage_url']), max(1, iterations // 10)),
+        })
+    return results
+
+def benchSearch(iterations=50):
+    import utils
+    search = loadFixture('search')
+    playlist = loadFixture('playlist')
+
+    def firstPage():
+        with fixtureExtractors(search='search'):
+            session = utils.SearchSession('fixture query')
+            entries = list(session.nextPage())
+            session.close()
+        return entries
+
+    def listing():
+        with fixtureExtractors(playlist='playlist'):
+            return utils.getPlaylistEntries(playlist['webpage_url'])
+
+    return [{
+        'benchmark': 'search_page',
+        'case': f'page_size={utils.SEARCH_PAGE_SIZE}',
+        'per_call_us': perCall(firstPage, iterations),
+        'results': len(firstPage()),
+        'fixture_entries': len(search['entries']),
+    }, {
+        'benchmark': 'playlist_listing',
+        'case': f"entries={len(playlist['entries'])}",
+        'per_call_us': perCall(listing, iterations),
+        'results': len(listing()['entries']),
+    }]
+
+def benchHooks(calls=100000, chunk=16 * 1024):
+    # The hook chain DownloadThread installs: throttle (unlimited here) then
+    # the ProgressReporter, fed the way yt-dlp reports every chunk
+    import progress
+    from bandwidth import BandwidthManager
+    total = calls * chunk
+    results = []
+    for case in ('reporter', 'throttle+reporter'):
+        emitted = []
+        reporter = progress.ProgressReporter(emitted.append, lambda text: None)
+        hooks = [reporter.hook]
+        if case == 'throttle+reporter':
+            hooks.insert(0, BandwidthManager().register('bench').hook)
+        started = time.perf_counter()
+        for i in range(1, calls + 1):
+            d = {'status': 'downloading', 'downloaded_bytes': i * chunk, 'total_bytes': total, 'speed': 1e7, 'eta': 1,
+                 'filename': 'bench.mp4', 'tmpfilename': 'bench.mp4.part'}
+            for hook in hooks:
+                hook(d)
+        elapsed = time.perf_counter() - started
+        results.append({
+            'benchmark': 'progress_hooks',
+            'case': case,
+            'calls': calls,
+            'per_call_us': round(elapsed / calls * 1e6, 3),
+            'emitted': len(emitted),
+        })
+    return results
+
+def benchRange(size_mb=32, rate_kb=2048, connections=(1, 2, 4, 8)):
+    # Single connection (yt-dlp's HttpFD, the default path) vs. ParallelRangeFD
+    import rangedownload
+    payload = os.urandom(size_mb * 1024 * 1024)
+    server = startServer(payload, rate_kb * 1024)
+    url = serverURL(server, '/video.mp4')
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            for count in connections:
+                target = os.path.join(folder, f'c{count}.mp4')
+                info = {
+                    'id': 'bench', 'title': 'bench', 'ext': 'mp4', 'url': url,
+                    'protocol': 'http', 'filesize': len(payload), 'http_headers': {},
+                }
+                params = {'logger': QuietLogger(), 'parallel_connections': count, 'continuedl': False}
+                started = time.perf_counter()
+                with rangedownload.RangedYoutubeDL(params) as ydl:
+                    ok, _ = ydl.dl(target, info)
+                elapsed = time.perf_counter() - started
+                with open(target, 'rb') as f:
+                    intact = ok and f.read() == payload
+                results.append({
+                    'benchmark': 'range_download',
+                    'case': f'connections={count}',
+                    'connections': count,
+                    'size_bytes': len(payload),
+                    'per_connection_rate': rate_kb * 1024,
+                    'seconds': round(elapsed, 3),
+                    'throughput': round(len(payload) / elapsed),
+                    'intact': intact,
+                })
+                os.remove(target)
+    finally:
+        server.shutdown()
+    return results
+
+def syntheticVideo(server, job, video_id='137', audio_id='140'):
+    # The fixture's info with the chosen video/audio formats pointed at the local server
+    info = loadFixture('video')
+    formats = []
+    for f in info['formats']:
+        if f['format_id'] in (video_id, audio_id):
+            f = dict(f, url=serverURL(server, f"/{f['format_id']}.{f['ext']}"), filesize=len(server.payloads[f"/{f['format_id']}.{f['ext']}"]))
+            f.pop('downloader_options', None)
+            formats.append(f)
+    return dict(info, id=f'bench{job}', formats=formats)
+
+def ffmpegAvailable():
+    from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+    return FFmpegPostProcessor().available
+
+def benchConcurrent(size_mb=8, rate_kb=4096, latency_ms=50, jobs=(1, 2, 4)):
+    # Whole downloadVideo calls (format selection, video + audio streams)
+    # running side by side like the download queue's workers
+    import utils
+    video = os.urandom(size_mb * 1024 * 1024)
+    audio = os.urandom(max(1, size_mb // 8) * 1024 * 1024)
+    server = startServer({'/137.mp4': video, '/140.m4a': audio}, rate_kb * 1024, latency_ms / 1000)
+    # yt-dlp refuses to start a merged download without ffmpeg, even though
+    # the merge itself is deferred; fall back to the video stream on its own
+    merged = ffmpegAvailable()
+    size = len(video) + len(audio) if merged else len(video)
+    results = []
+    try:
+        for count in jobs:
+            with tempfile.TemporaryDirectory() as folder:
+                def job(i):
+                    info = syntheticVideo(server, i)
+                    # Post-processing is deferred and dropped: this measures the transfers
+                    return utils.downloadVideo(info['webpage_url'], {'format_id': '137'}, lambda d: None, QuietLogger(),
+                                               not merged, f'job{i}', folder, info, None, 1, [])
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=count) as pool:
+                    outcomes = list(pool.map(job, range(count)))
+                elapsed = time.perf_counter() - started
+            succeeded = sum(1 for ok, _ in outcomes if ok)
+            results.append({
+                'benchmark': 'concurrent_downloads',
+                'case': f'jobs={count}',
+                'jobs': count,
+                'streams': 2 if merged else 1,
+                'succeeded': succeeded,
+                'seconds': round(elapsed, 3),
+                'throughput': round(succeeded * size / elapsed),
+            })
+    finally:
+        server.shutdown()
+    return results
+
+def benchThumbnails(count=60, latency_ms=40, workers=6):
+    # Same worker count as ThumbnailLoader; cold fetches, then cache hits
+    import utils
+    payload = os.urandom(24 * 1024) # not decoded here, only fetched and cached
+    server = startServer(payload, 0, latency_ms / 1000)
+    urls = [serverURL(server, f'/vi/thumb{i}/hqdefault.jpg') for i in range(count)]
+    results = []
+    try:
+        with scratchThumbnails():
+            for case in ('cold', 'warm'):
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    fetched = sum(1 for ok, _ in pool.map(utils.downloadThumbnail, urls) if ok)
+                elapsed = time.perf_counter() - started
+                results.append({
+                    'benchmark': 'thumbnails',
+                    'case': case,
+                    'count': count,
+                    'fetched': fetched,
+                    'latency_ms': latency_ms,
+                    'seconds': round(elapsed, 3),
+                    'per_item_ms': round(elapsed / count * 1000, 2),
+                })
+    finally:
+        server.shutdown()
+    return results
+
+def record(kind, target):
+    # Refresh a fixture from YouTube with the same options the app uses
+    import utils
+    if kind == 'video':
+        with utils.ydlPool.checkout('info') as ydl:
+            info = ydl.sanitize_info(ydl.extract_info(target, download=False))
+    elif kind == 'search':
+        with utils.ydlPool.checkout('search') as ydl:
+            info = ydl.extract_info(f"ytsearch60:{target}", download=False, process=False)
+            info['entries'] = list(info.get('entries') or [])
+            info = ydl.sanitize_info(info)
+    else:
+        with utils.ydlPool.checkout('playlist') as ydl:
+            info = ydl.sanitize_info(ydl.extract_info(utils.playlistURL(target), download=False))
+    path = os.path.join(FIXTURE_DIR, f'{kind}.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=1)
+    return path
+
+def compare(results, baseline):
+    # One line per metric that exists in both runs
+    old = {(r['benchmark'], r.get('case')): r for r in baseline.get('results', [])}
+    lines = []
+    for r in results:
+        before = old.get((r['benchmark'], r.get('case')))
+        if before is None:
+            continue
+        for metric, higher_better in METRICS.items():
+            if r.get(metric) is None or not before.get(metric):
+                continue
+            change = (r[metric] - before[metric]) / before[metric] * 100
+            better = change > 0 if higher_better else change < 0
+            lines.append(f"{r['benchmark']:<22}{r.get('case') or '':<22}{metric:<14}{before[metric]:>14}{r[metric]:>14}{change:>+9.1f}% {'better' if better else 'worse'}")
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CRTube offline benchmarks")
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("-o", "--output", help="write the run as JSON to this file")
+    parser.add_argument("--compare", help="JSON file from an earlier run to diff against")
+    parser.add_argument("--size", type=int, default=32, help="range download payload size in MB")
+    parser.add_argument("--rate", type=int, default=2048, help="per-connection server cap in KB/s (0 = none)")
+    parser.add_argument("--latency", type=int, default=50, help="server latency per request in ms (concurrent, thumbnails)")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--record-video", metavar="URL", help="record fixtures/video.json from YouTube")
+    parser.add_argument("--record-search", metavar="QUERY", help="record fixtures/search.json from YouTube")
+    parser.add_argument("--record-playlist", metavar="URL", help="record fixtures/playlist.json from YouTube")
+    args = parser.parse_args(argv)
+    unknown = [s for s in args.scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    recordings = [(kind, target) for kind, target in (('video', args.record_video), ('search', args.record_search), ('playlist', args.record_playlist)) if target]
+    if recordings:
+        for kind, target in recordings:
+            print(f"Recorded {record(kind, target)}")
+        return 0
+
+    runners = {
+        'formats': lambda: benchFormats(),
+        'search': lambda: benchSearch(),
+        'hooks': lambda: benchHooks(),
+        'range': lambda: benchRange(args.size, args.rate, args.connections),
+        'concurrent': lambda: benchConcurrent(latency_ms=args.latency),
+        'thumbnails': lambda: benchThumbnails(latency_ms=args.latency),
+    }
+    results = []
+    for scenario in args.scenarios or SCENARIOS:
+        for result in runners[scenario]():
+            print(json.dumps(result))
+            results.append(result)
+
+    import yt_dlp
+    run = {
+        'meta': {
+            'time': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'yt_dlp': yt_dlp.version.__version__,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=1)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            for line in compare(results, json.load(f)):
+                print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+# Regenerates the ui_*.py classes the windows import.
+# Run after editing any .ui file in Qt Designer:  python buildui.py
+from PyQt6.uic import compileUi
+import os
+
+UI_FILES = ['mainwindow.ui', 'downloadwindow.ui', 'downloadswindow.ui', 'settingswindow.ui']
+
+def build():
+    # Relative paths keep the generated header free of local directories
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    for name in UI_FILES:
+        target = 'ui_' + name.replace('.ui', '.py')
+        with open(name, 'r', encoding='utf-8') as src, open(target, 'w', encoding='utf-8') as out:
+            compileUi(src, out)
+        print(f"{name} -> {target}")
+
+if __name__ == "__main__":
+    build()
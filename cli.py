@@ -0,0 +1,181 @@
+# Headless batch downloader for machines without a display.
+# Must never import PyQt6, directly or through the modules it uses.
+from concurrent.futures import ThreadPoolExecutor, Future
+import argparse
+import threading
+import json
+import time
+import sys
+import os
+from metrics import DownloadMetrics
+from archive import DownloadArchive
+from settings import SCRATCH_PATH
+import utils
+import progress
+
+class JsonLinesReporter:
+    # One JSON object per line on stdout, shared by all worker threads
+    def __init__(self, stream=sys.stdout, verbose=False):
+        self.stream = stream
+        self.verbose = verbose
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        record = {"event": event, "time": round(time.time(), 3), **fields}
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+def readInputs(source):
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in stream:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def runJob(job_id, item, metrics, args, reporter, finishing, archive):
+    metrics.started()
+    url = item
+    if not utils.isValidURL(item):
+        try:
+            results = utils.search(item, 1)
+        except Exception as e:
+            reporter.emit("failed", job=job_id, input=item, error=str(e))
+            return False
+        if not results:
+            reporter.emit("failed", job=job_id, input=item, error="No search results")
+            return False
+        url = results[0]["url"]
+    elif not utils.isValidYouTubeURL(item):
+        reporter.emit("failed", job=job_id, input=item, error="Invalid URL")
+        return False
+
+    entry = archive.find(utils.videoId(url), args.audio, None, "mp3" if args.audio and args.mp3 else None) if archive is not None else None
+    if entry:
+        reporter.emit("skipped", job=job_id, input=item, url=url, path=entry["path"])
+        return True
+
+    try:
+        with metrics.phase("extract"):
+            info = utils.getVideoInfo(url)
+    except Exception as e:
+        reporter.emit("failed", job=job_id, input=item, url=url, error=str(e))
+        return False
+
+    # For audio the policy picks the format: the original stream, or MP3
+    policy = ("mp3" if args.mp3 else None) if args.audio else args.quality
+    options = utils.chooseOptions(info, args.audio, policy)
+    reporter.emit("started", job=job_id, input=item, url=url, title=info.get("title"), format_id=options.get("format_id"))
+
+    throttle = utils.bandwidthManager.register(job_id)
+
+    def on_progress(stats):
+        stats.update(allotted=throttle.allotted, rate=round(throttle.rate))
+        reporter.emit("progress", job=job_id, **{k: v for k, v in stats.items() if k not in ("filename", "tmpfilename")})
+
+    def on_log(text):
+        if reporter.verbose:
+            reporter.emit("log", job=job_id, text=text)
+
+    coalescer = progress.ProgressReporter(on_progress, on_log, interval=args.interval)
+    logger = progress.ReporterLogger(coalescer)
+
+    deferred = []
+    try:
+        success, msg = utils.downloadVideo(
+            url, options, coalescer.hook, logger, args.audio,
+            utils.safeFilename(info.get("title")) or utils.videoId(url), args.output,
+            info.get("raw_info"), throttle, args.connections, deferred, metrics, archive
+        )
+    finally:
+        utils.bandwidthManager.unregister(job_id)
+    coalescer.flush()
+
+    if success and deferred:
+        # This worker moves on to the next download while the encode runs
+        reporter.emit("processing", job=job_id, url=url)
+        return finishing.submit(finishJob, job_id, url, options, args.audio, deferred, logger, coalescer, metrics, reporter, archive)
+    if success and archive is not None:
+        utils.archiveDownload(archive, url, options, args.audio, msg)
+    return reportResult(job_id, url, success, msg, metrics, reporter)
+
+def finishJob(job_id, url, options, is_audio, deferred, logger, coalescer, metrics, reporter, archive):
+    success, msg = utils.postPool.run(deferred, logger, metrics)
+    coalescer.flush()
+    if success and archive is not None:
+        utils.archiveDownload(archive, url, options, is_audio, msg)
+    return reportResult(job_id, url, success, msg, metrics, reporter)
+
+def reportResult(job_id, url, success, msg, metrics, reporter):
+    record = metrics.record(success, job_id, None if success else msg)
+    utils.metricsRegistry.recordJob(record)
+    timing = {k: record[k] for k in ("phases", "total_seconds", "bytes", "avg_speed", "peak_speed", "retries")}
+    if success:
+        reporter.emit("done", job=job_id, url=url, path=msg, metrics=timing)
+    else:
+        reporter.emit("failed", job=job_id, url=url, error=msg, metrics=timing)
+    return success
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description="CRTube headless batch downloader")
+    parser.add_argument("input", nargs="?", default="-", help="file with one URL or search query per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", default=os.getcwd(), help="download folder")
+    parser.add_argument("-a", "--audio", action="store_true", help="download best audio instead of video")
+    parser.add_argument("--mp3", action="store_true", help="with --audio: re-encode to MP3 instead of keeping the original stream")
+    parser.add_argument("-q", "--quality", type=int, default=None, help="highest video height to pick, e.g. 720")
+    parser.add_argument("-j", "--concurrency", type=int, default=2, help="downloads running at once")
+    parser.add_argument("-c", "--connections", type=int, default=4, help="parallel connections per download (1 = off)")
+    parser.add_argument("--limit", type=int, default=0, help="total download rate in KB/s shared by all jobs (0 = unlimited)")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between progress lines per job")
+    parser.add_argument("--archive", default=None, help="index of finished downloads; videos in it are skipped (default: archive.sqlite in the scratch folder)")
+    parser.add_argument("--no-archive", action="store_true", help="download everything, don't read or update the archive")
+    parser.add_argument("--metrics-log", default=None, help="append one JSON timing record per finished job to this file")
+    parser.add_argument("--metrics-prom", default=None, help="keep a Prometheus text file of download metrics here")
+    parser.add_argument("-v", "--verbose", action="store_true", help="also emit yt-dlp log lines")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parseArgs(argv)
+    os.makedirs(args.output, exist_ok=True)
+    reporter = JsonLinesReporter(verbose=args.verbose)
+    # Every worker thread may hold a pooled YoutubeDL at once
+    utils.ydlPool.maxIdle = max(utils.ydlPool.maxIdle, args.concurrency)
+    utils.bandwidthManager.configure(args.limit * 1024)
+    utils.metricsRegistry.configure(args.metrics_prom, args.metrics_log)
+    archive_path = args.archive or os.path.join(utils.settings.get('scratch_dir', SCRATCH_PATH), 'archive.sqlite')
+    archive = None if args.no_archive else DownloadArchive(archive_path)
+    if archive is not None and not archive.isScanned(args.output):
+        # First run against this folder: index what's already in it
+        reporter.emit("archive", folder=args.output, added=archive.scan(args.output), entries=len(archive))
+
+    items = []
+    for item in readInputs(args.input):
+        if utils.isValidURL(item) and utils.isPlaylistURL(item):
+            # Playlists and channels expand into their videos
+            playlist = utils.getPlaylistEntries(item)
+            reporter.emit("playlist", input=item, title=playlist["title"], entries=len(playlist["entries"]))
+            items.extend(entry["url"] for entry in playlist["entries"])
+        else:
+            items.append(item)
+    reporter.emit("batch", jobs=len(items), concurrency=args.concurrency)
+    # Created up front so time spent waiting for a worker counts as queued
+    jobs = [(job_id, item, DownloadMetrics(item)) for job_id, item in enumerate(items, start=1)]
+
+    # Threads waiting on the post-processing pool, one per worker process
+    with ThreadPoolExecutor(max_workers=utils.postPool.workers) as finishing:
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+            results = list(pool.map(lambda job: runJob(*job, args, reporter, finishing, archive), jobs))
+        results = [r.result() if isinstance(r, Future) else r for r in results]
+    utils.postPool.shutdown()
+
+    failed = results.count(False)
+    reporter.emit("summary", jobs=len(items), succeeded=len(items) - failed, failed=failed)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
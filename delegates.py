@@ -0,0 +1,90 @@
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QColor, QFont
+import utils
+
+ROW_HEIGHT = 124
+THUMB_SLOT = QSize(160, 90)
+PADDING = 10
+
+BACKGROUND = QColor('#1A1A1F')
+HOVER = QColor('#27272F')
+TITLE_COLOR = QColor('#FF4D6D')
+TEXT_COLOR = QColor('#E5E7EB')
+
+class ResultDelegate(QStyledItemDelegate):
+    # Paints one search result the way the old result frames laid it out:
+    # title, channel, views and length, plus a thumbnail slot that is only
+    # requested once the row is actually painted (i.e. scrolled into view)
+    def __init__(self, thumbnails, parent=None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails
+        self.titleFont = QFont()
+        self.titleFont.setPointSize(12)
+        self.titleFont.setBold(True)
+        self.textFont = QFont()
+        self.textFont.setPointSize(10)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        video = index.data(Qt.ItemDataRole.UserRole) or {}
+        rect = option.rect
+        painter.save()
+
+        hovered = option.state & (QStyle.StateFlag.State_MouseOver | QStyle.StateFlag.State_Selected)
+        painter.fillRect(rect, HOVER if hovered else BACKGROUND)
+
+        thumb = QRect(rect.right() - THUMB_SLOT.width() - PADDING, rect.top() + (ROW_HEIGHT - THUMB_SLOT.height()) // 2, THUMB_SLOT.width(), THUMB_SLOT.height())
+        url = video.get('thumbnail')
+        pixmap = self.thumbnails.pixmap(url) if url else None
+        if pixmap is not None:
+            painter.setRenderHint(painter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(thumb, pixmap)
+        else:
+            painter.fillRect(thumb, HOVER if not hovered else BACKGROUND)
+            # The model repaints this row once the loader has it
+            self.thumbnails.request(url)
+
+        textWidth = thumb.left() - rect.left() - 2 * PADDING
+        painter.setFont(self.titleFont)
+        painter.setPen(TITLE_COLOR)
+        title = painter.fontMetrics().elidedText(video.get('title') or 'N/A', Qt.TextElideMode.ElideRight, textWidth)
+        painter.drawText(QRect(rect.left() + PADDING, rect.top(), textWidth, 40), Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setFont(self.textFont)
+        painter.setPen(TEXT_COLOR)
+        lines = (
+            f"Channel: {video.get('channel') or 'N/A'}",
+            utils.formatViews(video.get('views')),
+            utils.formatDuration(video.get('duration'))
+        )
+        for i, text in enumerate(lines):
+            text = painter.fontMetrics().elidedText(text, Qt.TextElideMode.ElideRight, textWidth)
+            painter.drawText(QRect(rect.left() + PADDING, rect.top() + 40 + 20 * i, textWidth, 20), Qt.AlignmentFlag.AlignVCenter, text)
+
+        painter.restore()
+
+BAR_TRACK = QColor('#27272F')
+BAR_FILL = QColor('#FF4D6D')
+BAR_HEIGHT = 8
+
+class ProgressDelegate(QStyledItemDelegate):
+    # The downloads table's progress column: a thin bar and the percentage,
+    # painted instead of a QProgressBar widget per row
+    def paint(self, painter, option, index):
+        percent = index.data(Qt.ItemDataRole.UserRole) or 0
+        rect = option.rect.adjusted(PADDING, 0, -PADDING, 0)
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, HOVER)
+
+        textWidth = painter.fontMetrics().horizontalAdvance("100%") + PADDING
+        bar = QRect(rect.left(), rect.center().y() - BAR_HEIGHT // 2, max(0, rect.width() - textWidth), BAR_HEIGHT)
+        painter.fillRect(bar, BAR_TRACK)
+        painter.fillRect(QRect(bar.left(), bar.top(), bar.width() * min(100, percent) // 100, bar.height()), BAR_FILL)
+
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(QRect(bar.right() + PADDING, rect.top(), textWidth - PADDING, rect.height()), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, f"{percent}%")
+        painter.restore()
@@ -0,0 +1,357 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+import heapq
+import itertools
+import threads
+from journal import newKey
+from jobcontrol import JobControl, DownloadStopped, PAUSE, CANCEL
+from metrics import DownloadMetrics, summaryLine
+import utils
+
+QUEUED = 'queued'
+RUNNING = 'running'
+PROCESSING = 'processing' # downloaded, waiting for or running FFmpeg
+DONE = 'done'
+FAILED = 'failed'
+PAUSED = 'paused'       # stopped with its .part files kept, out of the queue until resumed
+CANCELLED = 'cancelled'
+
+DEFAULT_MAX_WORKERS = 3
+DEFAULT_CONNECTIONS = 4 # per download, for formats fetched as byte ranges or fragments
+
+class DownloadJob:
+    # Kept small: a queue can hold hundreds of these. The extracted info
+    # (formats, captions...) stays in the info cache until the job starts.
+    def __init__(self, job_id, url, options, is_audio=False, filename=None, path=None, priority=0, batch=None, key=None, weight=1, connections=1):
+        self.id = job_id
+        self.key = key or newKey() # survives restarts, unlike the id
+        self.batch = batch
+        self.url = url
+        self.options = options
+        self.is_audio = is_audio
+        self.filename = filename
+        self.path = path
+        self.priority = priority
+        self.weight = weight # share of the bandwidth cap relative to other running jobs
+        self.connections = connections
+        self.state = QUEUED
+        self.progress = 0
+        self.result = None
+        self.thread = None
+        self.control = JobControl() # pause/cancel, kept across runs of the job
+        self.metrics = DownloadMetrics(url) # clock starts in the queue
+
+class DownloadBatch:
+    # A group of jobs (e.g. a playlist) reported as one aggregate progress
+    def __init__(self, batch_id, total, title=None):
+        self.id = batch_id
+        self.total = total
+        self.title = title
+        self.jobs = set()
+        self.progress = {}
+        self.succeeded = 0
+        self.failed = 0
+
+    def percent(self):
+        if not self.total:
+            return 100
+        finished = self.succeeded + self.failed
+        running = sum(self.progress.values())
+        return min(100, int((finished * 100 + running) / self.total))
+
+    def isFinished(self):
+        return self.succeeded + self.failed >= self.total
+
+class DownloadManager(QObject):
+    # All signals carry the job id first so one window (or panel) can route them
+    job_queued = pyqtSignal(int)
+    job_started = pyqtSignal(int)
+    job_progress = pyqtSignal(int, int)
+    job_stats = pyqtSignal(int, dict)
+    job_log = pyqtSignal(int, str)
+    job_finished = pyqtSignal(int, bool, str) # job id, success, message/path
+    state_changed = pyqtSignal(int, str)
+    batch_progress = pyqtSignal(int, int, int, int, int) # batch id, percent, succeeded, failed, total
+    batch_finished = pyqtSignal(int, int, int)           # batch id, succeeded, failed
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, parent=None, journal=None, bandwidth=None, postpool=None, metrics=None, archive=None, cache=None):
+        super().__init__(parent)
+        self.maxWorkers = max(1, int(max_workers))
+        self.journal = journal
+        self.bandwidth = bandwidth
+        self.postpool = postpool
+        self.metrics = metrics # registry finished jobs are reported to
+        self.archive = archive # finished downloads, checked before each transfer
+        self.cache = cache     # InfoCache the extracted info is read from when a job starts
+        self.connections = DEFAULT_CONNECTIONS
+        self.jobs = {}
+        self._queue = [] # heap of (-priority, sequence, job id)
+        self._running = set()
+        self.batches = {}
+        self._ids = itertools.count(1)
+        self._batchIds = itertools.count(1)
+        self._seq = itertools.count()
+
+    def setMaxWorkers(self, count):
+        self.maxWorkers = max(1, int(count))
+        # Growing the pool should pick up waiting jobs straight away
+        self._schedule()
+
+    def setConnections(self, count):
+        # Applies to jobs started from now on
+        self.connections = max(1, int(count))
+
+    def createBatch(self, total, title=None):
+        batch = DownloadBatch(next(self._batchIds), total, title)
+        self.batches[batch.id] = batch
+        return batch.id
+
+    def skipBatchEntry(self, batch_id, success=False):
+        # An entry that never became a job: its info couldn't be resolved,
+        # or (success) it was already downloaded
+        batch = self.batches.get(batch_id)
+        if batch is not None:
+            if success:
+                batch.succeeded += 1
+            else:
+                batch.failed += 1
+            self._emitBatch(batch)
+
+    def submit(self, url, options, is_audio=False, filename=None, path=None, priority=0, batch=None, key=None, weight=1, connections=None, paused=False):
+        job = DownloadJob(next(self._ids), url, options, is_audio, filename, path, priority, batch, key, weight, connections or self.connections)
+        self.jobs[job.id] = job
+        if self.journal is not None:
+            self.journal.record(job.key, url, options, is_audio, filename, path, utils.outputTemplate(filename, path))
+        if batch in self.batches:
+            self.batches[batch].jobs.add(job.id)
+        if paused:
+            # Waits for resume() instead of a slot
+            job.state = PAUSED
+            if self.journal is not None:
+                self.journal.setState(job.key, PAUSED)
+        else:
+            heapq.heappush(self._queue, (-priority, next(self._seq), job.id))
+        self.job_queued.emit(job.id)
+        self.state_changed.emit(job.id, job.state)
+        self._schedule()
+        return job.id
+
+    def pause(self, job_id):
+        # A running job stops on its next chunk and gives its slot to the
+        # next queued job once its thread is out of yt-dlp
+        job = self.jobs.get(job_id)
+        if job is None:
+            return False
+        if job.state == QUEUED:
+            self._setPaused(job)
+            return True
+        if job.state == RUNNING:
+            job.control.stop(PAUSE)
+            self.job_log.emit(job_id, "Pausing...")
+            return True
+        return False
+
+    def resume(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None or job.state != PAUSED:
+            return False
+        job.control.reset()
+        job.metrics.requeued()
+        job.state = QUEUED
+        if self.journal is not None:
+            self.journal.setState(job.key, QUEUED)
+        # A job paused while queued still has its old entry; it goes to the back now
+        self._queue = [entry for entry in self._queue if entry[2] != job.id]
+        heapq.heapify(self._queue)
+        heapq.heappush(self._queue, (-job.priority, next(self._seq), job.id))
+        self.job_log.emit(job_id, "Resumed, continuing from the partial download")
+        self.state_changed.emit(job_id, QUEUED)
+        self._schedule()
+        return True
+
+    def cancel(self, job_id, keep_parts=False):
+        # keep_parts leaves the .part files on disk, e.g. to resume them by hand
+        job = self.jobs.get(job_id)
+        if job is None:
+            return False
+        if job.state in (RUNNING, PROCESSING):
+            # Post-processing can only be cancelled while it waits for a worker
+            job.control.stop(CANCEL, keep_parts)
+            self.job_log.emit(job_id, "Cancelling...")
+            return True
+        if job.state in (QUEUED, PAUSED):
+            # Nothing running; a paused job's files are deleted right here
+            job.control.stop(CANCEL, keep_parts)
+            removed = job.control.cleanup()
+            if removed:
+                self.job_log.emit(job_id, f"Removed {removed} partial files")
+            self._onFinished(job_id, False, str(DownloadStopped(CANCEL)), CANCEL)
+            return True
+        return False
+
+    def cancelBatch(self, batch_id, keep_parts=False):
+        # Cancels every unfinished job of the batch; entries that never became
+        # jobs (still being resolved) count as failed so the batch can finish
+        batch = self.batches.get(batch_id)
+        if batch is None or batch.isFinished():
+            return False
+        for job_id in list(batch.jobs):
+            self.cancel(job_id, keep_parts)
+        unfinished = sum(1 for job_id in batch.jobs if job_id in self.jobs and self.jobs[job_id].state not in (DONE, FAILED, CANCELLED))
+        batch.failed += max(0, batch.total - batch.succeeded - batch.failed - unfinished)
+        self._emitBatch(batch)
+        return True
+
+    def _setPaused(self, job):
+        job.state = PAUSED
+        if self.journal is not None:
+            self.journal.setState(job.key, PAUSED)
+        self.job_log.emit(job.id, "Paused")
+        self.state_changed.emit(job.id, PAUSED)
+
+    def setWeight(self, job_id, weight):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        job.weight = weight
+        if job.state == RUNNING and self.bandwidth is not None:
+            self.bandwidth.setWeight(job.key, weight)
+
+    def job(self, job_id):
+        return self.jobs.get(job_id)
+
+    def forget(self, job_ids):
+        # Drops finished jobs, e.g. once the downloads window has cleared them
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if job is not None and job.state in (DONE, FAILED, CANCELLED) and (job.thread is None or job.thread.isFinished()):
+                del self.jobs[job_id]
+
+    def queuedCount(self):
+        # The heap still holds entries of jobs paused or cancelled while queued
+        return len({job_id for _, _, job_id in self._queue if job_id in self.jobs and self.jobs[job_id].state == QUEUED})
+
+    def runningCount(self):
+        return len(self._running)
+
+    def _schedule(self):
+        while self._queue and len(self._running) < self.maxWorkers:
+            _, _, job_id = heapq.heappop(self._queue)
+            job = self.jobs.get(job_id)
+            if job is None or job.state != QUEUED:
+                continue
+            self._start(job)
+
+    def _start(self, job):
+        throttle = self.bandwidth.register(job.key, job.weight) if self.bandwidth is not None else None
+        job.metrics.started()
+        job.control.throttle = throttle
+        thread = threads.DownloadThread(job.url, job.options, job.is_audio, job.filename, job.path, None, throttle, job.connections, self.postpool, job.metrics, self.archive, job.control, self.cache)
+        job.thread = thread
+        job.state = RUNNING
+        self._running.add(job.id)
+
+        thread.progress.connect(lambda value, job_id=job.id: self._onProgress(job_id, value))
+        thread.stats.connect(lambda stats, job_id=job.id: self._onStats(job_id, stats))
+        thread.log.connect(lambda text, job_id=job.id: self.job_log.emit(job_id, text))
+        thread.transfer_finished.connect(lambda job_id=job.id: self._onTransferFinished(job_id))
+        thread.finished_download.connect(lambda success, msg, job_id=job.id: self._onFinished(job_id, success, msg))
+        thread.stopped.connect(lambda reason, job_id=job.id: self._onFinished(job_id, False, str(DownloadStopped(reason)), reason))
+
+        if self.journal is not None:
+            self.journal.setState(job.key, RUNNING)
+        self.job_started.emit(job.id)
+        self.state_changed.emit(job.id, RUNNING)
+        thread.start()
+
+    def resumeJournal(self):
+        # Re-queue jobs the last session didn't finish; yt-dlp picks their .part
+        # files back up. Paused jobs come back paused.
+        if self.journal is None:
+            return []
+        job_ids = []
+        live = {job.key for job in self.jobs.values()}
+        for key, record in self.journal.unfinished():
+            if key in live:
+                continue
+            job_id = self.submit(
+                record['url'], record['options'], record['is_audio'], record['filename'], record['path'], key=key,
+                paused=record['state'] == PAUSED
+            )
+            # So a cancel can still delete them
+            self.jobs[job_id].control.parts.update(record.get('part_files') or [])
+            job_ids.append(job_id)
+        return job_ids
+
+    def _onStats(self, job_id, stats):
+        job = self.jobs.get(job_id)
+        if job is not None and self.journal is not None:
+            self.journal.updateProgress(job.key, stats.get('downloaded'), stats.get('total'), stats.get('tmpfilename'))
+        self.job_stats.emit(job_id, stats)
+
+    def _onProgress(self, job_id, value):
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job.progress = value
+        self.job_progress.emit(job_id, value)
+
+        batch = self.batches.get(job.batch) if job is not None else None
+        if batch is not None:
+            batch.progress[job_id] = value
+            self._emitBatch(batch)
+
+    def _onTransferFinished(self, job_id):
+        # Only the network transfer counts against maxWorkers
+        job = self.jobs.get(job_id)
+        self._running.discard(job_id)
+        if job is not None:
+            if self.bandwidth is not None:
+                self.bandwidth.unregister(job.key)
+            job.state = PROCESSING
+            if self.journal is not None:
+                self.journal.setState(job.key, PROCESSING)
+            self.state_changed.emit(job_id, PROCESSING)
+        self._schedule()
+
+    def _onFinished(self, job_id, success, msg, stopped=None):
+        # stopped is the reason (PAUSE or CANCEL) when the thread gave up on the job;
+        # a failure that races a Pause click is still a failure
+        job = self.jobs.get(job_id)
+        self._running.discard(job_id)
+        if job is not None:
+            if self.bandwidth is not None:
+                # Its share goes back to the jobs still running
+                self.bandwidth.unregister(job.key)
+            job.control.throttle = None
+            if stopped == PAUSE:
+                # Paused: back to waiting, with its .part files and journal entry
+                self._setPaused(job)
+                self._schedule()
+                return
+            cancelled = stopped == CANCEL
+            job.state = DONE if success else CANCELLED if cancelled else FAILED
+            job.result = msg
+            if self.journal is not None:
+                self.journal.remove(job.key)
+            if not cancelled:
+                record = job.metrics.record(success, job.key, None if success else msg)
+                if self.metrics is not None:
+                    self.metrics.recordJob(record)
+                self.job_log.emit(job_id, summaryLine(record))
+            self.state_changed.emit(job_id, job.state)
+        self.job_finished.emit(job_id, success, msg)
+
+        batch = self.batches.get(job.batch) if job is not None else None
+        if batch is not None:
+            batch.progress.pop(job_id, None)
+            if success:
+                batch.succeeded += 1
+            else:
+                batch.failed += 1
+            self._emitBatch(batch)
+
+        self._schedule()
+
+    def _emitBatch(self, batch):
+        self.batch_progress.emit(batch.id, batch.percent(), batch.succeeded, batch.failed, batch.total)
+        if batch.isFinished():
+            self.batch_finished.emit(batch.id, batch.succeeded, batch.failed)
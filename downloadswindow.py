@@ -0,0 +1,108 @@
+from PyQt6.QtWidgets import QMainWindow, QHeaderView
+from PyQt6.QtCore import Qt, pyqtSignal
+from ui_downloadswindow import Ui_DownloadsWindow
+from models import DownloadTableModel
+from delegates import ProgressDelegate
+
+MAX_LOG_BLOCKS = 1000
+ROW_HEIGHT = 30
+
+class DownloadsWindow(QMainWindow, Ui_DownloadsWindow):
+    # One window for every download. Rows come from the shared
+    # DownloadTableModel; the log pane only ever holds the selected job's lines.
+    clear_finished = pyqtSignal()
+    pause_job = pyqtSignal(int)
+    resume_job = pyqtSignal(int)
+    cancel_job = pyqtSignal(int, bool) # job id, keep partial files
+    cancel_batch = pyqtSignal(int, bool) # batch id, keep partial files
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setupUi(self) # generated from downloadswindow.ui by buildui.py
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Window)
+        self.setFixedSize(900, 610)
+
+        self.model = model
+        self.selectedJob = None
+        self.jobTable.setModel(model)
+        self.jobTable.setItemDelegateForColumn(DownloadTableModel.PROGRESS, ProgressDelegate(self.jobTable))
+        self.jobTable.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        header = self.jobTable.horizontalHeader()
+        header.setSectionResizeMode(DownloadTableModel.NAME, QHeaderView.ResizeMode.Stretch)
+        for column, width in ((DownloadTableModel.PROGRESS, 180), (DownloadTableModel.SPEED, 170), (DownloadTableModel.ETA, 70), (DownloadTableModel.STATE, 100)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
+
+        self.logOutput.document().setMaximumBlockCount(MAX_LOG_BLOCKS)
+        self.jobTable.selectionModel().currentRowChanged.connect(self.onCurrentRowChanged)
+        self.model.log_appended.connect(self.onLogAppended)
+        self.model.modelReset.connect(self.onModelReset)
+        self.model.dataChanged.connect(self.onDataChanged)
+
+        self.closeButton.clicked.connect(self.close)
+        self.clearButton.clicked.connect(self.clear_finished.emit)
+        self.pauseButton.clicked.connect(lambda: self.pause_job.emit(self.selectedJob))
+        self.resumeButton.clicked.connect(lambda: self.resume_job.emit(self.selectedJob))
+        self.cancelButton.clicked.connect(lambda: self.cancel_job.emit(self.selectedJob, self.keepPartsCheck.isChecked()))
+        self.cancelBatchButton.clicked.connect(lambda: self.cancel_batch.emit(self.model.batch(self.selectedJob), self.keepPartsCheck.isChecked()))
+        self.updateButtons()
+
+    def showJob(self, job_id):
+        row = self.model.rowOf(job_id)
+        if row is not None:
+            self.jobTable.selectRow(row)
+            self.jobTable.scrollTo(self.model.index(row, 0))
+
+    def onCurrentRowChanged(self, current, previous):
+        # The only place a whole log is turned into text
+        self.selectedJob = self.model.jobId(current.row()) if current.isValid() else None
+        self.logOutput.setPlainText("\n".join(self.model.log(self.selectedJob)) if self.selectedJob is not None else "")
+        self.scrollLog()
+        self.updateButtons()
+
+    def onDataChanged(self, topLeft, bottomRight, roles=()):
+        # Progress updates don't touch the state column
+        row = self.model.rowOf(self.selectedJob)
+        if bottomRight.column() == DownloadTableModel.STATE and row is not None and topLeft.row() <= row <= bottomRight.row():
+            self.updateButtons()
+
+    def updateButtons(self):
+        # Failed resolves have negative ids, there's no job to control
+        state = self.model.state(self.selectedJob) if self.selectedJob is not None and self.selectedJob > 0 else None
+        self.pauseButton.setEnabled(state in ('queued', 'running'))
+        self.resumeButton.setEnabled(state == 'paused')
+        self.cancelButton.setEnabled(state in ('queued', 'running', 'processing', 'paused'))
+        # Any row of a playlist, failed resolves included, can stop the rest of it
+        self.cancelBatchButton.setEnabled(self.selectedJob is not None and self.model.batch(self.selectedJob) is not None)
+
+    def onLogAppended(self, job_id, text):
+        if job_id == self.selectedJob:
+            self.logOutput.append(text)
+            self.scrollLog()
+
+    def onModelReset(self):
+        # Rows were cleared; keep showing the selected job if it's still there
+        job_id, self.selectedJob = self.selectedJob, None
+        if job_id is not None and self.model.rowOf(job_id) is not None:
+            self.showJob(job_id)
+        else:
+            self.logOutput.clear()
+            self.updateButtons()
+
+    def scrollLog(self):
+        sb = self.logOutput.verticalScrollBar()
+        sb.setValue(sb.maximum())
+
+    def setStatus(self, text):
+        self.statusLabel.setText(text)
+
+    # Mouse Move Events for Frameless Window Dragging
+    def mousePressEvent(self, event):
+        if self.titleFrame.underMouse() and event.button() == Qt.MouseButton.LeftButton:
+            self.dragPos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            event.accept()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.MouseButton.LeftButton and hasattr(self, "dragPos"):
+            self.move(event.globalPosition().toPoint() - self.dragPos)
+            event.accept()
@@ -1,24 +1,25 @@
-from PyQt6 import uic
 from PyQt6.QtWidgets import QMainWindow
 from PyQt6.QtCore import Qt, pyqtSignal
+from ui_downloadwindow import Ui_DownloadWindow
 
-class DownloadProgressWindow(QMainWindow):
+class DownloadSetupWindow(QMainWindow, Ui_DownloadWindow):
+    # Asks for the filename and folder, then closes; progress is shown in the downloads window
     closed = pyqtSignal()
     start_download = pyqtSignal(str, str) # filename, path
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi('downloadwindow.ui', self)
+        self.setupUi(self) # generated from downloadwindow.ui by buildui.py
         
         # Make Window Frameless
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Window)
         # Fix size
-        self.setFixedSize(600, 400)
+        self.setFixedSize(600, 170)
         
         # Connect listeners
         self.closeButton.clicked.connect(self.close)
         self.startDownloadButton.clicked.connect(self.onStartClicked)
-        
+
         self.oldPos = self.pos()
 
     def setInfo(self, filename, path):
@@ -29,18 +30,8 @@ class DownloadProgressWindow(QMainWindow):
         filename = self.filenameEdit.text().strip()
         path = self.pathEdit.text().strip()
         if filename and path:
-            self.startDownloadButton.setEnabled(False)
-            self.startDownloadButton.setText("Downloading...")
             self.start_download.emit(filename, path)
-
-    def updateProgress(self, value):
-        self.progressBar.setValue(value)
-
-    def appendLog(self, text):
-        self.logOutput.append(text)
-        # Auto scroll to bottom
-        sb = self.logOutput.verticalScrollBar()
-        sb.setValue(sb.maximum())
+            self.close()
 
     def closeEvent(self, event):
         self.closed.emit()
@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+import time
+import json
+import zlib
+import re
+import os
+
+from settings import SCRATCH_PATH
+
+CACHE_PATH = os.path.join(SCRATCH_PATH, 'cache')
+
+DEFAULT_TTL = 7 * 24 * 3600        # title, channel, formats etc. rarely change
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+EXPIRY_MARGIN = 300                # re-resolve streams a little before they expire
+
+EXPIRE_RE = re.compile(r'[?&/]expire[=/](\d+)')
+
+def streamExpiry(info):
+    # Signed googlevideo URLs carry an "expire" unix timestamp, in the query or the path
+    expiries = []
+    for f in (info or {}).get("formats", []):
+        for key in ("url", "manifest_url", "fragment_base_url"):
+            match = EXPIRE_RE.search(f.get(key) or "")
+            if match:
+                expiries.append(int(match.group(1)))
+    return min(expiries) if expiries else None
+
+class InfoCache:
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        if path is None:
+            path = os.path.join(CACHE_PATH, 'videoinfo.sqlite')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.maxBytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.staleStreams = 0
+        self._lock = threading.Lock()
+        # Shared between the GUI thread and VideoInfoThreads, guarded by _lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                streams_expire REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS videos_accessed ON videos(accessed_at)")
+        self._db.commit()
+
+    def get(self, video_id):
+        # Returns (video info, streams_valid) or (None, False) on a miss
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, fetched_at, streams_expire FROM videos WHERE video_id = ?", (video_id,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None, False
+
+            self._db.execute("UPDATE videos SET accessed_at = ? WHERE video_id = ?", (now, video_id))
+            self._db.commit()
+            self.hits += 1
+
+        info = json.loads(zlib.decompress(row[0]))
+        streams_valid = row[2] is None or row[2] - EXPIRY_MARGIN > now
+        if not streams_valid:
+            self.staleStreams += 1
+        return info, streams_valid
+
+    def put(self, video_id, info):
+        data = zlib.compress(json.dumps(info).encode('utf-8'))
+        now = time.time()
+        expires = streamExpiry(info.get("raw_info"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?)",
+                (video_id, data, len(data), now, now, expires)
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM videos").fetchone()[0]
+        if total <= self.maxBytes:
+            return
+
+        # Drop least recently used entries until we're back under the limit
+        for video_id, size in self._db.execute(
+            "SELECT video_id, size FROM videos ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.maxBytes:
+                break
+            self._db.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+            total -= size
+
+    def setMaxBytes(self, max_bytes):
+        with self._lock:
+            self.maxBytes = max_bytes
+            self._evict()
+            self._db.commit()
+
+    def titles(self):
+        # video id -> title for everything cached
+        with self._lock:
+            rows = self._db.execute("SELECT video_id, data FROM videos").fetchall()
+        return {video_id: json.loads(zlib.decompress(data)).get("title") for video_id, data in rows}
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM videos")
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            count, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM videos").fetchone()
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_streams": self.staleStreams
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,89 @@
+# Stopping a download from outside its thread. yt-dlp has no stop call, so
+# the job's progress hook raises on its next chunk and the transfer unwinds
+# from there, leaving its .part files to be resumed or deleted.
+import threading
+import glob
+import os
+
+CANCEL = 'cancel'
+PAUSE = 'pause'
+
+# What yt-dlp and ParallelRangeFD leave next to a .part file
+PART_SIDECARS = ('.ranges', '.ytdl')
+
+class DownloadStopped(Exception):
+    def __init__(self, reason):
+        super().__init__("Paused" if reason == PAUSE else "Cancelled")
+        self.reason = reason
+
+class JobControl:
+    # Lives as long as the job, across pauses: the files it has written are
+    # remembered so a cancel after a pause can still clean them up
+    def __init__(self, parts=None):
+        self.reason = None
+        self.keepParts = True
+        self.throttle = None # the running transfer's JobThrottle, released on stop
+        self.parts = set(parts or ()) # .part files and finished streams not yet merged
+        self._writing = set()
+        self._lock = threading.Lock()
+
+    def stop(self, reason, keep_parts=True):
+        # Called from the GUI thread; a cancel overrides an earlier pause
+        with self._lock:
+            if self.reason is None or reason == CANCEL:
+                self.reason = reason
+                self.keepParts = keep_parts
+            throttle = self.throttle
+        if throttle is not None:
+            # Don't let a throttle wait hold the thread past the stop
+            throttle.release()
+
+    def reset(self):
+        # Before the job runs again after a pause
+        with self._lock:
+            self.reason = None
+            self.keepParts = True
+
+    def stopped(self):
+        return self.reason is not None
+
+    def cancelled(self):
+        return self.reason == CANCEL
+
+    def hook(self, d):
+        # First progress hook of the job
+        status = d.get('status')
+        if status == 'downloading' and d.get('tmpfilename'):
+            self.parts.add(d['tmpfilename'])
+            self._writing.add(d.get('filename'))
+        elif status == 'finished' and d.get('filename') in self._writing:
+            # Downloaded by this job (not found already on disk), so it's
+            # ours to delete until post-processing has used it
+            self.parts.add(d['filename'])
+        if self.reason is not None:
+            raise DownloadStopped(self.reason)
+
+    def check(self):
+        # Between phases that don't call the hook (extraction, post-processing)
+        if self.reason is not None:
+            raise DownloadStopped(self.reason)
+
+    def cleanup(self):
+        # Deletes what the job wrote unless asked to keep it; returns the number of files removed
+        if self.keepParts:
+            return 0
+        removed = 0
+        for part in list(self.parts):
+            if not part:
+                continue
+            paths = [part] + [part + ext for ext in PART_SIDECARS] + glob.glob(glob.escape(part) + '-Frag*')
+            for path in paths:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print("Failed to remove partial file:", e)
+        self.parts.clear()
+        return removed
@@ -0,0 +1,105 @@
+import threading
+import uuid
+import json
+import time
+import os
+
+from settings import SCRATCH_PATH
+
+JOURNAL_PATH = os.path.join(SCRATCH_PATH, 'journal.json')
+PROGRESS_INTERVAL = 5.0 # seconds between progress writes for one job
+
+def newKey():
+    return uuid.uuid4().hex
+
+class DownloadJournal:
+    # Everything needed to restart an interrupted download, rewritten
+    # atomically (temp file + rename) whenever a job changes state
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self.records = {}
+        self.recovered = [] # keys found on disk at startup
+        self._lastWrite = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.records = json.load(f).get('jobs', {})
+        except (OSError, ValueError):
+            # Missing or torn file: start clean rather than refuse to launch
+            self.records = {}
+        self.recovered = list(self.records)
+
+    def _write(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'jobs': self.records}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def record(self, key, url, options, is_audio, filename, path, outtmpl):
+        with self._lock:
+            # A resumed job keeps what the previous session learned about it
+            previous = self.records.get(key, {})
+            self.records[key] = {
+                'url': url,
+                'format_id': (options or {}).get('format_id'),
+                'options': options or {},
+                'is_audio': is_audio,
+                'filename': filename,
+                'path': path,
+                'outtmpl': outtmpl,
+                'state': 'queued',
+                'downloaded': previous.get('downloaded', 0),
+                'total': previous.get('total'),
+                'part_files': previous.get('part_files', []),
+                'created': previous.get('created', time.time()),
+                'updated': time.time()
+            }
+            self._write()
+
+    def setState(self, key, state):
+        with self._lock:
+            record = self.records.get(key)
+            if record is None:
+                return
+            record['state'] = state
+            record['updated'] = time.time()
+            self._write()
+
+    def updateProgress(self, key, downloaded, total, part_file=None, force=False):
+        with self._lock:
+            record = self.records.get(key)
+            if record is None:
+                return
+            record['downloaded'] = downloaded
+            record['total'] = total
+            if part_file and part_file not in record['part_files']:
+                # A new .part file (e.g. the audio stream after the video) is worth saving now
+                record['part_files'].append(part_file)
+                force = True
+
+            now = time.monotonic()
+            if not force and now - self._lastWrite.get(key, 0) < PROGRESS_INTERVAL:
+                return
+            self._lastWrite[key] = now
+            record['updated'] = time.time()
+            self._write()
+
+    def remove(self, key):
+        with self._lock:
+            self._lastWrite.pop(key, None)
+            if self.records.pop(key, None) is not None:
+                self._write()
+
+    def unfinished(self):
+        # Only jobs left over from the previous session, not ones queued since
+        with self._lock:
+            return [
+                (key, dict(self.records[key])) for key in self.recovered
+                if key in self.records and self.records[key]['state'] in ('queued', 'running', 'processing', 'paused')
+            ]
@@ -1,8 +1,33 @@
-from PyQt6.QtWidgets import QApplication
-from mainwindow import MainWindow
+import startuptiming
 import sys
 
-app = QApplication(sys.argv)
-window = MainWindow()
-window.show()
-app.exec()
\ No newline at end of file
+# Guarded: the post-processing pool's worker processes re-import this file
+if __name__ == "__main__":
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    startuptiming.mark('import Qt')
+    from mainwindow import MainWindow
+    from settings import SCRATCH_PATH
+    import threading
+    import utils
+    import os
+    startuptiming.mark('import app modules')
+
+    app = QApplication(sys.argv)
+    startuptiming.mark('QApplication')
+    window = MainWindow()
+    startuptiming.mark('MainWindow')
+    window.show()
+    startuptiming.mark('show')
+
+    def onFirstFrame():
+        startuptiming.mark('first event loop pass')
+        startuptiming.report(os.path.join(utils.settings.get('scratch_dir', SCRATCH_PATH), 'startup_timing.jsonl'))
+        # Load yt_dlp/requests and warm the YoutubeDL pool now that the window is up,
+        # before the first search needs them
+        threading.Thread(target=utils.preload, daemon=True).start()
+
+    QTimer.singleShot(0, onFirstFrame)
+    # Don't keep the process alive for queued encodes
+    app.aboutToQuit.connect(utils.postPool.shutdown)
+    app.exec()
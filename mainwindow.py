@@ -1,17 +1,35 @@
-from PyQt6 import uic
-from PyQt6.QtWidgets import QMainWindow, QListWidgetItem
+from PyQt6.QtWidgets import QMainWindow
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon, QPixmap, QKeySequence, QShortcut
+from PyQt6.QtGui import QIcon, QKeySequence, QShortcut
+from ui_mainwindow import Ui_MainWindow
 import utils
 import threads
-from downloadwindow import DownloadProgressWindow
-from settingswindow import SettingsWindow, load_config
+from downloadwindow import DownloadSetupWindow
+from downloadswindow import DownloadsWindow
+from downloadmanager import DownloadManager, DEFAULT_MAX_WORKERS, DEFAULT_CONNECTIONS
+from infocache import InfoCache, DEFAULT_MAX_BYTES as DEFAULT_INFO_CACHE_BYTES
+from settings import SCRATCH_PATH
+from journal import DownloadJournal
+from archive import DownloadArchive
+from models import QualityModel, SearchResultModel, DownloadTableModel, videoQualityRows, audioQualityRows
+from delegates import ResultDelegate
+from bandwidth import parseSchedule
+from settingswindow import SettingsWindow, MB
 from functools import partial
+import itertools
+import os
 
-class MainWindow(QMainWindow):
+# Quality policies offered for playlists: (label, highest video height)
+PLAYLIST_VIDEO_POLICIES = [("Best Available", None), ("Up to 1080p", 1080), ("Up to 720p", 720), ("Up to 480p", 480), ("Up to 360p", 360)]
+PLAYLIST_AUDIO_POLICIES = [("Best Audio (original format)", None), ("Best Audio as MP3", 'mp3')]
+
+SEARCH_DEBOUNCE_MS = 400 # typing pause before a search starts on its own
+MIN_SEARCH_CHARS = 3     # shorter typed queries wait for Return
+
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi('mainwindow.ui', self)
+        self.setupUi(self) # generated from mainwindow.ui by buildui.py
 
         self.setWindowTitle('CRTube')
         self.setWindowIcon(QIcon('icon.ico'))
@@ -25,32 +43,90 @@ class MainWindow(QMainWindow):
         self.closeButton.clicked.connect(self.onCloseClicked)
         self.iconifyButton.clicked.connect(self.onIconifyClicked)
         self.searchbar.returnPressed.connect(self.onSearchReturned)
-        self.videoButton.clicked.connect(self.onVideoButtonClicked)
+        self.searchbar.textEdited.connect(self.onSearchEdited)
         self.videoButton.clicked.connect(self.onVideoButtonClicked)
         self.audioButton.clicked.connect(self.onAudioButtonClicked)
         self.download.clicked.connect(self.onDownloadClicked)
         self.settings.clicked.connect(self.onSettingsClicked)
+        self.downloads.clicked.connect(self.showDownloads)
 
         self.currentMode = 'video'
 
-        # Install event filters on result frames
-        for i in range(1, 5+1):
-            frame = getattr(self, f"result{i}")
-            frame.installEventFilter(self)
-
-        # Hiding ResultFrames
-        self.result1.hide()
-        self.result2.hide()
-        self.result3.hide()
-        self.result4.hide()
-        self.result5.hide()
+        # One model per list the quality view can show, filled once per result
+        self.videoModel = QualityModel(parent=self)
+        self.audioModel = QualityModel(parent=self)
+        self.playlistModels = {
+            'video': QualityModel(PLAYLIST_VIDEO_POLICIES, self),
+            'audio': QualityModel(PLAYLIST_AUDIO_POLICIES, self)
+        }
+        self.qualityList.setModel(self.videoModel)
 
         # Storing Old Position
         self.oldPos = self.pos()
 
-        self.searchResults = {}  # Dictionary to store search results
+        self.searchSession = None
+        self.searchThread = None
+        self.pendingSearch = False # a newer search waits for searchThread to stop
+        self.lastQuery = None
+
+        # Each query / clicked result gets a generation; results of older ones are dropped
+        self.searchGeneration = 0
+        self.infoGeneration = 0
+        self.lookups = set() # lookup threads still running, superseded or not
+
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.searchTimer.timeout.connect(lambda: self.startQuery(self.searchbar.text(), typed=True))
         self.urlResults = {}     # Dictionary to store url results
-        self.downloadWindows = [] # Store active download windows
+        self.downloadWindows = [] # Open "new download" prompts
+        self.resolvers = {}       # Download batch id -> thread resolving its playlist entries
+
+        # Every job is a row here; the downloads window is only built when opened
+        self.downloadModel = DownloadTableModel(self)
+        self.downloadsWindow = None
+        self._unresolvedIds = itertools.count(-1, -1) # rows for playlist entries that never became jobs
+
+        # Video info survives restarts so reopening a result is instant.
+        # A new scratch folder is only picked up here, on the next start.
+        settings = utils.settings
+        scratch_dir = settings.get('scratch_dir', SCRATCH_PATH)
+        self.infoCache = InfoCache(os.path.join(scratch_dir, 'cache', 'videoinfo.sqlite'))
+
+        # Thumbnails load on a thread pool and land in memory/disk caches
+        self.thumbnailLoader = threads.ThumbnailLoader(parent=self)
+        self.thumbnailLoader.thumbnail_ready.connect(self.onThumbnailReady)
+        self.currentThumbUrl = None
+
+        # Search results and playlist entries, painted by the delegate as they scroll into view
+        self.searchModel = SearchResultModel(self)
+        self.searchList.setModel(self.searchModel)
+        self.searchList.setItemDelegate(ResultDelegate(self.thumbnailLoader, self.searchList))
+        self.searchList.setMouseTracking(True)
+        self.searchList.clicked.connect(self.onResultClicked)
+        self.searchList.verticalScrollBar().valueChanged.connect(self.onResultsScrolled)
+
+        # Videos already downloaded are skipped before any network work
+        self.downloadArchive = DownloadArchive(os.path.join(scratch_dir, 'archive.sqlite'))
+        self.archiveScan = None
+
+        # Central download queue shared by all download windows
+        self.downloadManager = DownloadManager(settings.get('max_downloads', DEFAULT_MAX_WORKERS), self, DownloadJournal(os.path.join(scratch_dir, 'journal.json')), utils.bandwidthManager, utils.postPool, utils.metricsRegistry, self.downloadArchive, self.infoCache)
+        self.applySettings()
+        settings.subscribe(self.onSettingsChanged)
+        self.downloadManager.job_queued.connect(self.onJobQueued)
+        self.downloadManager.job_started.connect(self.onJobStarted)
+        self.downloadManager.job_progress.connect(self.onJobProgress)
+        self.downloadManager.job_stats.connect(self.onJobStats)
+        self.downloadManager.job_log.connect(self.onJobLog)
+        self.downloadManager.job_finished.connect(self.onJobFinished)
+        self.downloadManager.state_changed.connect(self.downloadModel.setState)
+        self.downloadManager.batch_progress.connect(self.onBatchProgress)
+        self.downloadManager.batch_finished.connect(self.onBatchFinished)
+
+        # Pick up downloads the previous session didn't get to finish
+        QTimer.singleShot(0, self.resumeInterruptedDownloads)
+        QTimer.singleShot(0, self.scanDownloadFolder)
 
         # Setting Focus to Search Bar
         self.searchbar.setFocus()
@@ -65,6 +141,15 @@ class MainWindow(QMainWindow):
         toggleFocusShort = QShortcut(QKeySequence("Ctrl+/"), self)
         toggleFocusShort.activated.connect(self.toggleFocus)
 
+        nextPageShort = QShortcut(QKeySequence("Ctrl+Down"), self)
+        nextPageShort.activated.connect(self.loadMoreResults)
+
+        topShort = QShortcut(QKeySequence("Ctrl+Up"), self)
+        topShort.activated.connect(self.searchList.scrollToTop)
+
+        downloadsShort = QShortcut(QKeySequence("Ctrl+J"), self)
+        downloadsShort.activated.connect(self.showDownloads)
+
     def mousePressEvent(self, event):
         if self.titleFrame.underMouse() and event.button() == Qt.MouseButton.LeftButton:
             self.dragPos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
@@ -79,128 +164,225 @@ class MainWindow(QMainWindow):
         self.settingsWindow = SettingsWindow(self)
         self.settingsWindow.show()
 
+    def onSettingsChanged(self, changed):
+        # Runs on whichever thread saved, only the settings window does so far
+        self.applySettings()
+        if 'default_path' in changed:
+            self.scanDownloadFolder()
+
+    def scanDownloadFolder(self):
+        # Once per folder: index what earlier versions (or other tools) already downloaded there
+        folder = utils.settings.get('default_path')
+        if not folder or not os.path.isdir(folder) or self.downloadArchive.isScanned(folder):
+            return
+        if self.archiveScan is not None and self.archiveScan.isRunning():
+            return
+        self.archiveScan = threads.ArchiveScanThread(self.downloadArchive, folder, utils.archiveTitles(self.infoCache))
+        self.archiveScan.finished_scan.connect(self.onArchiveScanned)
+        # The folder may have changed while this one was scanned
+        self.archiveScan.finished.connect(self.scanDownloadFolder)
+        self.archiveScan.start()
+
+    def onArchiveScanned(self, folder, added):
+        # Only when something new was indexed, and without overwriting a search or fetch message
+        if added and not self.progressLabel.text():
+            self.progressLabel.setText(f"{added} downloaded files indexed from {os.path.basename(folder) or folder}")
+
+    def applySettings(self):
+        # Every setter is cheap and a no-op when nothing changed
+        settings = utils.settings
+        self.downloadManager.setMaxWorkers(settings.get('max_downloads', DEFAULT_MAX_WORKERS))
+        self.downloadManager.setConnections(settings.get('connections', DEFAULT_CONNECTIONS))
+        self.applyBandwidthSettings(settings)
+        # No settings UI: set metrics_prometheus / metrics_log in config.json to export
+        utils.metricsRegistry.configure(settings.get('metrics_prometheus'), settings.get('metrics_log'))
+        utils.postPool.setWorkers(int(settings.get('postprocess_workers', 0)))
+        utils.configureThumbnails(settings.get('scratch_dir'), int(settings.get('thumbnail_cache_mb', 0)) * MB)
+        self.infoCache.setMaxBytes(int(settings.get('info_cache_mb', DEFAULT_INFO_CACHE_BYTES // MB)) * MB)
+
+    def applyBandwidthSettings(self, settings):
+        try:
+            schedule = parseSchedule(settings.get('bandwidth_schedule', ''))
+        except ValueError:
+            schedule = []
+        # Stored in KB/s, 0 meaning unlimited
+        utils.bandwidthManager.configure(int(settings.get('bandwidth_limit', 0)) * 1024, schedule)
+
     def onCloseClicked(self):
         self.close()
 
+    def closeEvent(self, event):
+        # Nothing would queue what the playlist resolvers still find
+        for resolver in self.resolvers.values():
+            resolver.requestInterruption()
+        super().closeEvent(event)
+
     def onIconifyClicked(self):
         self.showMinimized()
 
     def onSearchReturned(self):
-        query = self.searchbar.text().strip()
+        self.searchTimer.stop()
+        self.startQuery(self.searchbar.text())
+
+    def onSearchEdited(self, text):
+        # Restarted by every keystroke, so only a pause in typing searches
+        self.searchTimer.start()
+
+    def startQuery(self, query, typed=False):
+        query = query.strip()
         if query == '':
             return
+        if typed and (query == self.lastQuery or (len(query) < MIN_SEARCH_CHARS and not utils.isValidURL(query))):
+            # Nothing new to look up yet (e.g. a trailing space); Return still searches again
+            return
+        self.lastQuery = query
+
+        self.searchGeneration += 1
+        self.infoGeneration += 1
+        generation = self.infoGeneration
 
-        # Clear previous results
-        for i in range(1, 6):
-            getattr(self, f'result{i}').hide()
-            getattr(self, f'videoTitle{i}').setText('')
-            getattr(self, f'channel{i}').setText('')
-            getattr(self, f'views{i}').setText('')
-            getattr(self, f'length{i}').setText('')
+        # Drop the old session first so clearing the list can't page it in
+        self.dropSearchSession()
+        self.searchModel.clear()
 
         if utils.isValidURL(query):
+            if utils.isPlaylistURL(query):
+                self.progressLabel.setText('Fetching Playlist...')
+
+                self.playlistThread = self.track(threads.PlaylistThread(query))
+                self.playlistThread.playlist_ready.connect(lambda playlist: self.displayPlaylistResult(playlist) if self.infoGeneration == generation else None)
+                self.playlistThread.start()
+                return
+
             if not utils.isValidYouTubeURL(query):
                 self.progressLabel.setText('Invalid URL')
                 return
             
             self.progressLabel.setText('Fetching Data From URL...')
-
-            self.videoThread = threads.VideoInfoThread(query)
-            self.videoThread.result_ready.connect(self.displayURLResult)
-            self.videoThread.start()
-
+            self.startVideoInfo(query, generation)
             return
         
         self.progressLabel.setText('Searching...')
 
-        # Start search in a separate thread
-        self.thread = threads.SearchThread(query)
-        self.thread.results_ready.connect(self.displaySearchResult)
-        self.thread.start()
+        self.searchSession = utils.SearchSession(query, utils.SEARCH_PAGE_SIZE)
+        self.startSearchPage()
+
+    def track(self, thread):
+        # Keeps a superseded lookup referenced until it returns; its result is ignored
+        self.lookups.add(thread)
+        thread.finished.connect(lambda: self.lookups.discard(thread))
+        return thread
+
+    def startVideoInfo(self, url, generation):
+        self.videoThread = self.track(threads.VideoInfoThread(url, self.infoCache))
+        self.videoThread.result_ready.connect(lambda videoInfo: self.displayURLResult(videoInfo) if self.infoGeneration == generation else None)
+        self.videoThread.start()
+
+    def dropSearchSession(self):
+        if self.searchSession is None:
+            return
+        if self.searchRunning():
+            # yt-dlp can't be stopped mid-request; the thread quits at its next result
+            self.searchThread.requestInterruption()
+        else:
+            self.searchSession.close()
+        self.searchSession = None
+
+    def startSearchPage(self):
+        if self.searchRunning():
+            # At most one search talks to YouTube at a time: a superseded one
+            # finishes its request first, then only the newest query runs
+            self.pendingSearch = True
+            return
+        self.pendingSearch = False
+        # Start search in a separate thread; results paint as they arrive
+        generation = self.searchGeneration
+        self.searchThread = self.track(threads.SearchThread(self.searchSession.query, self.searchSession))
+        self.searchThread.result_found.connect(lambda index, video: self.displaySearchItem(index, video) if self.searchGeneration == generation else None)
+        self.searchThread.results_ready.connect(lambda results: self.displaySearchResult(results) if self.searchGeneration == generation else None)
+        self.searchThread.finished.connect(self.onSearchThreadFinished)
+        self.searchThread.start()
+
+    def onSearchThreadFinished(self):
+        if self.pendingSearch and self.searchSession is not None:
+            self.startSearchPage()
+
+    def searchRunning(self):
+        return self.searchThread is not None and self.searchThread.isRunning()
+
+    def loadMoreResults(self):
+        if self.searchRunning() or self.pendingSearch:
+            return
+        if self.searchSession is None or self.searchSession.exhausted:
+            if self.searchModel.rowCount():
+                self.progressLabel.setText('No more results.')
+            return
+
+        self.progressLabel.setText('Loading more results...')
+        self.startSearchPage()
+
+    def onResultsScrolled(self, value):
+        # Reaching the bottom of the list fetches the next page
+        if value >= self.searchList.verticalScrollBar().maximum() and self.searchSession is not None and not self.searchSession.exhausted:
+            self.loadMoreResults()
+
+    def displaySearchItem(self, index, video):
+        if index >= self.searchModel.rowCount():
+            self.searchModel.appendResult(video)
 
     def displaySearchResult(self, results):
-        for i, video in enumerate(results[:5], start=1):
-            # Title
-            label = getattr(self, f'videoTitle{i}')
-            label.setFixedWidth(670)
-            label.setWordWrap(False)
-            title = video.get('title', 'N/A')
-            fm = label.fontMetrics()
-            elidedTitle = fm.elidedText(title, Qt.TextElideMode.ElideRight, label.width())
-            label.setText(elidedTitle)
-
-            # Channel, Views, Duration
-            getattr(self, f'channel{i}').setText(f"Channel: {video.get('channel', 'N/A')}")
-            getattr(self, f'views{i}').setText(utils.formatViews(video.get('views')))
-            getattr(self, f'length{i}').setText(utils.formatDuration(video.get('duration')))
-
-            getattr(self, f'result{i}').show()
-
-        self.searchResults = results
-        self.progressLabel.setText('')
+        if self.searchSession is not None and not self.searchSession.exhausted:
+            self.progressLabel.setText('Scroll down for more results')
+        else:
+            self.progressLabel.setText('')
 
-    def displayURLResult(self, videoInfo):
-        self.videoTitle1.setFixedWidth(670)
-        self.videoTitle1.setWordWrap(False)
-        title = videoInfo.get('title', 'N/A')
-        fm = self.videoTitle1.fontMetrics()
-        elidedTitle = fm.elidedText(title, Qt.TextElideMode.ElideRight, self.videoTitle1.width())
-        self.videoTitle1.setText(elidedTitle)
+    def onThumbnailReady(self, url, path, pixmap):
+        self.searchModel.thumbnailLoaded(url)
+        if url != self.currentThumbUrl:
+            return
+        self.thumbnail.setPixmap(pixmap)
 
-        self.channel1.setText(f"Channel: {videoInfo.get('channel', 'N/A')}")
-        self.views1.setText(utils.formatViews(videoInfo.get('views')))
-        self.length1.setText(utils.formatDuration(videoInfo.get('length')))
+    def displayURLResult(self, videoInfo):
+        if not self.searchModel.rowCount():
+            # A pasted URL shows as the only result; a clicked result stays in its list
+            self.searchModel.setResults([{
+                'title': videoInfo.get('title'),
+                'channel': videoInfo.get('channel'),
+                'views': videoInfo.get('views'),
+                'duration': videoInfo.get('length'),
+                'url': videoInfo.get('url'),
+                'thumbnail': videoInfo.get('thumbnail')
+            }])
 
         thumb_url = videoInfo.get('thumbnail')
         if thumb_url:
-            success, path = utils.downloadThumbnail(thumb_url, "thumb1.jpg")
-            if success:
-                pixmap = QPixmap(path)
-                self.thumbnail.setPixmap(pixmap.scaled(260, 146, Qt.AspectRatioMode.KeepAspectRatio))
-            videoInfo['thumbnail_path'] = path
-
-        self.result1.show()
-
-        self.videoButton.setStyleSheet("""
-            QPushButton {
-            	background: #FF4D6D;
-            	color: #1A1A1F;
-            	border: 2px solid #FF4D6D;
-            	border-right: 1px solid #FF4D6D;
-            	border-top-left-radius: 20px;
-            	border-bottom-left-radius: 20px;
-            }
-        """)
-
-        self.audioButton.setStyleSheet("""
-            QPushButton {
-            	background: #1A1A1F;
-            	color: #FF4D6D;
-            	border: 2px solid #FF4D6D;
-            	border-left: 1px solid #FF4D6D;
-            	border-top-right-radius: 20px;
-            	border-bottom-right-radius: 20px;
-            }
-        """)            
-
-        self.qualityList.clear()  # clear previous entries
-        for q in videoInfo.get('video_qualities', []):
-            res = q.get('resolution') or "N/A"
-            ext = q.get('ext') or ""
-            size = q.get('filesize') or 0
-            if size:
-                size_mb = round(size / (1024*1024), 2)
-                size_str = f"{size_mb} MB"
-            else:
-                size_str = "N/A"
+            self.currentThumbUrl = thumb_url
+            self.thumbnailLoader.request(thumb_url)
 
-            item_text = f"{res} - {size_str}"
-            item = QListWidgetItem(item_text)
-            self.qualityList.addItem(item)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.urlResults = videoInfo
+        self.videoModel.setRows(videoQualityRows(videoInfo.get('video_qualities')))
+        self.audioModel.setRows(audioQualityRows(videoInfo.get('best_audio')))
+        self.setMode('video')
+        self.progressLabel.setText('')
 
-            self.urlResults = videoInfo
-            self.progressLabel.setText('')
+    def displayPlaylistResult(self, playlist):
+        entries = playlist.get('entries', [])
+        if not entries:
+            self.progressLabel.setText(playlist.get('error') or 'Playlist is empty.')
+            return
+
+        self.searchModel.setResults(entries)
+
+        # The right panel downloads the whole list with one quality policy
+        self.urlResults = dict(playlist, playlist=True)
+        first_thumb = entries[0].get('thumbnail')
+        if first_thumb:
+            self.currentThumbUrl = first_thumb
+            self.thumbnailLoader.request(first_thumb)
+
+        self.setMode(self.currentMode)
+
+        self.progressLabel.setText(f"{playlist.get('title')}: {len(entries)} videos. Pick a quality and press Download.")
 
     def toggleFocus(self):
         if self.searchbar.hasFocus():
@@ -208,98 +390,35 @@ class MainWindow(QMainWindow):
         else:
             self.searchbar.setFocus()
 
-    def onVideoButtonClicked(self):
-        self.currentMode = 'video'
-        self.qualityList.clear()  
-
-        self.videoButton.setStyleSheet("""
-            QPushButton {
-            	background: #FF4D6D;
-            	color: #1A1A1F;
-            	border: 2px solid #FF4D6D;
-            	border-right: 1px solid #FF4D6D;
-            	border-top-left-radius: 20px;
-            	border-bottom-left-radius: 20px;
-            }
-        """)
-
-        self.audioButton.setStyleSheet("""
-            QPushButton {
-            	background: #1A1A1F;
-            	color: #FF4D6D;
-            	border: 2px solid #FF4D6D;
-            	border-left: 1px solid #FF4D6D;
-            	border-top-right-radius: 20px;
-            	border-bottom-right-radius: 20px;
-            }
-        """)
-
-        for q in self.urlResults.get('video_qualities', []):
-            res = q.get('resolution') or "N/A"
-            ext = q.get('ext') or ""
-            size = q.get('filesize') or 0
-            if size:
-                size_mb = round(size / (1024*1024), 2)
-                size_str = f"{size_mb} MB"
-            else:
-                size_str = "N/A"
+    def setMode(self, mode):
+        self.currentMode = mode
+        # The "active" property picks the filled style from the buttons' stylesheets
+        for button, active in ((self.videoButton, mode == 'video'), (self.audioButton, mode == 'audio')):
+            if button.property('active') != active:
+                button.setProperty('active', active)
+                button.style().unpolish(button)
+                button.style().polish(button)
+
+        if self.urlResults.get('playlist'):
+            model = self.playlistModels[mode]
+        else:
+            model = self.audioModel if mode == 'audio' else self.videoModel
+        if self.qualityList.model() is not model:
+            oldSelection = self.qualityList.selectionModel()
+            self.qualityList.setModel(model)
+            if oldSelection is not None:
+                oldSelection.deleteLater()
 
-            item_text = f"{res} - {size_str}"
-            item = QListWidgetItem(item_text)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.qualityList.addItem(item)
+    def onVideoButtonClicked(self):
+        self.setMode('video')
 
     def onAudioButtonClicked(self):
-        self.currentMode = 'audio'
-        self.qualityList.clear()
-
-        self.videoButton.setStyleSheet("""
-            QPushButton {
-            	background: #1A1A1F;
-            	color: #FF4D6D;
-            	border: 2px solid #FF4D6D;
-            	border-right: 1px solid #FF4D6D;
-            	border-top-left-radius: 20px;
-            	border-bottom-left-radius: 20px;
-            }
-        """)
-
-        self.audioButton.setStyleSheet("""
-            QPushButton {
-            	background: #FF4D6D;
-            	color: #1A1A1F;
-            	border: 2px solid #FF4D6D;
-            	border-left: 1px solid #FF4D6D;
-            	border-top-right-radius: 20px;
-            	border-bottom-right-radius: 20px;
-            }
-        """)
-
-        audio = self.urlResults.get('best_audio')
-        if not audio or not audio.get('filesize'):
-            return
+        self.setMode('audio')
 
-        ext = audio.get('ext', 'N/A').upper()
-        abr = round(audio.get('abr', 0))  # kbps
-        size_mb = round(audio['filesize'] / (1024*1024), 2)
-        size_str = f"{size_mb} MB"
-
-        item_text = f"{abr} kbps - {size_str}"
-        item = QListWidgetItem(item_text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.qualityList.addItem(item)
-
-    def eventFilter(self, source, event):
-        if event.type() == event.Type.MouseButtonPress:
-            for i in range(1, 6):
-                frame = getattr(self, f"result{i}")
-                if source == frame:
-                    self.onResultClicked(i)
-                    return True
-        return super().eventFilter(source, event)
-    
-    def onResultClicked(self, idx):
-        video = self.searchResults[idx - 1]
+    def onResultClicked(self, index):
+        video = self.searchModel.result(index.row())
+        if video is None:
+            return
         url = video.get("url")
 
         if not url:
@@ -308,54 +427,47 @@ class MainWindow(QMainWindow):
 
         self.progressLabel.setText("Fetching Info...")
 
-        # Start same thread as URL mode
-        self.videoThread = threads.VideoInfoThread(url)
-        self.videoThread.result_ready.connect(self.displayURLResult)
-        self.videoThread.start()
+        # Show the search thumbnail until the full info brings the large one
+        pixmap = self.thumbnailLoader.pixmap(video.get('thumbnail'))
+        if pixmap is not None:
+            self.currentThumbUrl = video.get('thumbnail')
+            self.thumbnail.setPixmap(pixmap)
+
+        # Start same thread as URL mode; a later click supersedes this one
+        self.infoGeneration += 1
+        self.startVideoInfo(url, self.infoGeneration)
 
     def onDownloadClicked(self):
         if not self.urlResults:
             return
 
-        row = self.qualityList.currentRow()
+        row = self.qualityList.currentIndex().row()
         if row < 0:
             self.progressLabel.setText("Please select a quality option first.")
             return
 
+        if self.urlResults.get('playlist'):
+            self.startPlaylistDownload(row)
+            return
+
         url = self.urlResults.get('url')
         if not url:
              self.progressLabel.setText("Error: URL not found.")
              return
 
-        # Prepare options
-        options = {}
         is_audio = (self.currentMode == 'audio')
-        
-        if is_audio:
-            options = self.urlResults.get('best_audio', {})
-        else:
-            # Video mode. qualityList items correspond to video_qualities list.
-            # We need to be careful if the list was filtered or sorted differently.
-            # In onVideoButtonClicked, we iterate over urlResults['video_qualities'].
-            # So the index should match. (Assuming list widget rows match list indices)
-            qualities = self.urlResults.get('video_qualities', [])
-            if 0 <= row < len(qualities):
-                options = qualities[row]
-            else:
-                 self.progressLabel.setText("Error: Quality selection mismatch.")
-                 return
+        options = self.qualityList.model().options(row)
+        if options is None:
+            self.progressLabel.setText("Error: Quality selection mismatch.")
+            return
 
-        # Create Window
-        self.dlWindow = DownloadProgressWindow(self)
         title = self.urlResults.get('title', 'Unknown')
         # Sanitize title for filename
-        import re
-        safe_title = re.sub(r'[\\/*?:"<>|]', "", title)
+        safe_title = utils.safeFilename(title)
         
-        config = load_config()
-        default_path = config.get('default_path', "C:/Users/PC/Desktop/CRTube")
+        default_path = utils.settings.get('default_path', "C:/Users/PC/Desktop/CRTube")
         
-        dlWindow = DownloadProgressWindow(self)
+        dlWindow = DownloadSetupWindow(self)
         dlWindow.setInfo(safe_title, default_path) 
         
         # Keep reference
@@ -363,28 +475,146 @@ class MainWindow(QMainWindow):
         # Remove reference when closed
         dlWindow.closed.connect(lambda: self.downloadWindows.remove(dlWindow) if dlWindow in self.downloadWindows else None)
         
-        # Connect start signal with context
-        # We pass dlWindow instance to processDownload to know which window to update
-        dlWindow.start_download.connect(partial(self.processDownload, dlWindow, url, options, is_audio, title))
+        dlWindow.start_download.connect(partial(self.processDownload, url, options, is_audio, title))
         dlWindow.show()
 
-    def processDownload(self, window, url, options, is_audio, title, filename, path):
-        # Create Thread
-        # Attach thread to window to keep it alive
-        thread = threads.DownloadThread(url, options, is_audio, filename, path)
-        window.thread = thread 
-        
-        thread.progress.connect(window.updateProgress)
-        thread.log.connect(window.appendLog)
-        
-        def on_finished(success, msg):
-            if success:
-                window.appendLog(f"\nSUCCESS: Saved to {msg}")
-                window.updateProgress(100)
-                # Auto-close on success as requested
-                QTimer.singleShot(2000, window.close) # Wait 2s then close so user sees success message
+    def startPlaylistDownload(self, row):
+        is_audio = (self.currentMode == 'audio')
+        if not 0 <= row < self.playlistModels[self.currentMode].rowCount():
+            self.progressLabel.setText("Error: Quality selection mismatch.")
+            return
+        # Highest video height, or the audio format
+        policy = self.playlistModels[self.currentMode].options(row)
+
+        playlist = self.urlResults
+        default_path = utils.settings.get('default_path', "C:/Users/PC/Desktop/CRTube")
+
+        # The filename field names the folder the playlist is saved into
+        dlWindow = DownloadSetupWindow(self)
+        dlWindow.setInfo(utils.safeFilename(playlist.get('title')), default_path)
+        self.downloadWindows.append(dlWindow)
+        dlWindow.closed.connect(lambda: self.downloadWindows.remove(dlWindow) if dlWindow in self.downloadWindows else None)
+        dlWindow.start_download.connect(partial(self.processPlaylistDownload, playlist, is_audio, policy))
+        dlWindow.show()
+
+    def processPlaylistDownload(self, playlist, is_audio, policy, folder, path):
+        all_entries = playlist.get('entries', [])
+        title = playlist.get('title') or folder
+        batch_id = self.downloadManager.createBatch(len(all_entries), title)
+        target = os.path.join(path, folder)
+        window = self.showDownloads()
+
+        # Videos we already have count as done without being resolved
+        entries = [e for e in all_entries if not self.downloadArchive.find(utils.videoId(e['url']), is_audio, None, policy if is_audio else None)]
+        if len(entries) < len(all_entries):
+            for _ in range(len(all_entries) - len(entries)):
+                self.downloadManager.skipBatchEntry(batch_id, success=True)
+        if not entries:
+            window.setStatus(f"{title}: all {len(all_entries)} videos already downloaded")
+            return
+        window.setStatus(f"{title}: resolving {len(entries)} videos ({len(all_entries) - len(entries)} already downloaded)...")
+
+        # Formats are resolved a few at a time; each entry is queued as soon as it's ready
+        resolver = threads.PlaylistResolveThread([e['url'] for e in entries], cache=self.infoCache)
+        self.resolvers[batch_id] = resolver
+        resolver.finished.connect(lambda: self.resolvers.pop(batch_id, None))
+
+        def on_resolved(index, info):
+            if resolver.isInterruptionRequested():
+                return
+            options = utils.chooseOptions(info, is_audio, policy)
+            self.downloadManager.submit(
+                info.get('url'), options, is_audio, utils.safeFilename(info.get('title')), target,
+                batch=batch_id
+            )
+
+        def on_failed(index, error):
+            if resolver.isInterruptionRequested():
+                return
+            # Shown as a failed row, it never gets a job id of its own
+            row_id = next(self._unresolvedIds)
+            self.downloadModel.addJob(row_id, entries[index].get('title') or entries[index]['url'], 'failed', batch_id)
+            self.downloadModel.setState(row_id, 'failed', error)
+            self.downloadModel.appendLog(row_id, f"FAILED to resolve {entries[index]['url']}: {error}")
+            self.downloadManager.skipBatchEntry(batch_id)
+
+        resolver.entry_resolved.connect(on_resolved)
+        resolver.entry_failed.connect(on_failed)
+        resolver.start()
+
+    def onCancelBatch(self, batch_id, keep_parts):
+        # Stop resolving first, so no entry queued in the meantime slips through
+        resolver = self.resolvers.get(batch_id)
+        if resolver is not None:
+            resolver.requestInterruption()
+        self.downloadManager.cancelBatch(batch_id, keep_parts)
+
+    def onBatchProgress(self, batch_id, percent, succeeded, failed, total):
+        batch = self.downloadManager.batches.get(batch_id)
+        if self.downloadsWindow is not None and batch is not None:
+            self.downloadsWindow.setStatus(f"{batch.title}: {percent}%, {succeeded + failed}/{total} done, {failed} failed")
+
+    def onBatchFinished(self, batch_id, succeeded, failed):
+        batch = self.downloadManager.batches.get(batch_id)
+        if self.downloadsWindow is not None and batch is not None:
+            self.downloadsWindow.setStatus(f"{batch.title}: finished, {succeeded} downloaded, {failed} failed")
+
+    def processDownload(self, url, options, is_audio, title, filename, path):
+        # Hand the job to the shared queue; it starts once a worker slot is free
+        job_id = self.downloadManager.submit(url, options, is_audio, filename, path)
+        self.showDownloads().showJob(job_id)
+
+    def showDownloads(self):
+        if self.downloadsWindow is None:
+            self.downloadsWindow = DownloadsWindow(self.downloadModel, self)
+            self.downloadsWindow.clear_finished.connect(self.onClearFinished)
+            self.downloadsWindow.pause_job.connect(self.downloadManager.pause)
+            self.downloadsWindow.resume_job.connect(self.downloadManager.resume)
+            self.downloadsWindow.cancel_job.connect(self.downloadManager.cancel)
+            self.downloadsWindow.cancel_batch.connect(self.onCancelBatch)
+        self.downloadsWindow.show()
+        self.downloadsWindow.raise_()
+        return self.downloadsWindow
+
+    def onClearFinished(self):
+        self.downloadManager.forget(self.downloadModel.removeFinished())
+
+    def resumeInterruptedDownloads(self):
+        resumed = None
+        for job_id in self.downloadManager.resumeJournal():
+            job = self.downloadManager.job(job_id)
+            if job.state == 'paused':
+                self.downloadModel.appendLog(job_id, f"Paused in the last session: {job.url}")
             else:
-                window.appendLog(f"\nFAILED: {msg}")
-        
-        thread.finished_download.connect(on_finished)
-        thread.start()
+                self.downloadModel.appendLog(job_id, f"Resuming interrupted download of {job.url}")
+            resumed = job_id
+        if resumed is not None:
+            self.showDownloads().showJob(resumed)
+
+    def onJobQueued(self, job_id):
+        job = self.downloadManager.job(job_id)
+        self.downloadModel.addJob(job_id, job.filename or job.url, job.state, job.batch)
+        if job.state == 'queued' and self.downloadManager.runningCount() >= self.downloadManager.maxWorkers:
+            self.downloadModel.appendLog(job_id, f"Queued ({self.downloadManager.queuedCount()} waiting)...")
+
+    def onJobStarted(self, job_id):
+        self.downloadModel.appendLog(job_id, "Starting download...")
+
+    def onJobProgress(self, job_id, value):
+        self.downloadModel.setProgress(job_id, value)
+
+    def onJobStats(self, job_id, stats):
+        self.downloadModel.setStats(job_id, stats)
+
+    def onJobLog(self, job_id, text):
+        self.downloadModel.appendLog(job_id, text)
+
+    def onJobFinished(self, job_id, success, msg):
+        job = self.downloadManager.job(job_id)
+        self.downloadModel.setState(job_id, job.state, msg)
+        if success:
+            self.downloadModel.appendLog(job_id, f"SUCCESS: Saved to {msg}")
+        elif job.state == 'cancelled':
+            self.downloadModel.appendLog(job_id, "Cancelled")
+        else:
+            self.downloadModel.appendLog(job_id, f"FAILED: {msg}")
@@ -0,0 +1,241 @@
+# Per-job timing and transfer figures, plus a process-wide registry that
+# exports them as a Prometheus text file and/or a JSON lines log
+from contextlib import contextmanager
+import threading
+import json
+import time
+import os
+import re
+
+RETRY_RE = re.compile(r'Retrying\b.*\(\d+/\d+\)')
+
+# yt-dlp post-processor keys -> phase names
+PP_PHASES = {
+    'Merger': 'merge',
+    'ExtractAudio': 'extract_audio',
+    'EmbedThumbnail': 'embed_thumbnail',
+    'MoveFiles': 'move_files',
+}
+
+def ppPhase(key):
+    return PP_PHASES.get(key) or re.sub(r'(?<!^)(?=[A-Z])', '_', key or 'postprocess').lower()
+
+class PPTimer:
+    # yt-dlp postprocessor_hooks callback, (phase, seconds) per finished post-processor
+    def __init__(self):
+        self.timings = []
+        self._started = {}
+
+    def hook(self, d):
+        key = d.get('postprocessor')
+        if d.get('status') == 'started':
+            self._started[key] = time.perf_counter()
+        elif d.get('status') == 'finished' and key in self._started:
+            self.timings.append((ppPhase(key), time.perf_counter() - self._started.pop(key)))
+
+class MetricsLogger:
+    # Passes yt-dlp's log through, counting retry lines on the way
+    def __init__(self, logger, metrics):
+        self.logger = logger
+        self.metrics = metrics
+
+    def debug(self, msg):
+        self._count(msg)
+        self.logger.debug(msg)
+
+    def info(self, msg):
+        self._count(msg)
+        self.logger.info(msg)
+
+    def warning(self, msg):
+        self._count(msg)
+        self.logger.warning(msg)
+
+    def error(self, msg):
+        self.logger.error(msg)
+
+    def _count(self, msg):
+        if RETRY_RE.search(msg):
+            self.metrics.retries += 1
+
+class DownloadMetrics:
+    # One download job, from being queued to its file being final. Phases:
+    # queued, extract, transfer, postprocess_wait and one per post-processor.
+    def __init__(self, url=None, created=None):
+        self.url = url
+        self.created = created or time.time()
+        self.phases = {}
+        self.bytes = 0
+        self.peakSpeed = 0.0
+        self.retries = 0
+        self._files = {}
+        self._clock = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + max(0.0, seconds)
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def started(self):
+        # Leaves the queue
+        self.add('queued', time.perf_counter() - self._clock)
+
+    def requeued(self):
+        # Resumed after a pause; the time spent paused isn't queueing
+        self._clock = time.perf_counter()
+
+    def hook(self, d):
+        # Progress hook; counters per file so video and audio add up
+        if d.get('status') not in ('downloading', 'finished'):
+            return
+        name = d.get('tmpfilename') or d.get('filename')
+        with self._lock:
+            self._files[name] = d.get('downloaded_bytes') or d.get('total_bytes') or self._files.get(name, 0)
+            self.bytes = sum(self._files.values())
+            if d.get('speed'):
+                self.peakSpeed = max(self.peakSpeed, d['speed'])
+
+    def addPostProcessing(self, timings, total=None):
+        # timings from PPTimer; anything left of total was spent waiting for a worker
+        for phase, seconds in timings:
+            self.add(phase, seconds)
+        if total is not None:
+            self.add('postprocess_wait', total - sum(seconds for _, seconds in timings))
+
+    def ppSeconds(self):
+        with self._lock:
+            return sum(seconds for phase, seconds in self.phases.items() if phase not in ('queued', 'extract', 'transfer', 'postprocess_wait'))
+
+    def averageSpeed(self):
+        transfer = self.phases.get('transfer')
+        return self.bytes / transfer if transfer else None
+
+    def record(self, success, key=None, error=None):
+        with self._lock:
+            phases = {phase: round(seconds, 3) for phase, seconds in self.phases.items()}
+        average = self.averageSpeed()
+        record = {
+            'time': round(time.time(), 3),
+            'job': key,
+            'url': self.url,
+            'outcome': 'success' if success else 'failed',
+            'phases': phases,
+            'total_seconds': round(sum(phases.values()), 3),
+            'bytes': self.bytes,
+            'avg_speed': round(average) if average else None,
+            'peak_speed': round(self.peakSpeed) or None,
+            'retries': self.retries,
+        }
+        if error:
+            record['error'] = error
+        return record
+
+def summaryLine(record):
+    # One human readable line for the download window's log
+    import utils
+    phases = ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in record['phases'].items())
+    speeds = f"avg {utils.formatBytes(record['avg_speed'])}/s" if record['avg_speed'] else "avg N/A"
+    if record['peak_speed']:
+        speeds += f", peak {utils.formatBytes(record['peak_speed'])}/s"
+    return f"Timing: {phases}; {utils.formatBytes(record['bytes'])}, {speeds}, {record['retries']} retries"
+
+class MetricsRegistry:
+    # Counters, gauges and summaries (sum/count) keyed by name and labels
+    def __init__(self):
+        self.prometheusPath = None
+        self.logPath = None
+        self._meta = {} # name -> (type, help)
+        self._values = {} # name -> {labels tuple: value or [sum, count]}
+        self._lock = threading.Lock()
+        self.define('crtube_downloads_total', 'counter', 'Finished downloads by outcome')
+        self.define('crtube_download_bytes_total', 'counter', 'Bytes transferred by finished downloads')
+        self.define('crtube_download_retries_total', 'counter', 'Retried requests and fragments')
+        self.define('crtube_download_phase_seconds', 'summary', 'Time spent in each download phase')
+        self.define('crtube_download_speed_bytes', 'gauge', 'Average and peak speed of the last finished download')
+        self.define('crtube_extract_seconds', 'summary', 'getVideoInfo duration by source')
+
+    def configure(self, prometheus_path=None, log_path=None):
+        self.prometheusPath = prometheus_path or None
+        self.logPath = log_path or None
+
+    def define(self, name, kind, help_text):
+        self._meta[name] = (kind, help_text)
+        self._values.setdefault(name, {})
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            values = self._values[name]
+            key = tuple(sorted(labels.items()))
+            values[key] = values.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._values[name][tuple(sorted(labels.items()))] = value
+
+    def observe(self, name, value, **labels):
+        with self._lock:
+            entry = self._values[name].setdefault(tuple(sorted(labels.items())), [0.0, 0])
+            entry[0] += value
+            entry[1] += 1
+
+    def value(self, name, **labels):
+        with self._lock:
+            return self._values[name].get(tuple(sorted(labels.items())))
+
+    def recordJob(self, record):
+        self.inc('crtube_downloads_total', outcome=record['outcome'])
+        self.inc('crtube_download_bytes_total', record['bytes'])
+        self.inc('crtube_download_retries_total', record['retries'])
+        for phase, seconds in record['phases'].items():
+            self.observe('crtube_download_phase_seconds', seconds, phase=phase)
+        if record['avg_speed']:
+            self.set('crtube_download_speed_bytes', record['avg_speed'], kind='avg')
+        if record['peak_speed']:
+            self.set('crtube_download_speed_bytes', record['peak_speed'], kind='peak')
+        self.export(record)
+
+    def export(self, record=None):
+        # Failing to write metrics must never fail a download
+        try:
+            if record is not None and self.logPath:
+                with self._lock:
+                    with open(self.logPath, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(record) + "\n")
+            if self.prometheusPath:
+                self.writePrometheus(self.prometheusPath)
+        except OSError as e:
+            print("Failed to export metrics:", e)
+
+    def prometheusText(self):
+        lines = []
+        with self._lock:
+            for name, (kind, help_text) in self._meta.items():
+                values = self._values[name]
+                if not values:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(values.items()):
+                    label = "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}" if labels else ""
+                    if kind == 'summary':
+                        lines.append(f"{name}_sum{label} {value[0]:.6g}")
+                        lines.append(f"{name}_count{label} {value[1]}")
+                    else:
+                        lines.append(f"{name}{label} {value:.6g}" if isinstance(value, float) else f"{name}{label} {value}")
+        return "\n".join(lines) + "\n"
+
+    def writePrometheus(self, path):
+        # Written whole and renamed, so a scraper never reads half a file
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheusText())
+        os.replace(tmp_path, path)
@@ -0,0 +1,247 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex, pyqtSignal
+from collections import deque
+import utils
+
+def sizeLabel(q):
+    size = q.get('filesize')
+    if not size:
+        return "N/A"
+    # "~" marks sizes estimated from bitrate x duration
+    return f"{'~' if q.get('estimated') else ''}{round(size / (1024*1024), 2)} MB"
+
+def videoQualityRows(qualities):
+    return [(f"{q.get('resolution') or 'N/A'} {(q.get('ext') or '').upper()} - {sizeLabel(q)}", q) for q in qualities or []]
+
+def audioQualityRows(audio):
+    if not audio:
+        return []
+    # The stream as it is (remuxed, no re-encoding) first, MP3 for players that need it
+    native = utils.audioExtension(audio).upper()
+    return [
+        (f"{native} {round(audio.get('abr') or 0)} kbps - {sizeLabel(audio)} (original)", audio),
+        ("MP3 192 kbps (re-encoded)", dict(audio, audio_format='mp3'))
+    ]
+
+class QualityModel(QAbstractListModel):
+    # (label, options) rows behind qualityList. Each mode keeps its own
+    # model, so a Video/Audio toggle only swaps which one the view shows.
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self.rows = list(rows or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.rows):
+            return None
+        label, options = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return label
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.UserRole:
+            return options
+        return None
+
+    def setRows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.endResetModel()
+
+    def options(self, row):
+        if 0 <= row < len(self.rows):
+            return self.rows[row][1]
+        return None
+
+class SearchResultModel(QAbstractListModel):
+    # Search results and playlist entries as plain dicts. Rows are painted
+    # by ResultDelegate, so hundreds of results cost no widgets.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+        self._rowsByThumb = {} # thumbnail url -> rows showing it
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.results):
+            return None
+        video = self.results[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return video.get('title') or 'N/A'
+        if role == Qt.ItemDataRole.UserRole:
+            return video
+        return None
+
+    def result(self, row):
+        if 0 <= row < len(self.results):
+            return self.results[row]
+        return None
+
+    def setResults(self, results):
+        self.beginResetModel()
+        self.results = list(results)
+        self._rowsByThumb = {}
+        for row, video in enumerate(self.results):
+            self._rowsByThumb.setdefault(video.get('thumbnail'), []).append(row)
+        self.endResetModel()
+
+    def clear(self):
+        self.setResults([])
+
+    def appendResult(self, video):
+        row = len(self.results)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.results.append(video)
+        self._rowsByThumb.setdefault(video.get('thumbnail'), []).append(row)
+        self.endInsertRows()
+
+    def thumbnailLoaded(self, url):
+        # Repaint just the rows waiting on this thumbnail
+        for row in self._rowsByThumb.get(url, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+LOG_LINES = 200 # per job; older lines fall off like the old windows' log did
+
+STATE_LABELS = {'queued': "Queued", 'running': "Downloading", 'processing': "Processing", 'done': "Done", 'failed': "Failed", 'paused': "Paused", 'cancelled': "Cancelled"}
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+
+class DownloadRow:
+    __slots__ = ('job_id', 'name', 'state', 'batch', 'percent', 'speed', 'allotted', 'eta', 'result', 'log')
+
+    def __init__(self, job_id, name, state, batch=None):
+        self.job_id = job_id
+        self.name = name
+        self.state = state
+        self.batch = batch
+        self.percent = 0
+        self.speed = None
+        self.allotted = None
+        self.eta = None
+        self.result = None
+        self.log = deque(maxlen=LOG_LINES)
+
+class DownloadTableModel(QAbstractTableModel):
+    # Every job of the download manager as one row of plain values. The
+    # log is kept as a short list of lines and only rendered for the job
+    # selected in the downloads window.
+    NAME, PROGRESS, SPEED, ETA, STATE = range(5)
+    HEADERS = ("Name", "Progress", "Speed", "ETA", "State")
+
+    log_appended = pyqtSignal(int, str) # job id, text
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self._rowsById = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.rows):
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NAME:
+                return row.name
+            if column == self.PROGRESS:
+                return f"{row.percent}%"
+            if column == self.SPEED:
+                if not row.speed or row.state != 'running':
+                    return ""
+                speed = f"{utils.formatBytes(row.speed)}/s"
+                # Actual vs. what the bandwidth manager currently gives this job
+                return f"{speed} of {utils.formatBytes(row.allotted)}/s" if row.allotted else speed
+            if column == self.ETA:
+                return utils.formatEta(row.eta) if row.state == 'running' else ""
+            if column == self.STATE:
+                return STATE_LABELS.get(row.state, row.state)
+        if role == Qt.ItemDataRole.UserRole:
+            return row.percent if column == self.PROGRESS else row.job_id
+        if role == Qt.ItemDataRole.ToolTipRole and column in (self.NAME, self.STATE):
+            return row.result or row.name
+        return None
+
+    def jobId(self, row):
+        if 0 <= row < len(self.rows):
+            return self.rows[row].job_id
+        return None
+
+    def rowOf(self, job_id):
+        return self._rowsById.get(job_id)
+
+    def state(self, job_id):
+        row = self._rowsById.get(job_id)
+        return self.rows[row].state if row is not None else None
+
+    def batch(self, job_id):
+        row = self._rowsById.get(job_id)
+        return self.rows[row].batch if row is not None else None
+
+    def addJob(self, job_id, name, state='queued', batch=None):
+        if job_id in self._rowsById:
+            return
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(DownloadRow(job_id, name or f"Job {job_id}", state, batch))
+        self._rowsById[job_id] = row
+        self.endInsertRows()
+
+    def _update(self, job_id, first, last, **values):
+        row = self._rowsById.get(job_id)
+        if row is None:
+            return
+        for key, value in values.items():
+            setattr(self.rows[row], key, value)
+        self.dataChanged.emit(self.index(row, first), self.index(row, last))
+
+    def setProgress(self, job_id, percent):
+        self._update(job_id, self.PROGRESS, self.PROGRESS, percent=percent)
+
+    def setStats(self, job_id, stats):
+        self._update(job_id, self.PROGRESS, self.ETA, percent=stats.get('percent', 0), speed=stats.get('speed'), allotted=stats.get('allotted'), eta=stats.get('eta'))
+
+    def setState(self, job_id, state, result=None):
+        row = self._rowsById.get(job_id)
+        if row is None:
+            return
+        values = {'state': state}
+        if result is not None:
+            values['result'] = result
+        if state == 'done':
+            values['percent'] = 100
+        self._update(job_id, self.NAME, self.STATE, **values)
+
+    def appendLog(self, job_id, text):
+        row = self._rowsById.get(job_id)
+        if row is None:
+            return
+        self.rows[row].log.append(text)
+        self.log_appended.emit(job_id, text)
+
+    def log(self, job_id):
+        row = self._rowsById.get(job_id)
+        return list(self.rows[row].log) if row is not None else []
+
+    def removeFinished(self):
+        # Clears done, failed and cancelled rows, returns their job ids
+        removed = [row.job_id for row in self.rows if row.state in FINISHED_STATES]
+        if removed:
+            self.beginResetModel()
+            self.rows = [row for row in self.rows if row.state not in FINISHED_STATES]
+            self._rowsById = {row.job_id: index for index, row in enumerate(self.rows)}
+            self.endResetModel()
+        return removed
@@ -0,0 +1,108 @@
+# FFmpeg post-processing (merging, audio extraction, thumbnail embedding)
+# in worker processes. A download hands its finished files over here and
+# frees its slot for the next transfer; the encodes of several downloads
+# run side by side on all cores.
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+import multiprocessing
+import threading
+import time
+import os
+
+CANCEL_POLL = 0.25 # seconds between checks for a cancel while waiting on a worker
+
+class CollectingLogger:
+    # Worker processes can't reach the job's logger, lines go back with the result
+    def __init__(self):
+        self.lines = []
+
+    def debug(self, msg):
+        self.lines.append(('debug', msg))
+
+    def info(self, msg):
+        self.lines.append(('info', msg))
+
+    def warning(self, msg):
+        self.lines.append(('warning', msg))
+
+    def error(self, msg):
+        self.lines.append(('error', msg))
+
+def runPostProcessing(task):
+    # Runs in a worker process: the same post_process call yt-dlp would
+    # have made at the end of process_info
+    from yt_dlp import YoutubeDL, postprocessor
+    from metrics import PPTimer
+    logger = CollectingLogger()
+    timer = PPTimer()
+    try:
+        with YoutubeDL(dict(task['params'], logger=logger, postprocessor_hooks=[timer.hook])) as ydl:
+            info = dict(task['info'])
+            # Merger and fixups are per-download instances, rebuilt by name
+            info['__postprocessors'] = [getattr(postprocessor, name)(ydl) for name in task['postprocessors']]
+            info = ydl.post_process(task['filename'], info, task['files_to_move'])
+    except Exception as e:
+        return False, str(e), logger.lines, timer.timings
+    return True, info.get('filepath') or task['filename'], logger.lines, timer.timings
+
+class PostProcessPool:
+    def __init__(self, workers=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the GUI process has Qt and download threads running
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def setWorkers(self, workers=None):
+        # Queued and running encodes finish on the old executor
+        workers = max(1, workers or os.cpu_count() or 1)
+        with self._lock:
+            if workers == self.workers:
+                return
+            self.workers = workers
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def submit(self, task):
+        return self._pool().submit(runPostProcessing, task)
+
+    def run(self, tasks, logger, metrics=None, cancelled=None):
+        # Blocks the calling (download) thread, not a download slot. A
+        # cancel drops steps still waiting for a worker; FFmpeg already
+        # running is left to finish.
+        filename = None
+        for task in tasks:
+            if cancelled and cancelled():
+                return False, "Cancelled"
+            started = time.perf_counter()
+            future = self.submit(task)
+            try:
+                while True:
+                    try:
+                        success, result, lines, timings = future.result(timeout=CANCEL_POLL)
+                        break
+                    except TimeoutError:
+                        if cancelled and cancelled() and future.cancel():
+                            return False, "Cancelled"
+            except Exception as e:
+                # Worker crashed or the pool was shut down
+                return False, f"Post-processing failed: {e!r}"
+            if metrics is not None:
+                metrics.addPostProcessing(timings, time.perf_counter() - started)
+            for level, line in lines:
+                getattr(logger, level)(line)
+            if not success:
+                return False, result
+            filename = result
+        return True, filename
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,28 @@
+# yt-dlp post-processors used by utils.downloadVideo. Kept out of utils so
+# importing utils doesn't pull in yt_dlp before it's needed.
+from yt_dlp.postprocessor import PostProcessor
+from yt_dlp.utils import replace_extension
+import shutil
+import os
+import utils
+
+class CachedThumbnailPP(PostProcessor):
+    # Runs before yt-dlp writes thumbnails, so writethumbnail finds
+    # the cached file already in place and skips the download
+    def run(self, info):
+        path = utils.cachedThumbnail(info.get("thumbnail") or "")
+        if not path:
+            return [], info
+
+        ext = os.path.splitext(path)[1].lstrip('.')
+        target = replace_extension(
+            self._downloader.prepare_filename(info, 'thumbnail'), ext, info.get('ext'))
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+            shutil.copyfile(path, target)
+        except OSError as e:
+            self.report_warning(f"Could not reuse cached thumbnail: {e}")
+            return [], info
+
+        info['thumbnails'] = [{'id': 'cached', 'url': info['thumbnail'], 'ext': ext}]
+        return [], info
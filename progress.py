@@ -0,0 +1,105 @@
+from collections import deque
+import time
+
+REPORT_INTERVAL = 0.1   # at most 10 updates per second per job
+MAX_LOG_LINES = 200     # lines kept between two flushes
+
+class ProgressReporter:
+    # Sits between yt-dlp's hooks/logger and whatever displays them, so a
+    # fast download can't flood the receiver with one event per chunk
+    def __init__(self, on_progress, on_log, interval=REPORT_INTERVAL, max_lines=MAX_LOG_LINES):
+        self.onProgress = on_progress
+        self.onLog = on_log
+        self.interval = interval
+        self._lines = deque(maxlen=max_lines)
+        self._dropped = 0
+        self._lastProgress = 0.0
+        self._lastLog = 0.0
+        self._lastPercent = -1
+        self._files = {} # filename -> [downloaded, total, speed], one per stream (video, audio)
+
+    def hook(self, d):
+        status = d.get('status')
+        name = d.get('filename') or d.get('tmpfilename')
+        if status == 'downloading':
+            self._files[name] = [
+                d.get('downloaded_bytes') or 0,
+                d.get('total_bytes') or d.get('total_bytes_estimate') or 0,
+                d.get('speed')
+            ]
+            now = time.monotonic()
+            if now - self._lastProgress < self.interval:
+                return
+            self._lastProgress = now
+            self._report(d)
+            self.flush(now)
+        elif status == 'finished':
+            size = d.get('total_bytes') or d.get('downloaded_bytes') or self._files.get(name, [0])[0]
+            self._files[name] = [size, size, None]
+            self._report(d, finished=True)
+            self.log("Download Complete. Processing...")
+            self.flush()
+
+    def _report(self, d, finished=False):
+        # Streams downloading side by side add up to one progress value
+        files = self._files.values()
+        downloaded = sum(f[0] for f in files)
+        total = sum(f[1] for f in files)
+        known = sum(f[0] for f in files if f[1])
+        speeds = [f[2] for f in files if f[2]]
+        speed = sum(speeds) if speeds else None
+        if finished and all(f[0] >= f[1] for f in files):
+            percent = 100
+        elif total:
+            percent = min(100, int(known * 100 / total))
+        else:
+            percent = max(self._lastPercent, 0)
+        self._lastPercent = percent
+
+        self.onProgress({
+            "percent": percent,
+            "downloaded": downloaded,
+            "total": total or None,
+            "speed": speed,
+            "eta": int((total - known) / speed) if speed and total else d.get('eta'),
+            "fragment": d.get('fragment_index'),
+            "fragments": d.get('fragment_count'),
+            "filename": d.get('filename'),
+            "tmpfilename": d.get('tmpfilename')
+        })
+
+    def log(self, msg, urgent=False):
+        if len(self._lines) == self._lines.maxlen:
+            self._dropped += 1
+        self._lines.append(msg)
+        now = time.monotonic()
+        if urgent or now - self._lastLog >= self.interval:
+            self.flush(now)
+
+    def flush(self, now=None):
+        self._lastLog = now or time.monotonic()
+        if not self._lines:
+            return
+        lines = list(self._lines)
+        self._lines.clear()
+        if self._dropped:
+            lines.insert(0, f"... {self._dropped} log lines skipped")
+            self._dropped = 0
+        self.onLog("\n".join(lines))
+
+class ReporterLogger:
+    # yt-dlp logger interface on top of a ProgressReporter
+    def __init__(self, reporter):
+        self.reporter = reporter
+
+    def debug(self, msg):
+        self.reporter.log(msg)
+
+    def info(self, msg):
+        self.reporter.log(msg)
+
+    def warning(self, msg):
+        self.reporter.log(f"WARNING: {msg}", urgent=True)
+
+    def error(self, msg):
+        self.reporter.log(f"ERROR: {msg}", urgent=True)
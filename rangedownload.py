@@ -0,0 +1,415 @@
+# Parallel byte-range downloads for plain HTTP(S) formats. YouTube throttles
+# each connection, so fetching ranges of one file over several connections
+# scales until the link itself is full. The video and audio streams of a
+# merged format are also fetched side by side instead of one after the
+# other. Imported lazily: it pulls in yt-dlp.
+from yt_dlp import YoutubeDL
+from yt_dlp.downloader.common import FileDownloader
+from yt_dlp.downloader.http import HttpFD
+from yt_dlp.networking import Request
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+from yt_dlp.utils import DownloadError
+import threading
+import pickle
+import time
+import json
+import re
+import os
+
+MIN_CONNECTIONS = 2
+CHUNK_SIZE = 2 * 1024 * 1024     # one range request
+MIN_CHUNK_SIZE = 256 * 1024
+BLOCK_SIZE = 64 * 1024           # one read/write, and one progress hook call
+ADAPT_INTERVAL = 1.0             # seconds between throughput measurements
+GROWTH_THRESHOLD = 1.1           # keep adding connections while a step buys 10% more
+RETRY_SLEEP = 1.0
+
+# Params that only make sense in this process, left out of deferred post-processing
+LOCAL_PARAMS = ('logger', 'progress_hooks', 'postprocessor_hooks', 'defer_postprocessing')
+
+CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+
+class RangeUnsupported(Exception):
+    pass
+
+def rangeable(name, info, params):
+    # Single-file HTTP(S) formats only; manifests and merged formats use yt-dlp's own downloaders.
+    # A half-done ranged download must be finished the same way, its .part is sparse.
+    return (
+        ((params.get('parallel_connections') or 1) > 1 or os.path.isfile(f'{name}.part.ranges'))
+        and info.get('protocol', 'https') in ('http', 'https')
+        and not info.get('requested_formats')
+        and not (info.get('url') or '').startswith('data:')
+    )
+
+class StreamDownload(threading.Thread):
+    # One stream of a merged format running next to the others
+    def __init__(self, download, name, info):
+        super().__init__(daemon=True)
+        self.download = download
+        self.name = name
+        self.info = info
+        self.result = (False, False)
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self.download(self.name, self.info)
+        except BaseException as e:
+            self.error = e
+
+class RangedYoutubeDL(YoutubeDL):
+    # YoutubeDL for the download side. Routes eligible formats to
+    # ParallelRangeFD and, with 'parallel_streams', starts every stream of a
+    # merged format at once; the merge runs when the last one is done.
+    # With 'defer_postprocessing' (a list) the post-processing is queued
+    # there for postpool instead of running on the download thread.
+    def __init__(self, params=None, auto_init=True):
+        self._hookLock = threading.Lock()
+        self._streams = []
+        self._streamsLeft = 0
+        super().__init__(params, auto_init)
+
+    def add_progress_hook(self, ph):
+        # Streams running side by side report from their own threads
+        def locked(d):
+            with self._hookLock:
+                ph(d)
+        super().add_progress_hook(locked)
+
+    def process_info(self, info_dict):
+        formats = info_dict.get('requested_formats') or []
+        if self.params.get('parallel_streams') and len(formats) > 1:
+            self._streamsLeft = len(formats)
+        try:
+            return super().process_info(info_dict)
+        finally:
+            self._streamsLeft = 0
+            # Never leave a stream writing after an error elsewhere
+            self._joinStreams()
+            self._streams = []
+
+    def post_process(self, filename, info, files_to_move=None):
+        deferred = self.params.get('defer_postprocessing')
+        pps = info.get('__postprocessors') or []
+        if deferred is None or not (pps or self._pps['post_process'] or self._pps['after_move']):
+            return super().post_process(filename, info, files_to_move)
+
+        task = {
+            'params': {k: v for k, v in self.params.items() if k not in LOCAL_PARAMS},
+            'filename': filename,
+            'info': {k: v for k, v in info.items() if k != '__postprocessors'},
+            'files_to_move': dict(files_to_move or {}),
+            'postprocessors': [type(pp).__name__ for pp in pps],
+        }
+        try:
+            pickle.dumps(task)
+        except Exception:
+            # Something in the info can't cross to another process, run it here
+            return super().post_process(filename, info, files_to_move)
+        deferred.append(task)
+        info['filepath'] = filename
+        return info
+
+    def dl(self, name, info, subtitle=False, test=False):
+        if not self._streamsLeft or subtitle or test or name == '-' or info.get('requested_formats'):
+            # Not one of a merge's per-stream calls (e.g. ffmpeg downloads them together)
+            self._streamsLeft = 0
+            return self._download(name, info, subtitle, test)
+
+        self._streamsLeft -= 1
+        if self._streamsLeft:
+            # yt-dlp calls dl() once per stream and waits for each; hand it
+            # back straight away so it moves on to the next stream
+            stream = StreamDownload(self._download, name, info)
+            self._streams.append(stream)
+            stream.start()
+            return True, True
+
+        success, real_download = self._download(name, info)
+        errors = self._joinStreams()
+        if errors:
+            raise errors[0]
+        for stream in self._streams:
+            success = success and stream.result[0]
+            real_download = real_download or stream.result[1]
+        self._streams = []
+        return success, real_download
+
+    def _joinStreams(self):
+        for stream in self._streams:
+            stream.join()
+        return [stream.error for stream in self._streams if stream.error is not None]
+
+    def _download(self, name, info, subtitle=False, test=False):
+        if subtitle or test or name == '-' or not info.get('url') or not rangeable(name, info, self.params):
+            return super().dl(name, info, subtitle, test)
+
+        fd = ParallelRangeFD(self, self.params)
+        for ph in self._progress_hooks:
+            fd.add_progress_hook(ph)
+        self.write_debug(f'Invoking {fd.FD_NAME} downloader on "{info["url"]}"')
+        new_info = self._copy_infodict(info)
+        if new_info.get('http_headers') is None:
+            new_info['http_headers'] = self._calc_headers(new_info)
+        return fd.download(name, new_info, subtitle)
+
+class ParallelRangeFD(FileDownloader):
+    # Splits the file into chunks and fetches them over a pool of connections
+    # whose size follows measured throughput. Chunks are written straight to
+    # their offset in a preallocated .part file, so memory use stays at one
+    # block per connection. Done chunks are listed in a .ranges sidecar so an
+    # interrupted download resumes without refetching them.
+    FD_NAME = 'parallelrange'
+
+    def real_download(self, filename, info_dict):
+        try:
+            total = self._probe(info_dict)
+        except RangeUnsupported as e:
+            self.to_screen(f'[download] {e}; falling back to a single connection')
+            return self._fallback(filename, info_dict)
+
+        tmpfilename = self.temp_name(filename)
+        self.report_destination(filename)
+        max_connections = max(MIN_CONNECTIONS, int(self.params.get('parallel_connections') or 1))
+        chunk_size = max(MIN_CHUNK_SIZE, min(CHUNK_SIZE, total // (max_connections * 4) or MIN_CHUNK_SIZE))
+        chunk_size, done = self._loadDone(tmpfilename, total, chunk_size)
+        chunks = [(start, min(start + chunk_size, total) - 1) for start in range(0, total, chunk_size)]
+
+        self.info = info_dict
+        self.filename = filename
+        self.tmpfilename = tmpfilename
+        self.total = total
+        self.chunks = chunks
+        self.done = done
+        self.downloaded = sum(chunks[i][1] - chunks[i][0] + 1 for i in done)
+        self.resumed = self.downloaded
+        self.pending = [i for i in range(len(chunks)) if i not in done]
+        self.target = MIN_CONNECTIONS
+        self.active = 0
+        self.error = None
+        self.start = time.time()
+        self._lock = threading.Lock()
+        self._fileLock = threading.Lock()
+        self._hookLock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads = []
+
+        if self.resumed:
+            self.to_screen(f'[download] Resuming with {len(done)} of {len(chunks)} chunks already done')
+        self._saveDone()
+        # Not sanitize_open: its file locking only knows sequential modes
+        self.stream = open(tmpfilename, 'r+b' if os.path.isfile(tmpfilename) else 'w+b')
+        try:
+            self.stream.truncate(total)
+            self._run(max_connections)
+        finally:
+            self._stopped.set()
+            for thread in self._threads:
+                thread.join()
+            self.stream.close()
+
+        if self.error is not None:
+            self._saveDone()
+            raise self.error
+        if len(self.done) != len(chunks):
+            # Never rename a file with holes; what is done stays listed for a retry
+            self._saveDone()
+            raise DownloadError(f'Only {len(self.done)} of {len(chunks)} chunks were downloaded')
+
+        self.try_rename(self.tmpfilename, filename)
+        self.try_remove(self._donePath())
+        self._hook_progress({
+            'downloaded_bytes': total,
+            'total_bytes': total,
+            'filename': filename,
+            'status': 'finished',
+            'elapsed': time.time() - self.start,
+        }, info_dict)
+        return True
+
+    def _probe(self, info_dict):
+        headers = {**(info_dict.get('http_headers') or {}), 'Range': 'bytes=0-0'}
+        try:
+            response = self.ydl.urlopen(Request(info_dict['url'], headers=headers))
+        except HTTPError as e:
+            raise RangeUnsupported(f'Range probe failed with HTTP {e.status}')
+        with response:
+            match = CONTENT_RANGE_RE.match(response.headers.get('Content-Range') or '')
+            if response.status != 206 or match is None:
+                raise RangeUnsupported('Server does not accept range requests')
+        total = int(match.group(3))
+        if total < MIN_CHUNK_SIZE * 2:
+            raise RangeUnsupported('File is too small to split')
+        return total
+
+    def _fallback(self, filename, info_dict):
+        fd = HttpFD(self.ydl, self.params)
+        fd._progress_hooks = self._progress_hooks
+        return fd.real_download(filename, info_dict)
+
+    def _donePath(self):
+        return f'{self.tmpfilename}.ranges'
+
+    def _loadDone(self, tmpfilename, total, chunk_size):
+        # Returns (chunk size, indexes of finished chunks); a resumed download keeps its old chunk size
+        if not self.params.get('continuedl', True) or not os.path.isfile(tmpfilename):
+            return chunk_size, set()
+        try:
+            with open(f'{tmpfilename}.ranges', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('total') != total or not state.get('chunk_size'):
+                return chunk_size, set()
+            count = -(-total // state['chunk_size'])
+            return state['chunk_size'], {i for i in state.get('done', []) if 0 <= i < count}
+        except (OSError, ValueError):
+            pass
+        # A .part left by the single-connection downloader holds a prefix of the file
+        size = os.path.getsize(tmpfilename)
+        if size >= total:
+            return chunk_size, set()
+        return chunk_size, set(range(size // chunk_size))
+
+    def _saveDone(self):
+        with self._lock:
+            state = {'total': self.total, 'chunk_size': self.chunks[0][1] + 1, 'done': sorted(self.done)}
+        path = self._donePath()
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(f'{path}.tmp', path)
+
+    def _spawn(self):
+        with self._lock:
+            if not self.pending:
+                return False
+            self.active += 1
+        thread = threading.Thread(target=self._worker, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+        return True
+
+    def _run(self, max_connections):
+        for _ in range(self.target):
+            self._spawn()
+
+        best = 0.0
+        previous = self.target
+        growing = self.target < max_connections
+        last_bytes, last_time = self.downloaded, time.monotonic()
+        while True:
+            with self._lock:
+                if self.active == 0:
+                    break
+            self._stopped.wait(ADAPT_INTERVAL)
+            if self.error is not None:
+                return
+            self._saveDone()
+
+            now = time.monotonic()
+            rate = (self.downloaded - last_bytes) / max(now - last_time, 1e-3)
+            last_bytes, last_time = self.downloaded, now
+            if not growing:
+                continue
+            if rate > best * GROWTH_THRESHOLD and self.target < max_connections:
+                # The last step paid off: double up, like TCP slow start
+                best = rate
+                previous = self.target
+                self.target = min(self.target * 2, max_connections)
+                for _ in range(self.target - previous):
+                    growing = self._spawn()
+            else:
+                # It didn't (or we're at the maximum): the link or our bandwidth cap is the limit now
+                growing = False
+                if rate <= best * GROWTH_THRESHOLD:
+                    self.target = previous
+                self.write_debug(f'Settled on {self.target} connections at {rate / 1024:.0f} KiB/s')
+
+    def _worker(self):
+        index = None
+        counted = True # still in self.active
+        try:
+            while True:
+                with self._lock:
+                    if self._stopped.is_set() or self.active > self.target or not self.pending:
+                        # Decided and counted under one lock: when the target
+                        # drops, workers leave one at a time until it's met
+                        self._leave()
+                        counted = False
+                        return
+                    index = self.pending.pop(0)
+                complete = self._fetchChunk(index)
+                with self._lock:
+                    if complete:
+                        self.done.add(index)
+                    else:
+                        # Cut short by a stop: fetched again on resume, never listed as done
+                        self.pending.insert(0, index)
+                    index = None
+        except BaseException as e:
+            # Includes exceptions raised by progress hooks, e.g. a cancelled job
+            if self.error is None:
+                self.error = e
+            self._stopped.set()
+        finally:
+            if counted:
+                with self._lock:
+                    if index is not None:
+                        self.pending.insert(0, index)
+                    self._leave()
+
+    def _leave(self):
+        # With self._lock held
+        self.active -= 1
+        if self.active == 0:
+            self._stopped.set()
+
+    def _fetchChunk(self, index):
+        # True once the whole range is written, False if a stop cut it short
+        start, end = self.chunks[index]
+        retries = self.params.get('fragment_retries', 10)
+        attempt = 0
+        while True:
+            got = 0
+            try:
+                headers = {**(self.info.get('http_headers') or {}), 'Range': f'bytes={start}-{end}'}
+                with self.ydl.urlopen(Request(self.info['url'], headers=headers)) as response:
+                    if response.status != 206:
+                        raise RangeUnsupported(f'Expected a partial response, got HTTP {response.status}')
+                    while got < end - start + 1 and not self._stopped.is_set():
+                        block = response.read(min(BLOCK_SIZE, end - start + 1 - got))
+                        if not block:
+                            raise TransportError(f'Connection closed after {got} of {end - start + 1} bytes')
+                        with self._fileLock:
+                            self.stream.seek(start + got)
+                            self.stream.write(block)
+                        got += len(block)
+                        self._progress(len(block))
+                return got == end - start + 1
+            except (TransportError, HTTPError) as e:
+                self._progress(-got)
+                attempt += 1
+                if attempt > retries or self._stopped.is_set():
+                    raise
+                self.to_screen(f'[download] Chunk {index + 1}/{len(self.chunks)}: {e}. Retrying ({attempt}/{retries})...')
+                time.sleep(RETRY_SLEEP)
+
+    def _progress(self, count):
+        # One hook call at a time: a bandwidth throttle sleeping in the hook
+        # then holds back every connection of this download together
+        with self._hookLock:
+            with self._lock:
+                self.downloaded += count
+                downloaded = self.downloaded
+            now = time.time()
+            speed = self.calc_speed(self.start, now, downloaded - self.resumed)
+            self._hook_progress({
+                'status': 'downloading',
+                'downloaded_bytes': downloaded,
+                'total_bytes': self.total,
+                'tmpfilename': self.tmpfilename,
+                'filename': self.filename,
+                'eta': self.calc_eta(speed, self.total - downloaded),
+                'speed': speed,
+                'elapsed': now - self.start,
+                'connections': self.active,
+            }, self.info)
@@ -0,0 +1,69 @@
+# Application settings: config.json is read once into memory, every change
+# is written back atomically and announced to the components that care.
+# No Qt here, cli.py and the benchmark import this through utils.
+import threading
+import json
+import os
+
+CONFIG_FILE = os.path.join(os.getcwd(), "config.json")
+SCRATCH_PATH = os.path.join(os.getcwd(), "tmp") # thumbnails and the info cache live below this
+
+class Settings:
+    def __init__(self, path=CONFIG_FILE):
+        self.path = path
+        self._data = self._read()
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print("Failed to read settings:", e)
+            return {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key)
+        # Empty values in the file (e.g. a cleared folder field) mean "use the default"
+        return default if value is None or value == "" else value
+
+    def data(self):
+        with self._lock:
+            return dict(self._data)
+
+    def update(self, changes):
+        # Raises OSError if the file can't be written, memory is left unchanged then
+        with self._lock:
+            changed = {key: value for key, value in changes.items() if self._data.get(key) != value}
+            if not changed:
+                return {}
+            data = dict(self._data, **changed)
+            self._write(data)
+            self._data = data
+            listeners = list(self._listeners)
+        # Called on the updating thread, outside the lock so they can get() freely
+        for callback in listeners:
+            callback(changed)
+        return changed
+
+    def _write(self, data):
+        # Written whole and renamed, a crash mid-save never leaves half a file
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def subscribe(self, callback):
+        # callback(changed) receives a dict of the keys that changed
+        with self._lock:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
@@ -1,11 +1,14 @@
-from PyQt6 import uic
 from PyQt6.QtWidgets import QMainWindow, QFileDialog, QMessageBox
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-import json
+from ui_settingswindow import Ui_SettingsWindow
 import os
 import subprocess
+from downloadmanager import DEFAULT_MAX_WORKERS, DEFAULT_CONNECTIONS
+from bandwidth import parseSchedule
+from infocache import DEFAULT_MAX_BYTES
+import utils
 
-CONFIG_FILE = "config.json"
+MB = 1024 * 1024
 
 class UpdateThread(QThread):
     log = pyqtSignal(str)
@@ -33,16 +36,18 @@ class UpdateThread(QThread):
         
         self.finished_update.emit()
 
-class SettingsWindow(QMainWindow):
+class SettingsWindow(QMainWindow, Ui_SettingsWindow):
+    # Edits utils.settings; whoever cares subscribes there, not to this window
     def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi('settingswindow.ui', self)
+        self.setupUi(self) # generated from settingswindow.ui by buildui.py
         
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Window)
-        self.setFixedSize(500, 380) # Updated size
+        self.setFixedSize(500, 730)
         
         self.closeButton.clicked.connect(self.close)
         self.browseButton.clicked.connect(self.onBrowseClicked)
+        self.scratchBrowseButton.clicked.connect(self.onScratchBrowseClicked)
         self.saveButton.clicked.connect(self.onSaveClicked)
         self.updateButton.clicked.connect(self.onUpdateClicked)
         
@@ -50,19 +55,27 @@ class SettingsWindow(QMainWindow):
         self.updateThread = None
         
     def loadSettings(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.pathEdit.setText(data.get('default_path', ''))
-            except:
-                pass
+        settings = utils.settings
+        self.pathEdit.setText(settings.get('default_path', ''))
+        self.workersSpin.setValue(int(settings.get('max_downloads', DEFAULT_MAX_WORKERS)))
+        self.connectionsSpin.setValue(int(settings.get('connections', DEFAULT_CONNECTIONS)))
+        self.bandwidthSpin.setValue(int(settings.get('bandwidth_limit', 0)))
+        self.scheduleEdit.setText(settings.get('bandwidth_schedule', ''))
+        self.ppWorkersSpin.setValue(int(settings.get('postprocess_workers', 0)))
+        self.thumbCacheSpin.setValue(int(settings.get('thumbnail_cache_mb', utils.THUMB_CACHE_BYTES // MB)))
+        self.infoCacheSpin.setValue(int(settings.get('info_cache_mb', DEFAULT_MAX_BYTES // MB)))
+        self.scratchEdit.setText(settings.get('scratch_dir', ''))
 
     def onBrowseClicked(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Default Download Folder")
         if folder:
             self.pathEdit.setText(folder)
 
+    def onScratchBrowseClicked(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Scratch Folder")
+        if folder:
+            self.scratchEdit.setText(folder)
+
     def onUpdateClicked(self):
         self.updateButton.setEnabled(False)
         self.updateLog.clear()
@@ -84,11 +97,32 @@ class SettingsWindow(QMainWindow):
         if path and not os.path.isdir(path):
             QMessageBox.warning(self, "Invalid Path", "The selected path does not exist.")
             return
+
+        scratch = self.scratchEdit.text().strip()
+        if scratch and not os.path.isdir(scratch):
+            QMessageBox.warning(self, "Invalid Path", "The scratch folder does not exist.")
+            return
+
+        schedule = self.scheduleEdit.text().strip()
+        try:
+            parseSchedule(schedule)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Schedule", f"{e}\nUse entries like 09:00-18:00=500 (KB/s), separated by commas.")
+            return
             
-        data = {'default_path': path}
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(data, f)
+            # Keys this window doesn't edit are kept
+            utils.settings.update({
+                'default_path': path,
+                'max_downloads': self.workersSpin.value(),
+                'connections': self.connectionsSpin.value(),
+                'bandwidth_limit': self.bandwidthSpin.value(),
+                'bandwidth_schedule': schedule,
+                'postprocess_workers': self.ppWorkersSpin.value(),
+                'thumbnail_cache_mb': self.thumbCacheSpin.value(),
+                'info_cache_mb': self.infoCacheSpin.value(),
+                'scratch_dir': scratch
+            })
             QMessageBox.information(self, "Saved", "Settings saved successfully.")
             self.close()
         except Exception as e:
@@ -104,12 +138,3 @@ class SettingsWindow(QMainWindow):
         if event.buttons() == Qt.MouseButton.LeftButton and hasattr(self, "dragPos"):
             self.move(event.globalPosition().toPoint() - self.dragPos)
             event.accept()
-
-def load_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
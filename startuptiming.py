@@ -0,0 +1,41 @@
+# Records how long each startup phase takes. Set CRTUBE_STARTUP_TIMING=1 to
+# print the report and append it to startup_timing.jsonl in the scratch folder
+# for comparison.
+import time
+import json
+import sys
+import os
+
+START = time.perf_counter()
+REPORT_PATH = os.path.join(os.getcwd(), 'tmp/startup_timing.jsonl')
+
+_phases = []
+_last = START
+
+def mark(phase):
+    global _last
+    now = time.perf_counter()
+    _phases.append((phase, now - _last))
+    _last = now
+
+def enabled():
+    return os.environ.get('CRTUBE_STARTUP_TIMING') not in (None, '', '0')
+
+def report(path=REPORT_PATH):
+    phases = {name: round(seconds * 1000, 1) for name, seconds in _phases}
+    total = round((_last - START) * 1000, 1)
+    if not enabled():
+        return phases, total
+
+    lines = [f"{name:<24}{ms:>9.1f} ms" for name, ms in phases.items()]
+    lines.append(f"{'total':<24}{total:>9.1f} ms")
+    if sys.stderr:
+        print("\n".join(lines), file=sys.stderr)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a') as f:
+            f.write(json.dumps({"time": time.time(), "total_ms": total, "phases_ms": phases}) + "\n")
+    except OSError:
+        pass
+    return phases, total
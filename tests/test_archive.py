@@ -0,0 +1,47 @@
+# The download archive must tell an original audio stream from a converted copy
+import tempfile
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive import DownloadArchive
+
+class AudioFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.archive = DownloadArchive(os.path.join(self.folder.name, 'archive.sqlite'))
+
+    def tearDown(self):
+        self.archive.close()
+        self.folder.cleanup()
+
+    def write(self, name):
+        path = os.path.join(self.folder.name, name)
+        with open(path, 'wb') as f:
+            f.write(b'audio')
+        return path
+
+    def test_mp3_is_not_satisfied_by_the_original_stream(self):
+        path = self.write('song.opus')
+        self.archive.record('dQw4w9WgXcQ', True, '251', path)
+        self.assertIsNone(self.archive.find('dQw4w9WgXcQ', True, '251', 'mp3'))
+        self.assertEqual(self.archive.find('dQw4w9WgXcQ', True, '251')['path'], path)
+
+    def test_original_is_not_satisfied_by_an_mp3(self):
+        path = self.write('song.mp3')
+        self.archive.record('dQw4w9WgXcQ', True, '251', path, 'mp3')
+        self.assertIsNone(self.archive.find('dQw4w9WgXcQ', True, '251'))
+        self.assertEqual(self.archive.find('dQw4w9WgXcQ', True, '251', 'mp3')['path'], path)
+
+    def test_scan_keys_mp3_files_as_conversions(self):
+        self.write('A [dQw4w9WgXcQ].mp3')
+        self.write('B [aB3dE5fG7hI].m4a')
+        self.assertEqual(self.archive.scan(self.folder.name), 2)
+        self.assertIsNotNone(self.archive.find('dQw4w9WgXcQ', True, None, 'mp3'))
+        self.assertIsNone(self.archive.find('dQw4w9WgXcQ', True))
+        self.assertIsNotNone(self.archive.find('aB3dE5fG7hI', True))
+
+if __name__ == '__main__':
+    unittest.main()
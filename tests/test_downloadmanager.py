@@ -0,0 +1,78 @@
+# Queue bookkeeping of the download manager, without starting any transfer
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloadmanager import DownloadManager, RUNNING, QUEUED, PAUSED, FAILED, CANCELLED
+from jobcontrol import PAUSE, CANCEL
+
+class IdleManager(DownloadManager):
+    # Takes the slot but never starts a thread
+    def _start(self, job):
+        job.state = RUNNING
+        self._running.add(job.id)
+
+class QueueTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = IdleManager(1)
+        self.running = self.manager.submit('https://example.com/a', {})
+        self.queued = self.manager.submit('https://example.com/b', {})
+
+    def test_pause_and_resume_while_queued_counts_once(self):
+        self.assertEqual(self.manager.queuedCount(), 1)
+        self.manager.pause(self.queued)
+        self.assertEqual(self.manager.queuedCount(), 0)
+        self.manager.resume(self.queued)
+        self.assertEqual(self.manager.queuedCount(), 1)
+        self.assertEqual(len(self.manager._queue), 1)
+
+    def test_resumed_job_goes_behind_jobs_queued_meanwhile(self):
+        self.manager.pause(self.queued)
+        later = self.manager.submit('https://example.com/c', {})
+        self.manager.resume(self.queued)
+        self.manager._running.discard(self.running)
+        self.manager._schedule()
+        self.assertEqual(self.manager.job(later).state, RUNNING)
+        self.assertEqual(self.manager.job(self.queued).state, QUEUED)
+
+class PauseTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = IdleManager(1)
+        self.job = self.manager.submit('https://example.com/a', {})
+        self.manager.pause(self.job)
+
+    def test_thread_reporting_the_stop_pauses_the_job(self):
+        self.manager._onFinished(self.job, False, "Paused", PAUSE)
+        self.assertEqual(self.manager.job(self.job).state, PAUSED)
+
+    def test_failure_after_a_pause_click_is_still_a_failure(self):
+        error = "ERROR: Postprocessing: Conversion failed!"
+        self.manager._onFinished(self.job, False, error)
+        job = self.manager.job(self.job)
+        self.assertEqual(job.state, FAILED)
+        self.assertEqual(job.result, error)
+        self.assertFalse(self.manager.resume(self.job))
+
+class CancelBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = IdleManager(1)
+        self.batch = self.manager.createBatch(3, 'playlist')
+        self.running = self.manager.submit('https://example.com/a', {}, batch=self.batch)
+        self.queued = self.manager.submit('https://example.com/b', {}, batch=self.batch)
+        self.finished = []
+        self.manager.batch_finished.connect(lambda batch_id, succeeded, failed: self.finished.append((batch_id, succeeded, failed)))
+
+    def test_unresolved_entries_count_as_failed(self):
+        self.assertTrue(self.manager.cancelBatch(self.batch))
+        self.assertEqual(self.manager.job(self.queued).state, CANCELLED)
+        self.assertTrue(self.manager.job(self.running).control.cancelled())
+        # The third entry was never resolved; only the running job is left
+        self.assertEqual(self.finished, [])
+        self.manager._onFinished(self.running, False, "Cancelled", CANCEL)
+        self.assertEqual(self.finished, [(self.batch, 0, 3)])
+        self.assertFalse(self.manager.cancelBatch(self.batch))
+
+if __name__ == '__main__':
+    unittest.main()
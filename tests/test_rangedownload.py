@@ -0,0 +1,96 @@
+# Interrupted parallel range downloads must resume into a byte-identical file
+import threading
+import tempfile
+import unittest
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark
+from rangedownload import ParallelRangeFD, RangedYoutubeDL
+
+SIZE = 4 * 1024 * 1024
+
+class Stop(Exception):
+    pass
+
+class QuietLogger(benchmark.QuietLogger):
+    def error(self, msg):
+        pass
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.payload = os.urandom(SIZE)
+        # Slow enough that every connection is mid-chunk when the stop comes
+        self.server = benchmark.startServer({'/file.bin': self.payload}, 1024 * 1024)
+        self.folder = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.folder.name, 'file.bin')
+        self.info = {'id': 'file', 'url': benchmark.serverURL(self.server, '/file.bin'), 'ext': 'bin', 'http_headers': {}}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.folder.cleanup()
+
+    def download(self, hook=None, **params):
+        ydl = RangedYoutubeDL(dict({'logger': QuietLogger(), 'parallel_connections': 4, 'fragment_retries': 0}, **params))
+        fd = ParallelRangeFD(ydl, ydl.params)
+        if hook is not None:
+            fd.add_progress_hook(hook)
+        try:
+            return fd.download(self.filename, dict(self.info))
+        finally:
+            ydl.close()
+
+    def stopAfter(self, limit):
+        def hook(d):
+            if d.get('status') == 'downloading' and d.get('downloaded_bytes', 0) >= limit:
+                raise Stop()
+        return hook
+
+    def assertComplete(self):
+        with open(self.filename, 'rb') as f:
+            self.assertTrue(f.read() == self.payload, "resumed file differs from the original")
+
+    def test_resume_after_stop(self):
+        with self.assertRaises(Stop):
+            self.download(self.stopAfter(SIZE // 3), parallel_connections=8)
+        self.assertTrue(os.path.isfile(self.filename + '.part.ranges'))
+        self.download()
+        self.assertComplete()
+
+    def test_resume_after_several_stops(self):
+        for fraction in (5, 3, 2):
+            with self.assertRaises(Stop):
+                self.download(self.stopAfter(SIZE // fraction))
+        self.download()
+        self.assertComplete()
+
+class WorkerTest(unittest.TestCase):
+    def test_shrinking_target_leaves_no_chunk_behind(self):
+        # Every worker sees the target drop at once; the last one must keep going
+        fd = ParallelRangeFD(RangedYoutubeDL({'logger': QuietLogger()}), {})
+        fd.chunks = [(i, i) for i in range(40)]
+        fd.pending = list(range(40))
+        fd.done = set()
+        fd.error = None
+        fd._lock = threading.Lock()
+        fd._stopped = threading.Event()
+        fd.target = 8
+        fd.active = 8
+        def fetch(index):
+            fd.target = 1
+            time.sleep(0.002)
+            return True
+        fd._fetchChunk = fetch
+        workers = [threading.Thread(target=fd._worker) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(fd.active, 0)
+        self.assertEqual(fd.done, set(range(40)))
+
+if __name__ == '__main__':
+    unittest.main()
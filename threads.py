@@ -1,65 +1,223 @@
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from collections import OrderedDict
+from jobcontrol import DownloadStopped, CANCEL
 import utils
+import progress
 
 class SearchThread(QThread):
-    results_ready = pyqtSignal(list)
+    result_found = pyqtSignal(int, dict) # index in the session, result
+    results_ready = pyqtSignal(list)     # whole page, once it is complete
 
-    def __init__(self, query):
+    def __init__(self, query, session=None):
         super().__init__()
         self.query = query
+        self.session = session or utils.SearchSession(query)
 
     def run(self):
-        results = utils.search(self.query)
+        results = []
+        for result in self.session.nextPage():
+            if self.isInterruptionRequested():
+                break
+            results.append(result)
+            self.result_found.emit(self.session.count - 1, result)
+        if self.isInterruptionRequested():
+            # Superseded by a newer query: the session is dropped, give its pooled instance back
+            self.session.close()
+            return
         self.results_ready.emit(results)
 
 class VideoInfoThread(QThread):
     result_ready = pyqtSignal(dict)
 
-    def __init__(self, url):
+    def __init__(self, url, cache=None):
         super().__init__()
         self.url = url
+        self.cache = cache
 
     def run(self):
-        videoInfo = utils.getVideoInfo(self.url)
+        videoInfo = utils.getVideoInfo(self.url, self.cache)
         self.result_ready.emit(videoInfo)
 
+class PlaylistThread(QThread):
+    playlist_ready = pyqtSignal(dict)
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        try:
+            playlist = utils.getPlaylistEntries(self.url)
+        except Exception as e:
+            playlist = {"url": self.url, "entries": [], "error": str(e)}
+        self.playlist_ready.emit(playlist)
+
+class PlaylistResolveThread(QThread):
+    entry_resolved = pyqtSignal(int, dict)
+    entry_failed = pyqtSignal(int, str)
+
+    def __init__(self, urls, workers=utils.PLAYLIST_WORKERS, cache=None):
+        super().__init__()
+        self.urls = urls
+        self.workers = workers
+        self.cache = cache
+
+    def run(self):
+        # Entries come back in completion order, not playlist order
+        for index, info, error in utils.resolveEntries(self.urls, self.workers, self.cache, self.isInterruptionRequested):
+            if self.isInterruptionRequested():
+                # Cancelled batch or closing window; extractions in flight are waited for and dropped
+                break
+            if info is not None:
+                self.entry_resolved.emit(index, info)
+            else:
+                self.entry_failed.emit(index, error or "Unknown error")
+
+THUMB_SIZE = (260, 146)
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, url, signal):
+        super().__init__()
+        self.url = url
+        self.signal = signal
+
+    def run(self):
+        success, path = utils.downloadThumbnail(self.url)
+        image = QImage()
+        if success and image.load(path):
+            # QImage can be decoded and scaled off the GUI thread, QPixmap can't
+            image = image.scaled(*THUMB_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self.signal.emit(self.url, path or "", image)
+
+class ThumbnailLoader(QObject):
+    thumbnail_ready = pyqtSignal(str, str, QPixmap) # url, cached file path, scaled pixmap
+    _loaded = pyqtSignal(str, str, QImage)
+
+    def __init__(self, max_pixmaps=200, workers=6, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(workers)
+        self.maxPixmaps = max_pixmaps
+        self.pixmaps = OrderedDict() # url -> QPixmap, least recently used first
+        self.paths = {}
+        self._pending = set()
+        self._failed = set() # not retried this session, the list view asks on every repaint
+        self._loaded.connect(self._onLoaded)
+
+    def pixmap(self, url):
+        pixmap = self.pixmaps.get(url)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(url)
+        return pixmap
+
+    def request(self, url):
+        # Emits thumbnail_ready right away on a memory hit, otherwise once loaded
+        if not url:
+            return
+        pixmap = self.pixmap(url)
+        if pixmap is not None:
+            self.thumbnail_ready.emit(url, self.paths.get(url, ""), pixmap)
+            return
+        if url in self._pending or url in self._failed:
+            return
+        self._pending.add(url)
+        self.pool.start(ThumbnailTask(url, self._loaded))
+
+    def _onLoaded(self, url, path, image):
+        self._pending.discard(url)
+        if image.isNull():
+            self._failed.add(url)
+            return
+        pixmap = QPixmap.fromImage(image)
+        self.pixmaps[url] = pixmap
+        self.paths[url] = path
+        while len(self.pixmaps) > self.maxPixmaps:
+            old, _ = self.pixmaps.popitem(last=False)
+            self.paths.pop(old, None)
+        self.thumbnail_ready.emit(url, path, pixmap)
+
+class ArchiveScanThread(QThread):
+    finished_scan = pyqtSignal(str, int) # folder, files added
+
+    def __init__(self, archive, folder, titles=None):
+        super().__init__()
+        self.archive = archive
+        self.folder = folder
+        self.titles = titles
+
+    def run(self):
+        added = self.archive.scan(self.folder, self.titles, self.isInterruptionRequested)
+        self.finished_scan.emit(self.folder, added)
+
 class DownloadThread(QThread):
     progress = pyqtSignal(int)
-    log = pyqtSignal(str)
+    stats = pyqtSignal(dict) # percent, downloaded, total, speed, eta
+    log = pyqtSignal(str)    # batches of lines, newline separated
+    transfer_finished = pyqtSignal() # files are down, post-processing is queued
     finished_download = pyqtSignal(bool, str) # success, message/path
+    stopped = pyqtSignal(str) # PAUSE or CANCEL, sent instead of finished_download
 
-    def __init__(self, url, options, is_audio=False, filename=None, path=None):
+    def __init__(self, url, options, is_audio=False, filename=None, path=None, info=None, throttle=None, connections=1, postpool=None, metrics=None, archive=None, control=None, cache=None):
         super().__init__()
         self.url = url
+        self.control = control
+        self.cache = cache
+        self.postpool = postpool
+        self.metrics = metrics
+        self.archive = archive
+        self.throttle = throttle
+        self.connections = connections
+        self.info = info
         self.options = options
         self.is_audio = is_audio
         self.filename = filename
         self.path = path
 
     def run(self):
-        def progress_hook(d):
-            if d['status'] == 'downloading':
-                try:
-                    p = d.get('_percent_str', '0%').replace('%','')
-                    self.progress.emit(int(float(p)))
-                except:
-                    pass
-            elif d['status'] == 'finished':
-                self.progress.emit(100)
-                self.log.emit("Download Complete. Processing...")
-
-        # Logger class to capture output
-        class MyLogger:
-            def __init__(self, signal):
-                self.signal = signal
-            def debug(self, msg):
-                self.signal.emit(msg)
-            def warning(self, msg):
-                self.signal.emit(f"WARNING: {msg}")
-            def error(self, msg):
-                self.signal.emit(f"ERROR: {msg}")
-
-        logger = MyLogger(self.log)
-
-        success, msg = utils.downloadVideo(self.url, self.options, progress_hook, logger, self.is_audio, self.filename, self.path)
-        self.finished_download.emit(success, msg)
\ No newline at end of file
+        def on_progress(stats):
+            if self.throttle is not None:
+                stats["allotted"] = self.throttle.allotted
+                stats["rate"] = self.throttle.rate
+            self.progress.emit(stats["percent"])
+            self.stats.emit(stats)
+
+        # Coalesces yt-dlp's per-chunk callbacks and debug lines before they reach the GUI
+        reporter = progress.ProgressReporter(on_progress, self.log.emit)
+        logger = progress.ReporterLogger(reporter)
+
+        info = self.info
+        if info is None and self.cache is not None:
+            # Queued jobs don't hold the extracted info, it's read back here
+            cached, streams_valid = self.cache.get(utils.videoId(self.url))
+            if cached and streams_valid:
+                info = cached.get('raw_info')
+
+        deferred = [] if self.postpool is not None else None
+        success, msg = utils.downloadVideo(self.url, self.options, reporter.hook, logger, self.is_audio, self.filename, self.path, info, self.throttle, self.connections, deferred, self.metrics, self.archive, self.control)
+        reporter.flush()
+        control = self.control
+        if control is not None and control.stopped() and (not success or (deferred and control.cancelled())):
+            # Stopped mid-transfer, or cancelled before its post-processing.
+            # A pause that came too late to stop the transfer is ignored.
+            self.stop(DownloadStopped(control.reason))
+            return
+        if success and deferred:
+            # Give the download slot back, then wait for the encode off the network path
+            self.transfer_finished.emit()
+            self.log.emit("Post-processing...")
+            success, msg = self.postpool.run(deferred, logger, self.metrics, control.cancelled if control is not None else None)
+            reporter.flush()
+            if not success and control is not None and control.cancelled():
+                self.stop(DownloadStopped(CANCEL))
+                return
+        if success and self.archive is not None:
+            utils.archiveDownload(self.archive, self.url, self.options, self.is_audio, msg)
+        self.finished_download.emit(success, msg)
+
+    def stop(self, stopped):
+        # Partial files are deleted here, off the GUI thread
+        removed = self.control.cleanup()
+        if removed:
+            self.log.emit(f"Removed {removed} partial files")
+        self.stopped.emit(stopped.reason)
@@ -0,0 +1,233 @@
+# Form implementation generated from reading ui file 'downloadswindow.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DownloadsWindow(object):
+    def setupUi(self, DownloadsWindow):
+        DownloadsWindow.setObjectName("DownloadsWindow")
+        DownloadsWindow.resize(900, 610)
+        DownloadsWindow.setStyleSheet("background: #0F0F12;\n"
+"border: 0;")
+        self.centralwidget = QtWidgets.QWidget(parent=DownloadsWindow)
+        self.centralwidget.setStyleSheet("background: #1A1A1F;")
+        self.centralwidget.setObjectName("centralwidget")
+        self.titleFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.titleFrame.setGeometry(QtCore.QRect(0, 0, 900, 30))
+        self.titleFrame.setMinimumSize(QtCore.QSize(900, 30))
+        self.titleFrame.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.titleFrame.setStyleSheet("background: #1A1A1F;")
+        self.titleFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.titleFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.titleFrame.setObjectName("titleFrame")
+        self.windowTitleLabel = QtWidgets.QLabel(parent=self.titleFrame)
+        self.windowTitleLabel.setGeometry(QtCore.QRect(10, 0, 200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.windowTitleLabel.setFont(font)
+        self.windowTitleLabel.setStyleSheet("color: #E5E7EB;")
+        self.windowTitleLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.windowTitleLabel.setObjectName("windowTitleLabel")
+        self.closeButton = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.closeButton.setGeometry(QtCore.QRect(870, 0, 30, 30))
+        self.closeButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.closeButton.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.closeButton.setFont(font)
+        self.closeButton.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #EF4444;\n"
+"}")
+        self.closeButton.setObjectName("closeButton")
+        self.mainFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.mainFrame.setGeometry(QtCore.QRect(0, 30, 900, 580))
+        self.mainFrame.setStyleSheet("background: #0F0F12;")
+        self.mainFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.mainFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.mainFrame.setObjectName("mainFrame")
+        self.jobTable = QtWidgets.QTableView(parent=self.mainFrame)
+        self.jobTable.setGeometry(QtCore.QRect(20, 10, 860, 300))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.jobTable.setFont(font)
+        self.jobTable.setStyleSheet("QTableView {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"        gridline-color: #1A1A1F;\n"
+"        selection-background-color: #27272F;\n"
+"        selection-color: #E5E7EB;\n"
+"      }\n"
+"      QHeaderView::section {\n"
+"        background: #0F0F12;\n"
+"        color: #9CA3AF;\n"
+"        border: 0;\n"
+"        padding: 4px;\n"
+"      }\n"
+"      QScrollBar:vertical {\n"
+"        background: #1A1A1F;\n"
+"        width: 8px;\n"
+"      }\n"
+"      QScrollBar::handle:vertical {\n"
+"        background: #27272F;\n"
+"        border-radius: 4px;\n"
+"      }\n"
+"      QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {\n"
+"        height: 0;\n"
+"      }")
+        self.jobTable.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.jobTable.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.jobTable.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.jobTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.jobTable.setShowGrid(False)
+        self.jobTable.setWordWrap(False)
+        self.jobTable.setObjectName("jobTable")
+        self.jobTable.horizontalHeader().setHighlightSections(False)
+        self.jobTable.verticalHeader().setVisible(False)
+        self.statusLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.statusLabel.setGeometry(QtCore.QRect(20, 320, 170, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.statusLabel.setFont(font)
+        self.statusLabel.setStyleSheet("color: #9CA3AF;")
+        self.statusLabel.setText("")
+        self.statusLabel.setWordWrap(True)
+        self.statusLabel.setObjectName("statusLabel")
+        self.cancelBatchButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.cancelBatchButton.setGeometry(QtCore.QRect(200, 325, 110, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.cancelBatchButton.setFont(font)
+        self.cancelBatchButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }\n"
+"      QPushButton:disabled {\n"
+"        color: #6B7280;\n"
+"      }")
+        self.cancelBatchButton.setObjectName("cancelBatchButton")
+        self.pauseButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.pauseButton.setGeometry(QtCore.QRect(320, 325, 85, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.pauseButton.setFont(font)
+        self.pauseButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }\n"
+"      QPushButton:disabled {\n"
+"        color: #6B7280;\n"
+"      }")
+        self.pauseButton.setObjectName("pauseButton")
+        self.resumeButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.resumeButton.setGeometry(QtCore.QRect(415, 325, 85, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.resumeButton.setFont(font)
+        self.resumeButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }\n"
+"      QPushButton:disabled {\n"
+"        color: #6B7280;\n"
+"      }")
+        self.resumeButton.setObjectName("resumeButton")
+        self.cancelButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.cancelButton.setGeometry(QtCore.QRect(510, 325, 80, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.cancelButton.setFont(font)
+        self.cancelButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }\n"
+"      QPushButton:disabled {\n"
+"        color: #6B7280;\n"
+"      }")
+        self.cancelButton.setObjectName("cancelButton")
+        self.keepPartsCheck = QtWidgets.QCheckBox(parent=self.mainFrame)
+        self.keepPartsCheck.setGeometry(QtCore.QRect(600, 325, 130, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.keepPartsCheck.setFont(font)
+        self.keepPartsCheck.setStyleSheet("color: #9CA3AF;")
+        self.keepPartsCheck.setObjectName("keepPartsCheck")
+        self.clearButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.clearButton.setGeometry(QtCore.QRect(740, 325, 140, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.clearButton.setFont(font)
+        self.clearButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }")
+        self.clearButton.setObjectName("clearButton")
+        self.logOutput = QtWidgets.QTextEdit(parent=self.mainFrame)
+        self.logOutput.setGeometry(QtCore.QRect(20, 370, 860, 190))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(9)
+        self.logOutput.setFont(font)
+        self.logOutput.setStyleSheet("background: #1A1A1F;\n"
+"color: #E5E7EB;\n"
+"border-radius: 5px;\n"
+"padding: 5px;")
+        self.logOutput.setReadOnly(True)
+        self.logOutput.setObjectName("logOutput")
+        DownloadsWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(DownloadsWindow)
+        QtCore.QMetaObject.connectSlotsByName(DownloadsWindow)
+
+    def retranslateUi(self, DownloadsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        DownloadsWindow.setWindowTitle(_translate("DownloadsWindow", "Downloads"))
+        self.windowTitleLabel.setText(_translate("DownloadsWindow", "Downloads"))
+        self.closeButton.setText(_translate("DownloadsWindow", ""))
+        self.cancelBatchButton.setText(_translate("DownloadsWindow", "Cancel Playlist"))
+        self.pauseButton.setText(_translate("DownloadsWindow", "Pause"))
+        self.resumeButton.setText(_translate("DownloadsWindow", "Resume"))
+        self.cancelButton.setText(_translate("DownloadsWindow", "Cancel"))
+        self.keepPartsCheck.setToolTip(_translate("DownloadsWindow", "Leave the .part files of a cancelled download on disk"))
+        self.keepPartsCheck.setText(_translate("DownloadsWindow", "Keep partial files"))
+        self.clearButton.setText(_translate("DownloadsWindow", "Clear Finished"))
+        self.logOutput.setPlaceholderText(_translate("DownloadsWindow", "Select a download to see its log"))
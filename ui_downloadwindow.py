@@ -0,0 +1,123 @@
+# Form implementation generated from reading ui file 'downloadwindow.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DownloadWindow(object):
+    def setupUi(self, DownloadWindow):
+        DownloadWindow.setObjectName("DownloadWindow")
+        DownloadWindow.resize(600, 170)
+        DownloadWindow.setStyleSheet("background: #0F0F12;\n"
+"border: 0;")
+        self.centralwidget = QtWidgets.QWidget(parent=DownloadWindow)
+        self.centralwidget.setStyleSheet("background: #1A1A1F;")
+        self.centralwidget.setObjectName("centralwidget")
+        self.titleFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.titleFrame.setGeometry(QtCore.QRect(0, 0, 600, 30))
+        self.titleFrame.setMinimumSize(QtCore.QSize(600, 30))
+        self.titleFrame.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.titleFrame.setStyleSheet("background: #1A1A1F;")
+        self.titleFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.titleFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.titleFrame.setObjectName("titleFrame")
+        self.windowTitleLabel = QtWidgets.QLabel(parent=self.titleFrame)
+        self.windowTitleLabel.setGeometry(QtCore.QRect(10, 0, 200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.windowTitleLabel.setFont(font)
+        self.windowTitleLabel.setStyleSheet("color: #E5E7EB;")
+        self.windowTitleLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.windowTitleLabel.setObjectName("windowTitleLabel")
+        self.closeButton = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.closeButton.setGeometry(QtCore.QRect(570, 0, 30, 30))
+        self.closeButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.closeButton.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.closeButton.setFont(font)
+        self.closeButton.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #EF4444;\n"
+"}")
+        self.closeButton.setObjectName("closeButton")
+        self.mainFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.mainFrame.setGeometry(QtCore.QRect(0, 30, 600, 140))
+        self.mainFrame.setStyleSheet("background: #0F0F12;")
+        self.mainFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.mainFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.mainFrame.setObjectName("mainFrame")
+        self.filenameEdit = QtWidgets.QLineEdit(parent=self.mainFrame)
+        self.filenameEdit.setGeometry(QtCore.QRect(20, 10, 560, 30))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        self.filenameEdit.setFont(font)
+        self.filenameEdit.setStyleSheet("QLineEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #FF4D6D;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QLineEdit:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.filenameEdit.setObjectName("filenameEdit")
+        self.pathEdit = QtWidgets.QLineEdit(parent=self.mainFrame)
+        self.pathEdit.setGeometry(QtCore.QRect(20, 50, 560, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.pathEdit.setFont(font)
+        self.pathEdit.setStyleSheet("QLineEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QLineEdit:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.pathEdit.setObjectName("pathEdit")
+        self.startDownloadButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.startDownloadButton.setGeometry(QtCore.QRect(20, 90, 560, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.startDownloadButton.setFont(font)
+        self.startDownloadButton.setStyleSheet("QPushButton {\n"
+"        background: #FF4D6D;\n"
+"        color: #1A1A1F;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #FF1F4B;\n"
+"      }\n"
+"    ")
+        self.startDownloadButton.setObjectName("startDownloadButton")
+        DownloadWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(DownloadWindow)
+        QtCore.QMetaObject.connectSlotsByName(DownloadWindow)
+
+    def retranslateUi(self, DownloadWindow):
+        _translate = QtCore.QCoreApplication.translate
+        DownloadWindow.setWindowTitle(_translate("DownloadWindow", "New Download"))
+        self.windowTitleLabel.setText(_translate("DownloadWindow", "New Download"))
+        self.closeButton.setText(_translate("DownloadWindow", ""))
+        self.filenameEdit.setPlaceholderText(_translate("DownloadWindow", "Filename"))
+        self.pathEdit.setPlaceholderText(_translate("DownloadWindow", "Download Path"))
+        self.startDownloadButton.setText(_translate("DownloadWindow", "Start Download"))
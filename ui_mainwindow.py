@@ -0,0 +1,408 @@
+# Form implementation generated from reading ui file 'mainwindow.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1280, 750)
+        MainWindow.setStyleSheet("background: #0F0F12;\n"
+"border: 0;")
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setStyleSheet("background: #1A1A1F;")
+        self.centralwidget.setObjectName("centralwidget")
+        self.titleFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.titleFrame.setGeometry(QtCore.QRect(0, 0, 1280, 30))
+        self.titleFrame.setMinimumSize(QtCore.QSize(1280, 30))
+        self.titleFrame.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.titleFrame.setStyleSheet("background: #1A1A1F;")
+        self.titleFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.titleFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.titleFrame.setObjectName("titleFrame")
+        self.icon = QtWidgets.QLabel(parent=self.titleFrame)
+        self.icon.setGeometry(QtCore.QRect(0, 0, 30, 30))
+        self.icon.setMinimumSize(QtCore.QSize(30, 30))
+        self.icon.setMaximumSize(QtCore.QSize(40, 30))
+        self.icon.setStyleSheet("padding-left: 8px;")
+        self.icon.setText("")
+        self.icon.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.icon.setObjectName("icon")
+        self.title1 = QtWidgets.QLabel(parent=self.titleFrame)
+        self.title1.setGeometry(QtCore.QRect(40, 0, 30, 30))
+        self.title1.setMinimumSize(QtCore.QSize(30, 30))
+        self.title1.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title1.setFont(font)
+        self.title1.setStyleSheet("color: #E5E7EB;")
+        self.title1.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.title1.setObjectName("title1")
+        self.title2 = QtWidgets.QLabel(parent=self.titleFrame)
+        self.title2.setGeometry(QtCore.QRect(70, 0, 1090, 30))
+        self.title2.setMinimumSize(QtCore.QSize(1090, 30))
+        self.title2.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title2.setFont(font)
+        self.title2.setStyleSheet("color: #FF4D6D;")
+        self.title2.setObjectName("title2")
+        self.iconifyButton = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.iconifyButton.setGeometry(QtCore.QRect(1220, 0, 30, 30))
+        self.iconifyButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.iconifyButton.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.iconifyButton.setFont(font)
+        self.iconifyButton.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"    padding-bottom: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #27272F;\n"
+"}")
+        self.iconifyButton.setObjectName("iconifyButton")
+        self.closeButton = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.closeButton.setGeometry(QtCore.QRect(1250, 0, 30, 30))
+        self.closeButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.closeButton.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.closeButton.setFont(font)
+        self.closeButton.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #EF4444;\n"
+"}")
+        self.closeButton.setObjectName("closeButton")
+        self.settings = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.settings.setGeometry(QtCore.QRect(1190, 0, 30, 30))
+        self.settings.setMinimumSize(QtCore.QSize(30, 30))
+        self.settings.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.settings.setFont(font)
+        self.settings.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #27272F;\n"
+"}")
+        self.settings.setObjectName("settings")
+        self.downloads = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.downloads.setGeometry(QtCore.QRect(1160, 0, 30, 30))
+        self.downloads.setMinimumSize(QtCore.QSize(30, 30))
+        self.downloads.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.downloads.setFont(font)
+        self.downloads.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #27272F;\n"
+"}")
+        self.downloads.setObjectName("downloads")
+        self.mainFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.mainFrame.setGeometry(QtCore.QRect(0, 30, 1280, 720))
+        self.mainFrame.setMinimumSize(QtCore.QSize(1280, 720))
+        self.mainFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.mainFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.mainFrame.setObjectName("mainFrame")
+        self.main = QtWidgets.QFrame(parent=self.mainFrame)
+        self.main.setGeometry(QtCore.QRect(0, 0, 980, 720))
+        self.main.setMinimumSize(QtCore.QSize(980, 720))
+        self.main.setStyleSheet("background: #0F0F12;")
+        self.main.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.main.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.main.setObjectName("main")
+        self.searchbar = QtWidgets.QLineEdit(parent=self.main)
+        self.searchbar.setGeometry(QtCore.QRect(40, 20, 900, 40))
+        self.searchbar.setMinimumSize(QtCore.QSize(900, 40))
+        self.searchbar.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.searchbar.setFont(font)
+        self.searchbar.setStyleSheet("QLineEdit {\n"
+"    background: #1A1A1F;\n"
+"    color: #E5E7EB;\n"
+"    padding: 0px 20px;\n"
+"    border: 0;\n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"QLineEdit:hover {\n"
+"    background: #27272F;\n"
+"    color: #FF4D6D;\n"
+"}")
+        self.searchbar.setText("")
+        self.searchbar.setObjectName("searchbar")
+        self.searchList = QtWidgets.QListView(parent=self.main)
+        self.searchList.setGeometry(QtCore.QRect(40, 80, 900, 620))
+        self.searchList.setMinimumSize(QtCore.QSize(900, 620))
+        self.searchList.setStyleSheet("QListView {\n"
+"    background: #1A1A1F;\n"
+"    border: none;\n"
+"    outline: none;\n"
+"}\n"
+"\n"
+"QScrollBar:vertical {\n"
+"    background: #1A1A1F;\n"
+"    width: 8px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical {\n"
+"    background: #27272F;\n"
+"    border-radius: 4px;\n"
+"    min-height: 40px;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {\n"
+"    height: 0;\n"
+"}")
+        self.searchList.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.searchList.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.searchList.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.searchList.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.searchList.setUniformItemSizes(True)
+        self.searchList.setObjectName("searchList")
+        self.progressLabel = QtWidgets.QLabel(parent=self.main)
+        self.progressLabel.setGeometry(QtCore.QRect(40, 700, 900, 20))
+        self.progressLabel.setStyleSheet("color: #E5E7EB;")
+        self.progressLabel.setText("")
+        self.progressLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.progressLabel.setObjectName("progressLabel")
+        self.thumbnailFrame = QtWidgets.QFrame(parent=self.mainFrame)
+        self.thumbnailFrame.setGeometry(QtCore.QRect(980, 0, 300, 720))
+        self.thumbnailFrame.setMinimumSize(QtCore.QSize(300, 720))
+        self.thumbnailFrame.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.thumbnailFrame.setStyleSheet("background: #1A1A1F;")
+        self.thumbnailFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.thumbnailFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.thumbnailFrame.setObjectName("thumbnailFrame")
+        self.tumbTopFrame = QtWidgets.QFrame(parent=self.thumbnailFrame)
+        self.tumbTopFrame.setGeometry(QtCore.QRect(0, 0, 300, 200))
+        self.tumbTopFrame.setMinimumSize(QtCore.QSize(300, 200))
+        self.tumbTopFrame.setMaximumSize(QtCore.QSize(300, 200))
+        self.tumbTopFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.tumbTopFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.tumbTopFrame.setObjectName("tumbTopFrame")
+        self.thumbnail = QtWidgets.QLabel(parent=self.tumbTopFrame)
+        self.thumbnail.setGeometry(QtCore.QRect(20, 27, 260, 146))
+        self.thumbnail.setMinimumSize(QtCore.QSize(260, 146))
+        self.thumbnail.setMaximumSize(QtCore.QSize(260, 146))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(72)
+        font.setBold(True)
+        self.thumbnail.setFont(font)
+        self.thumbnail.setStyleSheet("background: #27272F;\n"
+"color: #E5E7EB;")
+        self.thumbnail.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.thumbnail.setObjectName("thumbnail")
+        self.thumbBottomFrame = QtWidgets.QFrame(parent=self.thumbnailFrame)
+        self.thumbBottomFrame.setGeometry(QtCore.QRect(0, 200, 300, 520))
+        self.thumbBottomFrame.setMinimumSize(QtCore.QSize(300, 520))
+        self.thumbBottomFrame.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.thumbBottomFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.thumbBottomFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.thumbBottomFrame.setObjectName("thumbBottomFrame")
+        self.typeFrame = QtWidgets.QFrame(parent=self.thumbBottomFrame)
+        self.typeFrame.setGeometry(QtCore.QRect(0, 0, 300, 80))
+        self.typeFrame.setMinimumSize(QtCore.QSize(300, 80))
+        self.typeFrame.setMaximumSize(QtCore.QSize(300, 80))
+        self.typeFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.typeFrame.setObjectName("typeFrame")
+        self.videoButton = QtWidgets.QPushButton(parent=self.typeFrame)
+        self.videoButton.setGeometry(QtCore.QRect(20, 20, 130, 40))
+        self.videoButton.setMinimumSize(QtCore.QSize(130, 40))
+        self.videoButton.setMaximumSize(QtCore.QSize(130, 40))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        self.videoButton.setFont(font)
+        self.videoButton.setStyleSheet("QPushButton {\n"
+"    color: #FF4D6D;\n"
+"    border: 2px solid #FF4D6D;\n"
+"    border-right: 1px solid #FF4D6D;\n"
+"    border-top-left-radius: 20px;\n"
+"    border-bottom-left-radius: 20px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #FF4D6D;\n"
+"    color: #1A1A1F;\n"
+"}\n"
+"\n"
+"QPushButton[active=\"true\"] {\n"
+"    background: #FF4D6D;\n"
+"    color: #1A1A1F;\n"
+"}")
+        self.videoButton.setObjectName("videoButton")
+        self.audioButton = QtWidgets.QPushButton(parent=self.typeFrame)
+        self.audioButton.setGeometry(QtCore.QRect(150, 20, 130, 40))
+        self.audioButton.setMinimumSize(QtCore.QSize(130, 40))
+        self.audioButton.setMaximumSize(QtCore.QSize(130, 40))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        self.audioButton.setFont(font)
+        self.audioButton.setStyleSheet("QPushButton {\n"
+"    color: #FF4D6D;\n"
+"    border: 2px solid #FF4D6D;\n"
+"    border-left: 1px solid #FF4D6D;\n"
+"    border-top-right-radius: 20px;\n"
+"    border-bottom-right-radius: 20px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #FF4D6D;\n"
+"    color: #1A1A1F;\n"
+"}\n"
+"\n"
+"QPushButton[active=\"true\"] {\n"
+"    background: #FF4D6D;\n"
+"    color: #1A1A1F;\n"
+"}")
+        self.audioButton.setObjectName("audioButton")
+        self.qualityFrame = QtWidgets.QFrame(parent=self.thumbBottomFrame)
+        self.qualityFrame.setGeometry(QtCore.QRect(0, 80, 300, 380))
+        self.qualityFrame.setMinimumSize(QtCore.QSize(300, 380))
+        self.qualityFrame.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.qualityFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.qualityFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.qualityFrame.setObjectName("qualityFrame")
+        self.qualityList = QtWidgets.QListView(parent=self.qualityFrame)
+        self.qualityList.setGeometry(QtCore.QRect(20, 0, 260, 370))
+        self.qualityList.setMinimumSize(QtCore.QSize(260, 370))
+        self.qualityList.setMaximumSize(QtCore.QSize(260, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.qualityList.setFont(font)
+        self.qualityList.setStyleSheet("QListView {\n"
+"    background: #1A1A1F;\n"
+"    color: #E5E7EB;\n"
+"    outline: none;\n"
+"}\n"
+"\n"
+"QListView::item {\n"
+"    color: #E5E7EB;\n"
+"    padding: 8px 10px;\n"
+"    border-radius: 4px;\n"
+"    margin: 5px 5px;\n"
+"    border: 2px solid #27272F;\n"
+"}\n"
+"\n"
+"QListView::item:hover {\n"
+"    background: #27272F;\n"
+"}\n"
+"\n"
+"QListView::item:selected {\n"
+"    background: #FF4D6D;\n"
+"    color: #E5E7EB;\n"
+"    border: 2px solid #FF4D6D;\n"
+"}\n"
+"\n"
+"QScrollBar:vertical {\n"
+"    background: transparent;\n"
+"    width: 10px;\n"
+"    margin: 2px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical {\n"
+"    background: #27272F;\n"
+"    min-height: 30px;\n"
+"    border-radius: 5px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical:hover {\n"
+"    background: #27272F;\n"
+"}\n"
+"\n"
+"/* remove arrows (already done) */\n"
+"QScrollBar::add-line,\n"
+"QScrollBar::sub-line {\n"
+"    background: none;\n"
+"    height: 0px;\n"
+"}\n"
+"\n"
+"/* THIS FIXES THE WHITE PART */\n"
+"QScrollBar::add-page:vertical,\n"
+"QScrollBar::sub-page:vertical {\n"
+"    background: transparent;\n"
+"}\n"
+"")
+        self.qualityList.setObjectName("qualityList")
+        self.downloaFrame = QtWidgets.QFrame(parent=self.thumbBottomFrame)
+        self.downloaFrame.setGeometry(QtCore.QRect(0, 460, 300, 60))
+        self.downloaFrame.setMinimumSize(QtCore.QSize(300, 60))
+        self.downloaFrame.setMaximumSize(QtCore.QSize(300, 60))
+        self.downloaFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.downloaFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.downloaFrame.setObjectName("downloaFrame")
+        self.download = QtWidgets.QPushButton(parent=self.downloaFrame)
+        self.download.setGeometry(QtCore.QRect(20, 10, 260, 40))
+        self.download.setMinimumSize(QtCore.QSize(260, 40))
+        self.download.setMaximumSize(QtCore.QSize(260, 40))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        self.download.setFont(font)
+        self.download.setStyleSheet("QPushButton {\n"
+"    color: #FF4D6D;\n"
+"    border: 2px solid #FF4D6D;\n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #FF4D6D;\n"
+"    color: #1A1A1F;\n"
+"}")
+        self.download.setObjectName("download")
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.title1.setText(_translate("MainWindow", "CR"))
+        self.title2.setText(_translate("MainWindow", "Tube"))
+        self.iconifyButton.setText(_translate("MainWindow", ""))
+        self.closeButton.setText(_translate("MainWindow", ""))
+        self.settings.setText(_translate("MainWindow", ""))
+        self.downloads.setText(_translate("MainWindow", ""))
+        self.searchbar.setPlaceholderText(_translate("MainWindow", "Enter Url or Search YouTube"))
+        self.thumbnail.setText(_translate("MainWindow", ""))
+        self.videoButton.setText(_translate("MainWindow", "Video"))
+        self.audioButton.setText(_translate("MainWindow", "Audio"))
+        self.download.setText(_translate("MainWindow", "Download"))
@@ -0,0 +1,381 @@
+# Form implementation generated from reading ui file 'settingswindow.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SettingsWindow(object):
+    def setupUi(self, SettingsWindow):
+        SettingsWindow.setObjectName("SettingsWindow")
+        SettingsWindow.resize(500, 730)
+        SettingsWindow.setStyleSheet("background: #0F0F12;\n"
+"border: 0;")
+        self.centralwidget = QtWidgets.QWidget(parent=SettingsWindow)
+        self.centralwidget.setStyleSheet("background: #1A1A1F;")
+        self.centralwidget.setObjectName("centralwidget")
+        self.titleFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.titleFrame.setGeometry(QtCore.QRect(0, 0, 500, 30))
+        self.titleFrame.setMinimumSize(QtCore.QSize(500, 30))
+        self.titleFrame.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.titleFrame.setStyleSheet("background: #1A1A1F;")
+        self.titleFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.titleFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.titleFrame.setObjectName("titleFrame")
+        self.windowTitleLabel = QtWidgets.QLabel(parent=self.titleFrame)
+        self.windowTitleLabel.setGeometry(QtCore.QRect(10, 0, 200, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.windowTitleLabel.setFont(font)
+        self.windowTitleLabel.setStyleSheet("color: #E5E7EB;")
+        self.windowTitleLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.windowTitleLabel.setObjectName("windowTitleLabel")
+        self.closeButton = QtWidgets.QPushButton(parent=self.titleFrame)
+        self.closeButton.setGeometry(QtCore.QRect(470, 0, 30, 30))
+        self.closeButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.closeButton.setMaximumSize(QtCore.QSize(30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Font Awesome 7 Free")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.closeButton.setFont(font)
+        self.closeButton.setStyleSheet("QPushButton {\n"
+"    color: #E5E7EB;\n"
+"    border: 0;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #EF4444;\n"
+"}")
+        self.closeButton.setObjectName("closeButton")
+        self.mainFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.mainFrame.setGeometry(QtCore.QRect(0, 30, 500, 700))
+        self.mainFrame.setStyleSheet("background: #0F0F12;")
+        self.mainFrame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.mainFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.mainFrame.setObjectName("mainFrame")
+        self.pathLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.pathLabel.setGeometry(QtCore.QRect(20, 20, 460, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.pathLabel.setFont(font)
+        self.pathLabel.setStyleSheet("color: #E5E7EB;")
+        self.pathLabel.setObjectName("pathLabel")
+        self.pathEdit = QtWidgets.QLineEdit(parent=self.mainFrame)
+        self.pathEdit.setGeometry(QtCore.QRect(20, 50, 380, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.pathEdit.setFont(font)
+        self.pathEdit.setStyleSheet("QLineEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QLineEdit:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.pathEdit.setObjectName("pathEdit")
+        self.browseButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.browseButton.setGeometry(QtCore.QRect(410, 50, 70, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.browseButton.setFont(font)
+        self.browseButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }")
+        self.browseButton.setObjectName("browseButton")
+        self.workersLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.workersLabel.setGeometry(QtCore.QRect(20, 100, 340, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.workersLabel.setFont(font)
+        self.workersLabel.setStyleSheet("color: #E5E7EB;")
+        self.workersLabel.setObjectName("workersLabel")
+        self.workersSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.workersSpin.setGeometry(QtCore.QRect(380, 100, 100, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.workersSpin.setFont(font)
+        self.workersSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.workersSpin.setMinimum(1)
+        self.workersSpin.setMaximum(16)
+        self.workersSpin.setProperty("value", 3)
+        self.workersSpin.setObjectName("workersSpin")
+        self.connectionsLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.connectionsLabel.setGeometry(QtCore.QRect(20, 150, 340, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.connectionsLabel.setFont(font)
+        self.connectionsLabel.setStyleSheet("color: #E5E7EB;")
+        self.connectionsLabel.setObjectName("connectionsLabel")
+        self.connectionsSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.connectionsSpin.setGeometry(QtCore.QRect(380, 150, 100, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.connectionsSpin.setFont(font)
+        self.connectionsSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.connectionsSpin.setMinimum(1)
+        self.connectionsSpin.setMaximum(16)
+        self.connectionsSpin.setProperty("value", 4)
+        self.connectionsSpin.setObjectName("connectionsSpin")
+        self.bandwidthLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.bandwidthLabel.setGeometry(QtCore.QRect(20, 200, 340, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.bandwidthLabel.setFont(font)
+        self.bandwidthLabel.setStyleSheet("color: #E5E7EB;")
+        self.bandwidthLabel.setObjectName("bandwidthLabel")
+        self.bandwidthSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.bandwidthSpin.setGeometry(QtCore.QRect(380, 200, 100, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.bandwidthSpin.setFont(font)
+        self.bandwidthSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.bandwidthSpin.setMinimum(0)
+        self.bandwidthSpin.setMaximum(1000000)
+        self.bandwidthSpin.setSingleStep(100)
+        self.bandwidthSpin.setObjectName("bandwidthSpin")
+        self.scheduleEdit = QtWidgets.QLineEdit(parent=self.mainFrame)
+        self.scheduleEdit.setGeometry(QtCore.QRect(20, 250, 460, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.scheduleEdit.setFont(font)
+        self.scheduleEdit.setStyleSheet("QLineEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QLineEdit:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.scheduleEdit.setObjectName("scheduleEdit")
+        self.ppWorkersLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.ppWorkersLabel.setGeometry(QtCore.QRect(20, 300, 340, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.ppWorkersLabel.setFont(font)
+        self.ppWorkersLabel.setStyleSheet("color: #E5E7EB;")
+        self.ppWorkersLabel.setObjectName("ppWorkersLabel")
+        self.ppWorkersSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.ppWorkersSpin.setGeometry(QtCore.QRect(380, 300, 100, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.ppWorkersSpin.setFont(font)
+        self.ppWorkersSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.ppWorkersSpin.setMinimum(0)
+        self.ppWorkersSpin.setMaximum(32)
+        self.ppWorkersSpin.setProperty("value", 0)
+        self.ppWorkersSpin.setObjectName("ppWorkersSpin")
+        self.thumbCacheLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.thumbCacheLabel.setGeometry(QtCore.QRect(20, 350, 150, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.thumbCacheLabel.setFont(font)
+        self.thumbCacheLabel.setStyleSheet("color: #E5E7EB;")
+        self.thumbCacheLabel.setObjectName("thumbCacheLabel")
+        self.thumbCacheSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.thumbCacheSpin.setGeometry(QtCore.QRect(170, 350, 80, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.thumbCacheSpin.setFont(font)
+        self.thumbCacheSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.thumbCacheSpin.setMinimum(10)
+        self.thumbCacheSpin.setMaximum(10000)
+        self.thumbCacheSpin.setProperty("value", 100)
+        self.thumbCacheSpin.setSingleStep(10)
+        self.thumbCacheSpin.setObjectName("thumbCacheSpin")
+        self.infoCacheLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.infoCacheLabel.setGeometry(QtCore.QRect(270, 350, 130, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.infoCacheLabel.setFont(font)
+        self.infoCacheLabel.setStyleSheet("color: #E5E7EB;")
+        self.infoCacheLabel.setObjectName("infoCacheLabel")
+        self.infoCacheSpin = QtWidgets.QSpinBox(parent=self.mainFrame)
+        self.infoCacheSpin.setGeometry(QtCore.QRect(400, 350, 80, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.infoCacheSpin.setFont(font)
+        self.infoCacheSpin.setStyleSheet("QSpinBox {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QSpinBox:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.infoCacheSpin.setMinimum(1)
+        self.infoCacheSpin.setMaximum(10000)
+        self.infoCacheSpin.setProperty("value", 64)
+        self.infoCacheSpin.setSingleStep(8)
+        self.infoCacheSpin.setObjectName("infoCacheSpin")
+        self.scratchEdit = QtWidgets.QLineEdit(parent=self.mainFrame)
+        self.scratchEdit.setGeometry(QtCore.QRect(20, 400, 380, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.scratchEdit.setFont(font)
+        self.scratchEdit.setStyleSheet("QLineEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #E5E7EB;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"        padding: 0 5px;\n"
+"      }\n"
+"      QLineEdit:focus {\n"
+"        border: 1px solid #FF4D6D;\n"
+"      }")
+        self.scratchEdit.setObjectName("scratchEdit")
+        self.scratchBrowseButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.scratchBrowseButton.setGeometry(QtCore.QRect(410, 400, 70, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.scratchBrowseButton.setFont(font)
+        self.scratchBrowseButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }")
+        self.scratchBrowseButton.setObjectName("scratchBrowseButton")
+        self.updateLabel = QtWidgets.QLabel(parent=self.mainFrame)
+        self.updateLabel.setGeometry(QtCore.QRect(20, 450, 460, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.updateLabel.setFont(font)
+        self.updateLabel.setStyleSheet("color: #E5E7EB;")
+        self.updateLabel.setObjectName("updateLabel")
+        self.updateButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.updateButton.setGeometry(QtCore.QRect(20, 480, 460, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.updateButton.setFont(font)
+        self.updateButton.setStyleSheet("QPushButton {\n"
+"        background: #27272F;\n"
+"        color: #E5E7EB;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #3A3A45;\n"
+"      }")
+        self.updateButton.setObjectName("updateButton")
+        self.updateLog = QtWidgets.QTextEdit(parent=self.mainFrame)
+        self.updateLog.setGeometry(QtCore.QRect(20, 530, 460, 100))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(9)
+        self.updateLog.setFont(font)
+        self.updateLog.setStyleSheet("QTextEdit {\n"
+"        background: #1A1A1F;\n"
+"        color: #A0A0A0;\n"
+"        border: 1px solid #27272F;\n"
+"        border-radius: 5px;\n"
+"      }")
+        self.updateLog.setReadOnly(True)
+        self.updateLog.setObjectName("updateLog")
+        self.saveButton = QtWidgets.QPushButton(parent=self.mainFrame)
+        self.saveButton.setGeometry(QtCore.QRect(20, 645, 460, 40))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.saveButton.setFont(font)
+        self.saveButton.setStyleSheet("QPushButton {\n"
+"        background: #FF4D6D;\n"
+"        color: #1A1A1F;\n"
+"        border-radius: 5px;\n"
+"      }\n"
+"      QPushButton:hover {\n"
+"        background: #FF1F4B;\n"
+"      }")
+        self.saveButton.setObjectName("saveButton")
+        SettingsWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(SettingsWindow)
+        QtCore.QMetaObject.connectSlotsByName(SettingsWindow)
+
+    def retranslateUi(self, SettingsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        SettingsWindow.setWindowTitle(_translate("SettingsWindow", "Settings"))
+        self.windowTitleLabel.setText(_translate("SettingsWindow", "Settings"))
+        self.closeButton.setText(_translate("SettingsWindow", ""))
+        self.pathLabel.setText(_translate("SettingsWindow", "Default Download Path:"))
+        self.pathEdit.setPlaceholderText(_translate("SettingsWindow", "Select folder..."))
+        self.browseButton.setText(_translate("SettingsWindow", "Browse"))
+        self.workersLabel.setText(_translate("SettingsWindow", "Concurrent Downloads:"))
+        self.connectionsLabel.setText(_translate("SettingsWindow", "Connections per Download:"))
+        self.bandwidthLabel.setText(_translate("SettingsWindow", "Bandwidth Limit (KB/s, 0 = unlimited):"))
+        self.scheduleEdit.setPlaceholderText(_translate("SettingsWindow", "Schedule, e.g. 09:00-18:00=500, 22:00-07:00=0"))
+        self.ppWorkersLabel.setText(_translate("SettingsWindow", "Post-processing Workers (0 = one per core):"))
+        self.thumbCacheLabel.setText(_translate("SettingsWindow", "Thumbnail Cache (MB):"))
+        self.infoCacheLabel.setText(_translate("SettingsWindow", "Info Cache (MB):"))
+        self.scratchEdit.setPlaceholderText(_translate("SettingsWindow", "Scratch folder for caches (default: tmp)"))
+        self.scratchBrowseButton.setText(_translate("SettingsWindow", "Browse"))
+        self.updateLabel.setText(_translate("SettingsWindow", "Updater:"))
+        self.updateButton.setText(_translate("SettingsWindow", "Update yt-dlp"))
+        self.updateLog.setPlaceholderText(_translate("SettingsWindow", "Update logs will appear here..."))
+        self.saveButton.setText(_translate("SettingsWindow", "Save Settings"))
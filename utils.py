@@ -1,11 +1,66 @@
-import yt_dlp as yt
-from urllib.parse import urlparse
-import requests
+from urllib.parse import urlparse, parse_qs
+import importlib
+import importlib.util
 import os
+import re
+import copy
+import hashlib
+import threading
+import time
+from ydlpool import YDLPool
+from bandwidth import BandwidthManager
+from postpool import PostProcessPool
+from metrics import MetricsRegistry, MetricsLogger, PPTimer
+from settings import Settings, SCRATCH_PATH
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
-THUMB_PATH = os.path.join(os.getcwd(), 'tmp/thumbnails')
+THUMB_PATH = os.path.join(SCRATCH_PATH, 'thumbnails')
+THUMB_CACHE_BYTES = 100 * 1024 * 1024
 
-os.makedirs(THUMB_PATH, exist_ok=True)
+class LazyModule:
+    # Defers importing heavy libraries until an attribute is first used,
+    # so the window can show before yt_dlp and requests are loaded
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+yt = LazyModule('yt_dlp')
+requests = LazyModule('requests')
+rangedownload = LazyModule('rangedownload')
+
+INFO_OPTS = {
+    "quiet": True,
+    "skip_download": True,
+    "noplaylist": True,
+    "no_warnings": True
+}
+
+# Enough idle instances for concurrent playlist resolution to reuse them
+ydlPool = YDLPool(max_idle=4)
+
+# One rate cap shared by every download in the process
+bandwidthManager = BandwidthManager()
+THROTTLE_BLOCK_SIZE = 64 * 1024
+
+# Merges and audio conversion run here, one worker process per core
+postPool = PostProcessPool()
+
+# Per-phase download figures, exported when a path is configured
+metricsRegistry = MetricsRegistry()
+
+# config.json, read once; the GUI subscribes to changes
+settings = Settings()
+
+def preload():
+    # Called from a background thread once the window is up
+    yt.YoutubeDL
+    requests.Session
+    ydlPool.warm()
 
 def isValidURL(url):
     parsed = urlparse(url)
@@ -14,6 +69,43 @@ def isValidURL(url):
 def isValidYouTubeURL(url):
     return "youtube.com/watch" in url or "youtu.be/" in url
 
+CHANNEL_PREFIXES = ("@", "channel/", "c/", "user/")
+
+def isPlaylistURL(url):
+    parsed = urlparse(url)
+    if "youtube.com" not in parsed.netloc:
+        return False
+    path = parsed.path.strip("/")
+    return path == "playlist" or path.startswith(CHANNEL_PREFIXES)
+
+def playlistURL(url):
+    # A bare channel URL lists its tabs, not its uploads
+    parsed = urlparse(url)
+    path = parsed.path.strip("/")
+    if path.startswith(CHANNEL_PREFIXES):
+        parts = path.split("/")
+        # "@name" is one path segment, "channel/<id>" and friends are two
+        base = 1 if parts[0].startswith("@") else 2
+        if len(parts) <= base:
+            return parsed._replace(path=f"/{path}/videos").geturl()
+    return url
+
+def safeFilename(title):
+    # Strip characters Windows won't accept in a filename
+    return re.sub(r'[\\/*?:"<>|]', "", title or "")
+
+def videoId(url):
+    parsed = urlparse(url)
+    if parsed.netloc.endswith("youtu.be"):
+        return parsed.path.strip("/").split("/")[0] or None
+    if "youtube.com" in parsed.netloc:
+        if parsed.path == "/watch":
+            return parse_qs(parsed.query).get("v", [None])[0]
+        parts = parsed.path.strip("/").split("/")
+        if len(parts) >= 2 and parts[0] in ("shorts", "embed", "live"):
+            return parts[1]
+    return None
+
 def formatViews(views):
     if views is None:
         return "N/A Views"
@@ -35,166 +127,537 @@ def formatDuration(duration):
     seconds = duration % 60
     return f"Length: {minutes}:{seconds:02d}"
 
-def downloadThumbnail(url, filename):
+_session = None
+_sessionLock = threading.Lock()
+
+def httpSession():
+    # One keep-alive session for all thumbnail requests
+    global _session
+    with _sessionLock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+def thumbnailCachePath(url):
+    # Content-addressed by URL so the same thumbnail is only fetched once
+    ext = os.path.splitext(urlparse(url).path)[1] or '.jpg'
+    name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(THUMB_PATH, name + ext)
+
+def cachedThumbnail(url):
+    path = thumbnailCachePath(url)
+    if os.path.exists(path):
+        # Bump mtime so LRU eviction keeps recently used thumbnails
+        os.utime(path)
+        return path
+    return None
+
+def configureThumbnails(scratch_dir=None, max_bytes=None):
+    # Takes effect for the next thumbnail, the old folder is left as it is
+    global THUMB_PATH, THUMB_CACHE_BYTES
+    THUMB_PATH = os.path.join(scratch_dir or SCRATCH_PATH, 'thumbnails')
+    if max_bytes:
+        THUMB_CACHE_BYTES = max_bytes
+
+def evictThumbnails(max_bytes=None):
+    max_bytes = max_bytes or THUMB_CACHE_BYTES
+    if not os.path.isdir(THUMB_PATH):
+        return
+    entries = []
+    for entry in os.scandir(THUMB_PATH):
+        try:
+            # Other loader threads rename their .part files while we scan
+            if entry.is_file() and not entry.name.endswith('.part'):
+                entries.append((entry.stat(), entry.path))
+        except OSError:
+            pass
+    total = sum(stat.st_size for stat, _ in entries)
+    if total <= max_bytes:
+        return
+
+    for stat, path in sorted(entries, key=lambda e: e[0].st_mtime):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= stat.st_size
+        except OSError:
+            pass
+
+def formatBytes(size):
+    if size is None:
+        return "N/A"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+
+def formatEta(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+def downloadThumbnail(url):
+    path = cachedThumbnail(url)
+    if path:
+        return True, path
+
+    path = thumbnailCachePath(url)
     try:
-        response = requests.get(url, stream=True, timeout=10)
+        os.makedirs(THUMB_PATH, exist_ok=True)
+        response = httpSession().get(url, stream=True, timeout=10)
         response.raise_for_status()
 
-        with open(f'{THUMB_PATH}/{filename}', 'wb') as f:
-            for chunk in response.iter_content(1024):
+        # Write to a temp name so a half-written file is never served from the cache
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(64 * 1024):
                 f.write(chunk)
+        os.replace(tmp_path, path)
 
-        return True, f'{THUMB_PATH}/{filename}'
+        evictThumbnails()
+        return True, path
     except Exception as e:
         print("Failed to download thumbnail:", e)
         return False, None
 
-def search(query):
-    ydl_opts = {
-        "quiet": True,
-        "skip_download": True,
-        "noplaylist": True,
-        "no_warnings": True,
-        "extract_flat": True,
-        "force_generic_extractor": False,
-        "ignoreerrors": True
+SEARCH_PAGE_SIZE = 10 # one page overfills the results list so it can scroll
+MAX_SEARCH_RESULTS = 500
+
+SEARCH_OPTS = {
+    "quiet": True,
+    "skip_download": True,
+    "noplaylist": True,
+    "no_warnings": True,
+    "extract_flat": True,
+    "force_generic_extractor": False,
+    "ignoreerrors": True
+}
+
+ydlPool.register('search', SEARCH_OPTS, extractors=('YoutubeSearch',))
+ydlPool.register('info', INFO_OPTS, extractors=('Youtube',))
+
+def searchResult(entry):
+    return {
+        "title": entry.get("title"),
+        "channel": entry.get("channel"),
+        "views": entry.get("view_count"),
+        "duration": entry.get("duration"),
+        "url": entry.get("url"),
+        "thumbnail": (entry.get("thumbnails") or [{}])[-1].get("url")
     }
 
-    with yt.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(f"ytsearch5:{query}", download=False)
+class SearchSession:
+    # Keeps yt-dlp's lazy result generator alive so "load more" picks up
+    # where the previous page stopped instead of searching again
+    def __init__(self, query, page_size=SEARCH_PAGE_SIZE):
+        self.query = query
+        self.pageSize = page_size
+        self.count = 0
+        self.exhausted = False
+        self._ydl = None
+        self._entries = None
 
-    results = []
+    def _open(self):
+        self._ydl = ydlPool.acquire('search')
+        # process=False leaves "entries" as a generator that fetches continuation pages on demand
+        info = self._ydl.extract_info(f"ytsearch{MAX_SEARCH_RESULTS}:{self.query}", download=False, process=False)
+        self._entries = iter((info or {}).get("entries") or [])
 
-    for entry in info.get("entries", []):
-        if entry is None:
-            continue
+    def nextPage(self, size=None):
+        size = size or self.pageSize
+        if self.exhausted:
+            return
+        if self._entries is None:
+            self._open()
 
-        results.append({
-            "title": entry.get("title"),
-            "channel": entry.get("channel"),
-            "views": entry.get("view_count"),
-            "duration": entry.get("duration"),      
-            "url": entry.get("url")
-        })
+        yielded = 0
+        for entry in self._entries:
+            if entry is None:
+                continue
+            self.count += 1
+            yielded += 1
+            yield searchResult(entry)
+            if yielded >= size:
+                return
 
-    return results
+        self.exhausted = True
+        self.close()
 
-def getVideoInfo(url):
-    ydl_opts = {
-        "quiet": True,
-        "skip_download": True,
-        "noplaylist": True,
-        "no_warnings": True
-    }
+    def close(self):
+        if self._ydl is not None:
+            ydlPool.release('search', self._ydl)
+            self._ydl = None
 
-    with yt.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+def iterSearch(query, limit=SEARCH_PAGE_SIZE):
+    session = SearchSession(query, limit)
+    try:
+        yield from session.nextPage()
+    finally:
+        session.close()
 
-    # Basic info
-    title = info.get("title")
-    channel = info.get("uploader") or info.get("channel")
-    thumbnail = info.get("thumbnail")
-    views = info.get("view_count")
-    length = info.get("duration")  # in seconds
+def search(query, limit=SEARCH_PAGE_SIZE):
+    return list(iterSearch(query, limit))
 
-    qualities = []
-    seen_resolutions = {}
-    
-    for f in info.get("formats", []):
-        if f.get("vcodec") != "none" and f.get("ext") == "mp4":
-            res = f.get("format_note") or str(f.get("height"))
-            filesize = f.get("filesize") or f.get("filesize_approx")
-    
-            # Skip if filesize is not available
-            if not filesize:
-                continue
-            
-            # Only keep the largest filesize for each resolution
-            if res not in seen_resolutions or filesize > seen_resolutions[res]['filesize']:
-                seen_resolutions[res] = {
-                    "format_id": f.get("format_id"),
-                    "ext": f.get("ext"),
-                    "resolution": res,
-                    "filesize": filesize
-                }
-    
-    # Convert dict to list and optionally sort by resolution descending
-    qualities = sorted(seen_resolutions.values(), key=lambda x: int(''.join(filter(str.isdigit, str(x['resolution'])))), reverse=True)
+INFO_SCHEMA = 3 # bump when the getVideoInfo result changes shape, older cache entries are re-fetched
+
+def estimateSize(f, duration):
+    # (bytes, estimated); tbr/vbr/abr are kbit/s
+    size = f.get("filesize")
+    if size:
+        return size, False
+    size = f.get("filesize_approx")
+    if size:
+        return size, True
+    rate = f.get("tbr") or (f.get("vbr") or 0) + (f.get("abr") or 0)
+    if rate and duration:
+        return int(rate * 1000 / 8 * duration), True
+    return None, True
 
-    # Get best audio quality
+def buildFormatTable(raw_formats, duration=None):
+    # One pass over yt-dlp's formats. Returns (table, qualities, best_audio):
+    # a compact row for every downloadable format of any container/codec,
+    # the best video format per resolution (best first) and the best audio.
+    table = []
+    by_resolution = {}
     best_audio = None
-    audio_formats = [f for f in info.get("formats", []) if f.get("acodec") != "none" and f.get("vcodec") == "none"]
-    if audio_formats:
-        best_audio = max(audio_formats, key=lambda x: x.get("abr", 0))
-        best_audio = {
-            "format_id": best_audio.get("format_id"),
-            "ext": best_audio.get("ext"),
-            "abr": best_audio.get("abr"),  # kbps
-            "filesize": best_audio.get("filesize") or best_audio.get("filesize_approx")
+    for f in raw_formats:
+        # None means unknown, "none" means the stream isn't there
+        vcodec = f.get("vcodec")
+        acodec = f.get("acodec")
+        if (vcodec == "none" and acodec == "none") or f.get("protocol") == "mhtml":
+            continue # storyboards and the like
+        size, estimated = estimateSize(f, duration)
+        row = {
+            "format_id": f.get("format_id"),
+            "ext": f.get("ext"),
+            "vcodec": (vcodec or "").split(".")[0],
+            "acodec": (acodec or "").split(".")[0],
+            "height": f.get("height"),
+            "fps": f.get("fps"),
+            "tbr": f.get("tbr"),
+            "abr": f.get("abr"),
+            "filesize": size,
+            "estimated": estimated
         }
+        table.append(row)
 
-    return {
-        "title": title,
-        "channel": channel,
-        "thumbnail": thumbnail,
-        "views": views,
+        if vcodec != "none" and row["height"]:
+            res = f.get("format_note") or f"{row['height']}p"
+            direct = f.get("protocol") in ("http", "https")
+            # Video-only streams first: they get the best audio merged in, a muxed
+            # format (e.g. "18") would end up with two audio tracks
+            video_only = acodec == "none"
+            rank = (video_only, row["height"], row["fps"] or 0, direct, size or 0)
+            current = by_resolution.get(res)
+            # Largest file (highest bitrate) per resolution, whatever the container;
+            # HLS variants are muxed, so their estimate includes an audio track
+            if current is None or rank > current[0]:
+                by_resolution[res] = (rank, dict(row, resolution=res))
+        elif vcodec == "none" and acodec != "none" and (best_audio is None or (row["abr"] or 0) > (best_audio["abr"] or 0)):
+            best_audio = row
+
+    # Listed by height and fps, whether or not the pick per resolution is muxed
+    qualities = [q for _, q in sorted(by_resolution.values(), key=lambda item: item[0][1:], reverse=True)]
+    return table, qualities, best_audio
+
+def getVideoInfo(url, cache=None):
+    started = time.perf_counter()
+    video_id = videoId(url)
+    if cache is not None and video_id:
+        cached, streams_valid = cache.get(video_id)
+        if cached and cached.get("schema") == INFO_SCHEMA:
+            if not streams_valid:
+                # Static fields are still good, the download re-resolves the stream URLs
+                cached["raw_info"] = None
+            cached["url"] = url
+            metricsRegistry.observe('crtube_extract_seconds', time.perf_counter() - started, source='cache')
+            return cached
+
+    with ydlPool.checkout('info') as ydl:
+        info = ydl.extract_info(url, download=False)
+    metricsRegistry.observe('crtube_extract_seconds', time.perf_counter() - started, source='network')
+
+    length = info.get("duration")  # in seconds
+    formats, qualities, best_audio = buildFormatTable(info.get("formats", []), length)
+
+    result = {
+        "schema": INFO_SCHEMA,
+        "title": info.get("title"),
+        "channel": info.get("uploader") or info.get("channel"),
+        "thumbnail": info.get("thumbnail"),
+        "views": info.get("view_count"),
         "length": length,
+        "formats": formats,
         "video_qualities": qualities,
         "best_audio": best_audio,
-        "url": url
+        "url": url,
+        # Kept so the download can skip a second extraction
+        "raw_info": yt.YoutubeDL.sanitize_info(info, remove_private_keys=True)
     }
 
+    if cache is not None and (info.get("id") or video_id):
+        cache.put(info.get("id") or video_id, result)
+
+    return result
+
     
     
-def downloadVideo(url, options, progress_hook, logger, is_audio=False, custom_filename=None, custom_path=None):
+PLAYLIST_OPTS = {
+    "quiet": True,
+    "skip_download": True,
+    "no_warnings": True,
+    "extract_flat": "in_playlist",
+    "ignoreerrors": True
+}
+
+PLAYLIST_WORKERS = 4
+
+ydlPool.register('playlist', PLAYLIST_OPTS, extractors=('YoutubeTab',))
+
+def getPlaylistEntries(url):
+    # Flat listing only: one request per page of entries, no per-video extraction
+    with ydlPool.checkout('playlist') as ydl:
+        info = ydl.extract_info(playlistURL(url), download=False) or {}
+
+    entries = [searchResult(e) for e in info.get("entries") or [] if e and e.get("url")]
+    return {
+        "title": info.get("title") or "Playlist",
+        "channel": info.get("uploader") or info.get("channel"),
+        "url": url,
+        "entries": entries
+    }
+
+def pickQuality(qualities, max_height=None):
+    # qualities come sorted best first from getVideoInfo
+    if not qualities:
+        return {}
+    if max_height is None:
+        return qualities[0]
+    for q in qualities:
+        if q.get('height') and q['height'] <= max_height:
+            return q
+    return qualities[-1]
+
+def chooseOptions(info, is_audio=False, policy=None):
+    # One quality policy applied to every entry of a batch: the highest
+    # video height, or for audio the audio format (None keeps the original stream)
+    if is_audio:
+        audio = info.get("best_audio") or {}
+        return dict(audio, audio_format=policy) if policy else audio
+    return pickQuality(info.get("video_qualities"), policy)
+
+def resolveEntries(urls, workers=PLAYLIST_WORKERS, cache=None, cancelled=None):
+    # Yields (index, info, error) as each getVideoInfo finishes, at most
+    # `workers` extractions in flight at once
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {}
+        urls = iter(enumerate(urls))
+
+        def submitNext():
+            for index, url in urls:
+                pending[pool.submit(getVideoInfo, url, cache)] = index
+                return
+
+        for _ in range(max(1, workers)):
+            submitNext()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    yield index, future.result(), None
+                except Exception as e:
+                    yield index, None, str(e)
+                if not (cancelled and cancelled()):
+                    submitNext()
+
+def outputTemplate(custom_filename=None, custom_path=None):
     # Construct outtmpl based on custom inputs or default
     if custom_filename and custom_path:
         # Ensure path ends with slash or use os.path.join logic (handled by forward slash in string for yt-dlp)
-        out_template = f"{custom_path}/{custom_filename}.%(ext)s"
-    else:
-        out_template = '%(title)s.%(ext)s'
+        return f"{custom_path}/{custom_filename}.%(ext)s"
+    return '%(title)s.%(ext)s'
+
+# Audio codec (as in the format table) -> container it is saved in without re-encoding
+AUDIO_CONTAINERS = {'opus': 'opus', 'mp4a': 'm4a', 'aac': 'm4a', 'vorbis': 'ogg', 'mp3': 'mp3', 'flac': 'flac'}
+MUTAGEN_COVER_EXTS = ('opus', 'ogg', 'flac') # yt-dlp embeds cover art in these only through mutagen
+
+def audioExtension(options):
+    # What an audio download ends up as: mp3 when asked for, else the stream's own container
+    if options.get('audio_format') == 'mp3':
+        return 'mp3'
+    acodec = options.get('acodec')
+    if acodec in AUDIO_CONTAINERS:
+        return AUDIO_CONTAINERS[acodec]
+    return 'm4a' if options.get('ext') == 'm4a' else 'opus'
+
+def canEmbedCover(audio_ext):
+    return audio_ext not in MUTAGEN_COVER_EXTS or importlib.util.find_spec('mutagen') is not None
+
+def downloadVideo(url, options, progress_hook, logger, is_audio=False, custom_filename=None, custom_path=None, info=None, throttle=None, connections=1, deferred=None, metrics=None, archive=None, control=None):
+    # With a deferred list the FFmpeg steps are appended to it for postPool.run
+    # and the returned path is the downloaded file before post-processing.
+    # metrics (a DownloadMetrics) collects extract/transfer/post-processing times.
+    # control (a JobControl) stops the transfer from another thread.
+    if archive is not None:
+        # Before any network work: a video we already have is done straight away
+        entry = archive.find(videoId(url), is_audio, options.get('format_id'), options.get('audio_format'))
+        if entry:
+            logger.info(f"Already downloaded: {entry['path']}")
+            return True, entry['path']
+
+    out_template = outputTemplate(custom_filename, custom_path)
+
+    # A stopped job raises before the throttle gets to sleep on its chunk
+    hooks = [control.hook] if control is not None else []
+    # The throttle sleeps inside the hook, so it has to see every chunk. With
+    # nothing capped it stays out of the way; a cap set later applies from the next job.
+    limited = throttle is not None and throttle.manager.limited()
+    if limited:
+        hooks.append(throttle.hook)
+    timer = PPTimer()
+    if metrics is not None:
+        hooks.append(metrics.hook)
+        logger = MetricsLogger(logger, metrics)
+    hooks.append(progress_hook)
 
     ydl_opts = {
         'logger': logger,
-        'progress_hooks': [progress_hook],
+        'progress_hooks': hooks,
+        'postprocessor_hooks': [timer.hook],
         'outtmpl': out_template,
         'noplaylist': True,
+        # Pick up existing .part files, e.g. for jobs resumed from the journal
+        'continuedl': True,
+        # Byte ranges (plain HTTPS formats) or fragments (DASH/HLS) over several connections
+        'parallel_connections': connections,
+        'concurrent_fragment_downloads': connections,
     }
 
+    if deferred is not None:
+        ydl_opts['defer_postprocessing'] = deferred
+
+    if limited:
+        # yt-dlp grows its read size up to 4 MB on a fast link, which would
+        # make the throttle's sleeps very lumpy at low rates
+        ydl_opts.update({'buffersize': THROTTLE_BLOCK_SIZE, 'noresizebuffer': True})
+
+    audio_ext = audioExtension(options)
+    embed_cover = is_audio and canEmbedCover(audio_ext)
     if is_audio:
-        ydl_opts.update({
-            'format': options.get('format_id', 'bestaudio/best'),
-            'postprocessors': [{
+        if audio_ext == 'mp3':
+            postprocessors = [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': 'mp3',
                 'preferredquality': '192',
+            }]
+        else:
+            # Stream copy into the codec's own container (webm -> opus, m4a stays), no decoding
+            postprocessors = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'best',
             }, {
-                'key': 'EmbedThumbnail',
-            }],
-            'writethumbnail': True, 
+                'key': 'FFmpegMetadata',
+                'add_metadata': True,
+                'add_chapters': False,
+            }]
+        if embed_cover:
+            postprocessors.append({'key': 'EmbedThumbnail'})
+        else:
+            logger.warning(f"Cover art for .{audio_ext} files needs mutagen (pip install mutagen), saving without it")
+        ydl_opts.update({
+            'format': options.get('format_id', 'bestaudio/best'),
+            'postprocessors': postprocessors,
+            'writethumbnail': embed_cover,
+            # Keep the copy CachedThumbnailPP puts in place instead of re-downloading it
+            'overwrites': False,
         })
     else:
         # Video
         fmt = options.get('format_id')
-        if fmt:
+        if fmt and options.get('acodec') not in (None, '', 'none'):
+            # Muxed format (only one offered at this resolution): it has its audio already
+            ydl_opts['format'] = fmt
+        elif fmt:
             ydl_opts['format'] = f"{fmt}+bestaudio"
         else:
             ydl_opts['format'] = 'bestvideo+bestaudio'
         
         ydl_opts['merge_output_format'] = 'mp4'
+        # Fetch the video and audio streams at the same time, merge when both are done
+        ydl_opts['parallel_streams'] = True
 
+    started = time.perf_counter()
+    extracted = 0.0
     try:
-        with yt.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-            info = ydl.extract_info(url, download=False) # Get filename info
-            filename = ydl.prepare_filename(info)
-            if is_audio:
-                 # Extension changes to mp3 after postprocessing
-                 filename = filename.rsplit('.', 1)[0] + '.mp3'
-            
+        with rangedownload.RangedYoutubeDL(ydl_opts) as ydl:
+            if embed_cover:
+                from postprocessors import CachedThumbnailPP
+                ydl.add_post_processor(CachedThumbnailPP(ydl), when='video')
+            result = None
+            if info:
+                # Reuse the dict from getVideoInfo instead of extracting again
+                try:
+                    result = ydl.process_ie_result(copy.deepcopy(info), download=True)
+                except yt.utils.DownloadError as e:
+                    # Stream URLs may have expired since the info was fetched
+                    logger.warning(f"Cached info failed ({e}), extracting again")
+            if result is None:
+                # Extract on a warm pooled instance, this one only downloads
+                extract_started = time.perf_counter()
+                with ydlPool.checkout('info') as info_ydl:
+                    fresh = info_ydl.sanitize_info(info_ydl.extract_info(url, download=False), remove_private_keys=True)
+                extracted = time.perf_counter() - extract_started
+                if control is not None:
+                    # Extraction calls no hooks, catch a stop requested meanwhile
+                    control.check()
+                result = ydl.process_ie_result(fresh, download=True)
+            filename = finalFilepath(ydl, result, audio_ext if is_audio else None)
+
         return True, filename
     except Exception as e:
         return False, str(e)
+    finally:
+        if metrics is not None:
+            # The rest is transfer, minus post-processors that ran in place
+            inline = sum(seconds for _, seconds in timer.timings)
+            metrics.add('extract', extracted)
+            metrics.add('transfer', time.perf_counter() - started - extracted - inline)
+            metrics.addPostProcessing(timer.timings)
+
+def archiveDownload(archive, url, options, is_audio, path):
+    # Called with the final path, after post-processing. Hashes the file.
+    try:
+        archive.record(videoId(url), is_audio, options.get('format_id'), path, options.get('audio_format') if is_audio else None)
+    except Exception as e:
+        # The download itself succeeded, only the index is missing it
+        print("Failed to archive download:", e)
+
+def archiveTitles(cache):
+    # Filename (as the GUI names downloads) -> video id, for archive.scan
+    return {safeFilename(title): video_id for video_id, title in cache.titles().items() if title}
+
+def finalFilepath(ydl, result, audio_ext=None):
+    # requested_downloads carries the path after post-processing (merge / audio)
+    downloads = result.get("requested_downloads") or []
+    if downloads and downloads[-1].get("filepath"):
+        return downloads[-1]["filepath"]
+
+    filename = ydl.prepare_filename(result)
+    if audio_ext:
+        # Extension changes after postprocessing
+        filename = filename.rsplit('.', 1)[0] + '.' + audio_ext
+    return filename
 
 if __name__ == "__main__":
     results = search("Running Up That Hill")
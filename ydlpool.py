@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+import threading
+import importlib
+
+class YDLPool:
+    # Long-lived YoutubeDL instances per option profile. Building one
+    # re-initialises extractors, cookies and the HTTP opener and drops the
+    # player JS / signature caches, so we hand out warm ones instead.
+    # An instance is only ever used by one thread at a time.
+    def __init__(self, max_idle=2):
+        self.maxIdle = max_idle
+        self.profiles = {}
+        self.created = 0
+        self.reused = 0
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def register(self, profile, options, extractors=()):
+        self.profiles[profile] = (dict(options), tuple(extractors))
+        self._idle.setdefault(profile, [])
+
+    def _create(self, profile):
+        yt = importlib.import_module('yt_dlp')
+        options, extractors = self.profiles[profile]
+        ydl = yt.YoutubeDL(dict(options))
+        for key in extractors:
+            # Instantiate the extractors this profile uses up front
+            ydl.get_info_extractor(key)
+        with self._lock:
+            self.created += 1
+        return ydl
+
+    def acquire(self, profile):
+        with self._lock:
+            idle = self._idle[profile]
+            if idle:
+                self.reused += 1
+                return idle.pop()
+        return self._create(profile)
+
+    def release(self, profile, ydl):
+        with self._lock:
+            idle = self._idle[profile]
+            if len(idle) < self.maxIdle:
+                idle.append(ydl)
+                return
+        ydl.close()
+
+    def discard(self, ydl):
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def checkout(self, profile):
+        ydl = self.acquire(profile)
+        try:
+            yield ydl
+        except BaseException:
+            # Don't hand a possibly half-broken instance to the next caller
+            self.discard(ydl)
+            raise
+        else:
+            self.release(profile, ydl)
+
+    def warm(self, profiles=None):
+        # Meant for a background thread at startup
+        for profile in profiles or list(self.profiles):
+            with self._lock:
+                if self._idle[profile]:
+                    continue
+            self.release(profile, self._create(profile))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": {profile: len(idle) for profile, idle in self._idle.items()}
+            }
+
+    def close(self):
+        with self._lock:
+            idle = [ydl for instances in self._idle.values() for ydl in instances]
+            for instances in self._idle.values():
+                instances.clear()
+        for ydl in idle:
+            self.discard(ydl)